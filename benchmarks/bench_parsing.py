@@ -0,0 +1,77 @@
+"""Benchmark parsing a page of GitHub commits for the log.
+
+Compares validating activities and building records from them, which the log
+did first, with building the records straight from the API's dicts. Reports
+the best time to parse one page each way, to damp machine noise.
+
+Usage: python benchmarks/bench_parsing.py [--rows 500] [--repeat 100]
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+from giteagle.core.models import Repository
+from giteagle.core.records import CommitRecord
+from giteagle.integrations.github import GitHubClient
+
+
+def make_commits(rows: int) -> list[dict]:
+    """Create a page of commits as returned by the GitHub API."""
+    return [
+        {
+            "sha": f"{i:040x}",
+            "commit": {
+                "message": f"Fix issue {i}\n\nLonger description of the change.",
+                "author": {
+                    "name": f"User {i % 25}",
+                    "email": f"user{i % 25}@example.com",
+                    "date": "2024-01-15T10:30:00Z",
+                },
+            },
+            "author": {
+                "login": f"user{i % 25}",
+                "avatar_url": f"https://avatars.githubusercontent.com/u/{i % 25}",
+            },
+            "html_url": f"https://github.com/octo/repo/commit/{i:040x}",
+            "parents": [{"sha": f"{i + 1:040x}"}],
+        }
+        for i in range(rows)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500, help="Commits per page")
+    parser.add_argument("--repeat", type=int, default=100, help="Pages parsed")
+    args = parser.parse_args()
+
+    repository = Repository(
+        name="repo", owner="octo", platform="github", url="https://github.com/octo/repo"
+    )
+    commits = make_commits(args.rows)
+    client = GitHubClient()
+
+    def via_activities() -> list[CommitRecord]:
+        return [CommitRecord.from_activity(c) for c in client._parse_commits(repository, commits)]
+
+    def direct() -> list[CommitRecord]:
+        return client._parse_commit_records(repository, commits)
+
+    def best_time(parse: Callable[[], Any]) -> float:
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            parse()
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    validated = best_time(via_activities)
+    fast = best_time(direct)
+    print(f"{'activities -> records':<22} {validated * 1000:8.2f} ms per {args.rows}-commit page")
+    print(f"{'records from dicts':<22} {fast * 1000:8.2f} ms per {args.rows}-commit page")
+    print(f"{'speedup':<22} {validated / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
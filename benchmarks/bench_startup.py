@@ -0,0 +1,105 @@
+"""Benchmark CLI startup with ``python -X importtime`` against a time budget.
+
+Runs each command in a fresh interpreter, sums the import time spent from the
+moment giteagle is imported until the command exits, and keeps each command's
+best run. Exits with status 1 if any command is over its budget or imports
+numpy, so the script can guard startup in CI; ``--scale`` loosens the budgets
+on slow machines.
+
+Usage: python benchmarks/bench_startup.py [--repeat 5] [--scale 1.0]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+# Import budget in milliseconds per command line. Loading httpx, the activity
+# models or the renderers eagerly again adds well over 100 ms and breaks these.
+BUDGETS_MS = {
+    "--version": 100.0,
+    "--help": 100.0,
+    "config": 350.0,
+    # A fetch command, run against an invalid repository so nothing is fetched
+    "log not-a-repo": 900.0,
+}
+
+# Modules no command may import at startup; numpy alone adds 100 ms or more and is
+# imported on the first histogram or table instead
+FORBIDDEN = ("numpy",)
+
+_MARKER = "-- giteagle startup --"
+
+_DRIVER = f"""
+import sys
+sys.stderr.write({_MARKER!r} + "\\n")
+sys.argv = ["giteagle", *sys.argv[1:]]
+from giteagle.cli.main import cli
+cli()
+"""
+
+
+def import_time_us(args: list[str], env: dict[str, str]) -> tuple[int, list[str], list[str]]:
+    """Return the import time of one CLI run in microseconds, its slowest and forbidden imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _DRIVER, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    lines = result.stderr.splitlines()
+    if _MARKER not in lines:
+        raise RuntimeError(f"giteagle {' '.join(args)} failed:\n{result.stderr}")
+
+    total = 0
+    top_level: list[tuple[int, str]] = []
+    forbidden: list[str] = []
+    for line in lines[lines.index(_MARKER) + 1 :]:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        if name.strip() in FORBIDDEN:
+            forbidden.append(name.strip())
+        # Nested imports are indented under their importer and already counted
+        if name.startswith("  "):
+            continue
+        total += int(cumulative)
+        top_level.append((int(cumulative), name.strip()))
+    slowest = [f"{name} {us / 1000:.1f} ms" for us, name in sorted(top_level, reverse=True)[:3]]
+    return total, slowest, forbidden
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for the budgets")
+    args = parser.parse_args()
+
+    over_budget = False
+    with tempfile.TemporaryDirectory() as home:
+        # Start from defaults, without reading the user's config file
+        env = {**os.environ, "GITEAGLE_CONFIG": os.path.join(home, "config.yaml")}
+        # Requests fail at once instead of reaching GitHub
+        env["HTTPS_PROXY"] = "http://127.0.0.1:9"
+        for command, budget_ms in BUDGETS_MS.items():
+            runs = [import_time_us(command.split(), env) for _ in range(args.repeat)]
+            best_us, slowest, forbidden = min(runs)
+            budget_ms *= args.scale
+            status = "ok" if best_us / 1000 <= budget_ms else "OVER BUDGET"
+            if forbidden:
+                status = f"IMPORTS {', '.join(forbidden)}"
+            over_budget |= status != "ok"
+            print(
+                f"giteagle {command:<14} {best_us / 1000:6.1f} ms "
+                f"(budget {budget_ms:.0f} ms) {status}; slowest: {', '.join(slowest)}"
+            )
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
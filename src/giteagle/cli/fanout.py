@@ -0,0 +1,65 @@
+"""Concurrent per-repository fetch stage shared by multi-repo commands."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from dataclasses import dataclass
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class RepoResult(Generic[T]):
+    """Outcome of fetching a single repository."""
+
+    repo_name: str
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the fetch succeeded."""
+        return self.error is None
+
+
+def split_repo_names(repos: Iterable[str]) -> tuple[list[str], list[str]]:
+    """Split repo arguments into valid owner/name entries and invalid ones."""
+    valid: list[str] = []
+    invalid: list[str] = []
+    for repo_name in repos:
+        if "/" in repo_name:
+            valid.append(repo_name)
+        else:
+            invalid.append(repo_name)
+    return valid, invalid
+
+
+async def fetch_repos(
+    repo_names: Iterable[str],
+    fetch: Callable[[str, str], Awaitable[T]],
+    *,
+    max_concurrency: int,
+    on_error: Callable[[str, Exception], None] | None = None,
+) -> list[RepoResult[T]]:
+    """Run ``fetch(owner, name)`` for each repository concurrently.
+
+    At most ``max_concurrency`` repositories are in flight at once. A failing
+    repository is recorded in its result (and passed to ``on_error``) without
+    cancelling the others. Results are returned in input order.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(repo_name: str) -> RepoResult[T]:
+        owner, name = repo_name.split("/", 1)
+        async with semaphore:
+            try:
+                value = await fetch(owner, name)
+            except Exception as e:
+                if on_error is not None:
+                    on_error(repo_name, e)
+                return RepoResult(repo_name, error=e)
+        return RepoResult(repo_name, value=value)
+
+    return list(await asyncio.gather(*(run(repo_name) for repo_name in repo_names)))
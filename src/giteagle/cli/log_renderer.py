@@ -6,7 +6,7 @@ from itertools import groupby
 
 from rich.console import Console
 
-from giteagle.core.models import Activity
+from giteagle.core.records import CommitRecord
 
 REPO_COLORS: list[str] = [
     "cyan",
@@ -44,13 +44,13 @@ def get_display_names(repo_full_names: list[str]) -> dict[str, str]:
     return display
 
 
-def group_by_date(activities: list[Activity]) -> list[tuple[str, list[Activity]]]:
+def group_by_date(activities: list[CommitRecord]) -> list[tuple[str, list[CommitRecord]]]:
     """Group activities by date string, preserving order."""
 
-    def date_key(a: Activity) -> str:
+    def date_key(a: CommitRecord) -> str:
         return a.timestamp.strftime("%Y-%m-%d")
 
-    groups: list[tuple[str, list[Activity]]] = []
+    groups: list[tuple[str, list[CommitRecord]]] = []
     for key, group in groupby(activities, key=date_key):
         groups.append((key, list(group)))
     return groups
@@ -58,7 +58,7 @@ def group_by_date(activities: list[Activity]) -> list[tuple[str, list[Activity]]
 
 def render_log(
     console: Console,
-    activities: list[Activity],
+    activities: list[CommitRecord],
     repo_colors: dict[str, str],
     display_names: dict[str, str],
 ) -> None:
@@ -72,11 +72,10 @@ def render_log(
 
     for _group_idx, (date_str, day_activities) in enumerate(groups):
         for commit_idx, activity in enumerate(day_activities):
-            repo_name = activity.repository.full_name
+            repo_name = activity.repository
             color = repo_colors.get(repo_name, "white")
             label = display_names.get(repo_name, repo_name)
-            sha = activity.metadata.get("sha", "???????")[:7]
-            parents = activity.metadata.get("parents", [])
+            sha = activity.sha[:7]
             message = activity.title
 
             if commit_idx == 0:
@@ -87,7 +86,7 @@ def render_log(
                 date_display = " " * 10
 
             merge_marker = ""
-            if len(parents) > 1:
+            if activity.is_merge:
                 merge_marker = " [dim](merge)[/dim]"
 
             line = (
@@ -2,36 +2,239 @@
 
 from __future__ import annotations
 
-import asyncio
-from collections.abc import Coroutine
+import functools
+from collections.abc import Awaitable, Coroutine
 from datetime import datetime, timedelta, timezone
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 import click
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from giteagle import __version__
-from giteagle.cli.log_renderer import assign_repo_colors, get_display_names, render_log
-from giteagle.cli.prs_renderer import build_pr_infos, render_prs
-from giteagle.cli.standup_renderer import build_standup_data, compute_standup_since, render_standup
-from giteagle.cli.stats_renderer import build_pr_metrics, compute_repo_stats, render_stats
-from giteagle.config import load_config
-from giteagle.core import ActivityAggregator, ActivityType
-from giteagle.integrations import GitHubClient
 
-console = Console()
+# Commands import rich, httpx, the models and the renderers when they run, so
+# `giteagle --version` loads none of them and `giteagle config` only rich.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from giteagle.config import GiteagleConfig
+    from giteagle.core import (
+        Activity,
+        ActivityAggregator,
+        ActivityRecord,
+        ActivityStore,
+        CommitRecord,
+        Repository,
+    )
+    from giteagle.integrations import GitHubClient, ResponseCache
 
 T = TypeVar("T")
 
 
+@functools.cache
+def get_console() -> Console:
+    """Return the shared console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
 def run_async(coro: Coroutine[Any, Any, T]) -> T:
     """Run an async function in the event loop."""
+    import asyncio
+
     return asyncio.run(coro)
 
 
+def open_response_cache(config: GiteagleConfig) -> ResponseCache:
+    """Open the on-disk response cache."""
+    from giteagle.config import get_cache_dir
+    from giteagle.integrations import ResponseCache
+
+    return ResponseCache.in_directory(
+        get_cache_dir(),
+        ttl=config.cache_ttl,
+        max_size_bytes=config.cache_max_size_mb * 1024 * 1024,
+    )
+
+
+def github_client(config: GiteagleConfig) -> GitHubClient:
+    """Create a GitHub client configured from the loaded settings."""
+    import sqlite3
+
+    from giteagle.integrations import GitHubClient
+    from giteagle.integrations.decoding import load_decoder
+
+    tokens = config.github.all_tokens()
+
+    cache: ResponseCache | None = None
+    if config.cache_ttl > 0 and config.cache_max_size_mb > 0:
+        try:
+            cache = open_response_cache(config)
+        except (OSError, sqlite3.Error) as e:
+            get_console().print(f"[yellow]Warning:[/yellow] Response cache disabled: {e}")
+
+    json_decoder = config.json_decoder
+    try:
+        load_decoder(json_decoder)
+    except ImportError:
+        get_console().print(
+            f"[yellow]Warning:[/yellow] JSON decoder {json_decoder} is not installed, "
+            "using the fastest available"
+        )
+        json_decoder = "auto"
+
+    http2 = config.http2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            get_console().print(
+                "[yellow]Warning:[/yellow] HTTP/2 needs the h2 package "
+                "(pip install giteagle[http2]), using HTTP/1.1"
+            )
+            http2 = False
+
+    client = GitHubClient(
+        tokens=tokens,
+        max_concurrent_requests=config.max_concurrent_requests,
+        cache=cache,
+        max_rate_limit_wait=config.max_rate_limit_wait,
+        json_decoder=json_decoder,
+        http2=http2,
+        max_connections=config.max_connections,
+        keepalive_expiry=config.keepalive_expiry,
+        on_rate_limit_pause=_announce_rate_limit_pause,
+    )
+    # Report how a token pool shared the load once the command is done
+    ctx = click.get_current_context(silent=True)
+    if len(tokens) > 1 and ctx is not None:
+        ctx.call_on_close(functools.partial(report_token_usage, client))
+    return client
+
+
+def _announce_rate_limit_pause(resource: str, delay: float) -> None:
+    """Report that requests wait for a spent rate-limit budget to reset."""
+    resume_at = datetime.now().astimezone() + timedelta(seconds=delay)
+    get_console().print(
+        f"[yellow]GitHub {resource} rate limit reached:[/yellow] waiting {delay:.0f}s "
+        f"for the reset at {resume_at:%H:%M:%S}"
+    )
+
+
+def report_token_usage(client: GitHubClient) -> None:
+    """Print the requests made with each pooled token."""
+    for usage in client.token_usage:
+        remaining = "unknown" if usage.remaining is None else str(usage.remaining)
+        limited = f", rate limited {usage.rate_limited}x" if usage.rate_limited else ""
+        get_console().print(
+            f"[dim]Token {usage.label}: {usage.requests} requests{limited}, "
+            f"{remaining} remaining[/dim]"
+        )
+
+
+def open_activity_store(config: GiteagleConfig) -> ActivityStore | None:
+    """Open the local activity store, or return None if incremental sync is off."""
+    if not config.incremental_sync:
+        return None
+    import sqlite3
+
+    from giteagle.config import get_data_dir
+    from giteagle.core import ActivityStore
+
+    try:
+        return ActivityStore.in_directory(get_data_dir())
+    except (OSError, sqlite3.Error) as e:
+        get_console().print(f"[yellow]Warning:[/yellow] Incremental sync disabled: {e}")
+        return None
+
+
+async def load_activities(
+    client: GitHubClient,
+    store: ActivityStore | None,
+    repository: Repository,
+    *,
+    since: datetime,
+    limit: int,
+) -> list[Activity]:
+    """Return up to limit activities of a repository since a point in time, newest first.
+
+    With a store, only changes since the previous sync are fetched and the
+    window is read back from the stored history.
+    """
+    from giteagle.integrations import sync_repository
+
+    if store is None:
+        return await client.get_activities(repository, since=since, limit=limit)
+    await sync_repository(client, store, repository, since=since, limit=limit)
+    return store.get_activities(repository, since=since, limit=limit)
+
+
+def valid_repo_names(repos: tuple) -> list[str]:
+    """Return repos in owner/name form, warning about invalid entries."""
+    from giteagle.cli.fanout import split_repo_names
+
+    valid, invalid = split_repo_names(repos)
+    for repo_name in invalid:
+        get_console().print(f"[yellow]Warning:[/yellow] Skipping invalid repo: {repo_name}")
+    return valid
+
+
+def _warn_fetch_failed(repo_name: str, error: Exception) -> None:
+    """Report a repository whose fetch failed."""
+    get_console().print(f"[yellow]Warning:[/yellow] Failed to fetch {repo_name}: {error}")
+
+
+async def fetch_each_repo(
+    repo_names: list[str],
+    fetch: Callable[[str, str], Awaitable[T]],
+    config: GiteagleConfig,
+) -> list[T]:
+    """Fetch repositories concurrently, returning successful results in order."""
+    from giteagle.cli.fanout import fetch_repos
+
+    results = await fetch_repos(
+        repo_names,
+        fetch,
+        max_concurrency=config.max_concurrent_requests,
+        on_error=_warn_fetch_failed,
+    )
+    return [result.value for result in results if result.value is not None]
+
+
+def planned_requests(repo_count: int, limit: int, kinds: int = 3) -> int:
+    """Return the most REST requests fetching up to limit items of each kind per repo takes.
+
+    Each repository costs one request for its details plus a page per 100 items of
+    each kind (commits, pull requests, issues); cache hits make the real count lower.
+    """
+    pages = -(-limit // 100)
+    return repo_count * (1 + kinds * pages)
+
+
+async def check_rate_budget(client: GitHubClient, requests: int) -> None:
+    """Check a planned fetch against the rate limit, warning if it may pause for the reset."""
+    if await client.check_rate_budget(requests):
+        return
+    budget = client.rate_limit_budget()
+    if budget is None:
+        return
+    reset_at = budget.reset_datetime.astimezone()
+    get_console().print(
+        f"[yellow]Warning:[/yellow] this may take up to {requests} API requests but only "
+        f"{budget.remaining} remain; fetching may pause until the reset at {reset_at:%H:%M:%S}"
+    )
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count as a human-readable string."""
+    value = float(size)
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
 def truncate_description(description: str | None, max_len: int = 50) -> str:
     """Truncate a description to a maximum length."""
     if not description:
@@ -46,6 +249,8 @@ def truncate_description(description: str | None, max_len: int = 50) -> str:
 @click.pass_context
 def cli(ctx: click.Context) -> None:
     """Giteagle - Get a bird's eye view of your repositories."""
+    from giteagle.config import load_config
+
     ctx.ensure_object(dict)
     ctx.obj["config"] = load_config()
 
@@ -56,11 +261,13 @@ def cli(ctx: click.Context) -> None:
 @click.pass_context
 def repos(ctx: click.Context, owner: str, org: bool) -> None:
     """List repositories for a user or organization."""
+    from rich import box
+    from rich.table import Table
+
     config = ctx.obj["config"]
-    token = config.github.token.get_secret_value() if config.github.token else None
 
     async def fetch_repos() -> list:
-        async with GitHubClient(token=token) as client:
+        async with github_client(config) as client:
             if org:
                 return await client.list_repositories(org=owner)
             return await client.list_repositories(owner=owner)
@@ -68,7 +275,7 @@ def repos(ctx: click.Context, owner: str, org: bool) -> None:
     try:
         repositories = run_async(fetch_repos())
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         raise SystemExit(1) from None
 
     table = Table(title=f"Repositories for {owner}", box=box.ROUNDED)
@@ -85,8 +292,8 @@ def repos(ctx: click.Context, owner: str, org: bool) -> None:
             "Yes" if repo.is_private else "No",
         )
 
-    console.print(table)
-    console.print(f"\n[dim]Total: {len(repositories)} repositories[/dim]")
+    get_console().print(table)
+    get_console().print(f"\n[dim]Total: {len(repositories)} repositories[/dim]")
 
 
 @cli.command()
@@ -99,29 +306,42 @@ def activity(ctx: click.Context, repo: str, days: int, limit: int) -> None:
 
     REPO should be in the format owner/name (e.g., octocat/hello-world)
     """
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from giteagle.core import ActivityType
+
     config = ctx.obj["config"]
-    token = config.github.token.get_secret_value() if config.github.token else None
 
     if "/" not in repo:
-        console.print("[red]Error:[/red] Repository must be in format owner/name")
+        get_console().print("[red]Error:[/red] Repository must be in format owner/name")
         raise SystemExit(1)
 
     owner, name = repo.split("/", 1)
     since = datetime.now(tz=timezone.utc) - timedelta(days=days)
 
     async def fetch_activity() -> tuple:
-        async with GitHubClient(token=token) as client:
-            repository = await client.get_repository(owner, name)
-            activities = await client.get_activities(repository, since=since, limit=limit)
-            return repository, activities
+        store = open_activity_store(config)
+        try:
+            async with github_client(config) as client:
+                await check_rate_budget(client, planned_requests(1, limit))
+                repository = await client.get_repository(owner, name)
+                activities = await load_activities(
+                    client, store, repository, since=since, limit=limit
+                )
+                return repository, activities
+        finally:
+            if store is not None:
+                store.close()
 
     try:
         repository, activities = run_async(fetch_activity())
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         raise SystemExit(1) from None
 
-    console.print(
+    get_console().print(
         Panel(
             f"[bold]{repository.full_name}[/bold]\n{repository.description or 'No description'}",
             title="Repository",
@@ -150,8 +370,8 @@ def activity(ctx: click.Context, repo: str, days: int, limit: int) -> None:
             act.timestamp.strftime("%Y-%m-%d %H:%M"),
         )
 
-    console.print(table)
-    console.print(f"\n[dim]Total: {len(activities)} activities[/dim]")
+    get_console().print(table)
+    get_console().print(f"\n[dim]Total: {len(activities)} activities[/dim]")
 
 
 @cli.command()
@@ -163,42 +383,51 @@ def summary(ctx: click.Context, repos: tuple, days: int) -> None:
 
     REPOS should be in the format owner/name (e.g., octocat/hello-world)
     """
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from giteagle.core import ActivityAggregator
+
     config = ctx.obj["config"]
-    token = config.github.token.get_secret_value() if config.github.token else None
     since = datetime.now(tz=timezone.utc) - timedelta(days=days)
 
-    async def fetch_all() -> ActivityAggregator:
-        async with GitHubClient(token=token) as client:
-            aggregator = ActivityAggregator()
+    repo_names = valid_repo_names(repos)
 
-            for repo_name in repos:
-                if "/" not in repo_name:
-                    console.print(f"[yellow]Warning:[/yellow] Skipping invalid repo: {repo_name}")
-                    continue
+    async def fetch_all() -> ActivityAggregator:
+        store = open_activity_store(config)
+        try:
+            async with github_client(config) as client:
+                await check_rate_budget(client, planned_requests(len(repo_names), 100))
 
-                owner, name = repo_name.split("/", 1)
-                try:
+                async def fetch_repo(owner: str, name: str) -> list[Activity]:
                     repository = await client.get_repository(owner, name)
-                    activities = await client.get_activities(repository, since=since, limit=100)
-                    aggregator.add_activities(activities)
-                    console.print(
-                        f"[dim]Fetched {len(activities)} activities from {repo_name}[/dim]"
+                    activities = await load_activities(
+                        client, store, repository, since=since, limit=100
+                    )
+                    get_console().print(
+                        f"[dim]Fetched {len(activities)} activities from {owner}/{name}[/dim]"
                     )
-                except Exception as e:
-                    console.print(f"[yellow]Warning:[/yellow] Failed to fetch {repo_name}: {e}")
+                    return activities
 
-            return aggregator
+                aggregator = ActivityAggregator()
+                for activities in await fetch_each_repo(repo_names, fetch_repo, config):
+                    aggregator.add_activities(activities)
+                return aggregator
+        finally:
+            if store is not None:
+                store.close()
 
     try:
         aggregator = run_async(fetch_all())
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         raise SystemExit(1) from None
 
     result = aggregator.aggregate(since=since)
 
     # Summary panel
-    console.print(
+    get_console().print(
         Panel(
             f"[bold]Total Activities:[/bold] {result.total_count}\n"
             f"[bold]Repositories:[/bold] {len(result.by_repository)}\n"
@@ -218,7 +447,7 @@ def summary(ctx: click.Context, repos: tuple, days: int) -> None:
         for activity_type, count in sorted_types:
             type_table.add_row(activity_type.value, str(count))
 
-        console.print(type_table)
+        get_console().print(type_table)
 
     # Top contributors
     top_contributors = aggregator.get_top_contributors(5)
@@ -230,7 +459,7 @@ def summary(ctx: click.Context, repos: tuple, days: int) -> None:
         for username, count in top_contributors:
             contrib_table.add_row(username, str(count))
 
-        console.print(contrib_table)
+        get_console().print(contrib_table)
 
     # Repository breakdown
     if len(result.by_repository) > 1:
@@ -242,70 +471,97 @@ def summary(ctx: click.Context, repos: tuple, days: int) -> None:
         for repo_name, count in sorted_repos:
             repo_table.add_row(repo_name, str(count))
 
-        console.print(repo_table)
+        get_console().print(repo_table)
 
 
 @cli.command()
 @click.argument("repos", nargs=-1, required=True)
 @click.option("--days", default=30, help="Number of days to analyze")
 @click.option("--granularity", type=click.Choice(["day", "week", "month"]), default="day")
+@click.option(
+    "--by",
+    "split_by",
+    type=click.Choice(["repository", "type"]),
+    default=None,
+    help="Show a separate timeline per repository or activity type",
+)
 @click.pass_context
-def timeline(ctx: click.Context, repos: tuple, days: int, granularity: str) -> None:
+def timeline(
+    ctx: click.Context, repos: tuple, days: int, granularity: str, split_by: str | None
+) -> None:
     """Show activity timeline across repositories."""
+    from rich import box
+    from rich.panel import Panel
+
+    from giteagle.core import ActivityAggregator
+
     config = ctx.obj["config"]
-    token = config.github.token.get_secret_value() if config.github.token else None
     since = datetime.now(tz=timezone.utc) - timedelta(days=days)
 
-    async def fetch_all() -> ActivityAggregator:
-        async with GitHubClient(token=token) as client:
-            aggregator = ActivityAggregator()
+    repo_names = valid_repo_names(repos)
 
-            for repo_name in repos:
-                if "/" not in repo_name:
-                    continue
+    async def fetch_all() -> ActivityAggregator:
+        store = open_activity_store(config)
+        try:
+            async with github_client(config) as client:
+                await check_rate_budget(client, planned_requests(len(repo_names), 500))
 
-                owner, name = repo_name.split("/", 1)
-                try:
+                async def fetch_repo(owner: str, name: str) -> list[Activity]:
                     repository = await client.get_repository(owner, name)
-                    activities = await client.get_activities(repository, since=since, limit=500)
-                    aggregator.add_activities(activities)
-                except Exception:
-                    pass
+                    return await load_activities(client, store, repository, since=since, limit=500)
 
-            return aggregator
+                aggregator = ActivityAggregator()
+                for activities in await fetch_each_repo(repo_names, fetch_repo, config):
+                    aggregator.add_activities(activities)
+                return aggregator
+        finally:
+            if store is not None:
+                store.close()
 
     try:
         aggregator = run_async(fetch_all())
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         raise SystemExit(1) from None
 
-    timeline_data = aggregator.get_activity_timeline(granularity=granularity, since=since)
+    if split_by is None:
+        timelines = {"": aggregator.get_activity_timeline(granularity=granularity, since=since)}
+    else:
+        timelines = aggregator.get_activity_timeline_by(
+            split_by, granularity=granularity, since=since
+        )
+    timelines = {group: data for group, data in timelines.items() if data}
 
-    if not timeline_data:
-        console.print("[yellow]No activity found in the specified period[/yellow]")
+    if not timelines:
+        get_console().print("[yellow]No activity found in the specified period[/yellow]")
         return
 
-    # Find max for scaling
-    max_count = max(timeline_data.values())
+    # Find max for scaling, shared across groups so their bars compare
+    max_count = max(count for data in timelines.values() for count in data.values())
 
-    console.print(
+    get_console().print(
         Panel(
             f"Activity Timeline ({granularity}ly)",
             box=box.ROUNDED,
         )
     )
 
-    for date, count in timeline_data.items():
-        bar_width = int((count / max_count) * 40) if max_count > 0 else 0
-        bar = "[green]" + "█" * bar_width + "[/green]"
-        console.print(f"{date}: {bar} {count}")
+    for group, timeline_data in timelines.items():
+        if group:
+            get_console().print(f"\n[bold cyan]{group}[/bold cyan]")
+        for date, count in timeline_data.items():
+            bar_width = int((count / max_count) * 40) if max_count > 0 else 0
+            bar = "[green]" + "█" * bar_width + "[/green]"
+            get_console().print(f"{date}: {bar} {count}")
 
 
 @cli.command()
 @click.pass_context
 def config(ctx: click.Context) -> None:
     """Show current configuration."""
+    from rich import box
+    from rich.table import Table
+
     cfg = ctx.obj["config"]
 
     table = Table(title="Configuration", box=box.ROUNDED)
@@ -314,18 +570,81 @@ def config(ctx: click.Context) -> None:
 
     table.add_row("Default Platform", cfg.default_platform)
     table.add_row("Cache TTL", f"{cfg.cache_ttl}s")
+    table.add_row("Cache Size Limit", f"{cfg.cache_max_size_mb} MB")
     table.add_row("Max Concurrent Requests", str(cfg.max_concurrent_requests))
-    table.add_row("GitHub Token", "***" if cfg.github.token else "[red]Not set[/red]")
+    table.add_row("Incremental Sync", "Yes" if cfg.incremental_sync else "No")
+    table.add_row("Max Rate Limit Wait", f"{cfg.max_rate_limit_wait:g}s")
+    table.add_row("JSON Decoder", cfg.json_decoder)
+    table.add_row("HTTP/2", "Yes" if cfg.http2 else "No")
+    table.add_row(
+        "Connection Pool",
+        f"{cfg.max_connections or cfg.max_concurrent_requests}, "
+        f"kept alive {cfg.keepalive_expiry:g}s",
+    )
+    github_tokens = len(cfg.github.all_tokens())
+    if github_tokens > 1:
+        table.add_row("GitHub Tokens", f"*** ({github_tokens} pooled)")
+    else:
+        table.add_row("GitHub Token", "***" if github_tokens else "[red]Not set[/red]")
     table.add_row("GitLab Token", "***" if cfg.gitlab.token else "[red]Not set[/red]")
     table.add_row("Bitbucket Token", "***" if cfg.bitbucket.token else "[red]Not set[/red]")
 
-    console.print(table)
-    console.print(
-        "\n[dim]Set tokens via GITHUB_TOKEN, GITLAB_TOKEN, "
+    get_console().print(table)
+    get_console().print(
+        "\n[dim]Set tokens via GITHUB_TOKEN (GITHUB_TOKENS for a pool), GITLAB_TOKEN, "
         "BITBUCKET_TOKEN environment variables[/dim]"
     )
 
 
+@cli.group()
+def cache() -> None:
+    """Manage the on-disk API response cache."""
+
+
+@cache.command(name="stats")
+@click.pass_context
+def cache_stats(ctx: click.Context) -> None:
+    """Show response cache usage."""
+    from rich import box
+    from rich.table import Table
+
+    response_cache = open_response_cache(ctx.obj["config"])
+    try:
+        stats = response_cache.stats()
+    finally:
+        response_cache.close()
+
+    table = Table(title="Response Cache", box=box.ROUNDED)
+    table.add_column("Setting", style="cyan")
+    table.add_column("Value", style="white")
+
+    table.add_row("Location", str(stats.path))
+    table.add_row("Entries", str(stats.entries))
+    table.add_row(
+        "Size", f"{format_bytes(stats.size_bytes)} / {format_bytes(stats.max_size_bytes)}"
+    )
+    table.add_row("TTL", f"{response_cache.ttl}s")
+    table.add_row("Hits", str(stats.hits))
+    table.add_row("Misses", str(stats.misses))
+    table.add_row("Revalidated (304)", str(stats.revalidated))
+    table.add_row("Hit Rate", f"{stats.hit_rate:.0%}")
+
+    get_console().print(table)
+
+
+@cache.command(name="clear")
+@click.pass_context
+def cache_clear(ctx: click.Context) -> None:
+    """Remove all cached responses."""
+    response_cache = open_response_cache(ctx.obj["config"])
+    try:
+        removed = response_cache.clear()
+    finally:
+        response_cache.close()
+
+    get_console().print(f"[green]Cleared {removed} cached responses[/green]")
+
+
 @cli.command(name="log")
 @click.argument("repos", nargs=-1, required=True)
 @click.option("--days", default=7, help="Number of days to look back")
@@ -337,47 +656,46 @@ def log_cmd(ctx: click.Context, repos: tuple, days: int, limit: int, author: str
 
     REPOS should be in the format owner/name (e.g., octocat/hello-world)
     """
+    from giteagle.cli.log_renderer import assign_repo_colors, get_display_names, render_log
+
     config_obj = ctx.obj["config"]
-    token = config_obj.github.token.get_secret_value() if config_obj.github.token else None
     since = datetime.now(tz=timezone.utc) - timedelta(days=days)
 
-    async def fetch_commits() -> list:
-        async with GitHubClient(token=token) as client:
-            all_commits: list = []
-
-            for repo_name in repos:
-                if "/" not in repo_name:
-                    console.print(f"[yellow]Warning:[/yellow] Skipping invalid repo: {repo_name}")
-                    continue
+    repo_names = valid_repo_names(repos)
 
-                owner, name = repo_name.split("/", 1)
-                try:
-                    repository = await client.get_repository(owner, name)
-                    activities = await client.get_activities(repository, since=since, limit=limit)
-                    commits = [a for a in activities if a.type == ActivityType.COMMIT]
-                    all_commits.extend(commits)
-                    console.print(f"[dim]Fetched {len(commits)} commits from {repo_name}[/dim]")
-                except Exception as e:
-                    console.print(f"[yellow]Warning:[/yellow] Failed to fetch {repo_name}: {e}")
+    async def fetch_commits() -> list:
+        async with github_client(config_obj) as client:
+            await check_rate_budget(client, planned_requests(len(repo_names), limit, kinds=1))
+
+            async def fetch_repo(owner: str, name: str) -> list[CommitRecord]:
+                repository = await client.get_repository(owner, name)
+                # Stream commit pages so only records of matching commits are kept in memory
+                commits: list[CommitRecord] = []
+                async for page in client.aiter_commit_records(repository, since, limit):
+                    commits.extend(c for c in page if author is None or c.author == author)
+                get_console().print(
+                    f"[dim]Fetched {len(commits)} commits from {owner}/{name}[/dim]"
+                )
+                return commits
 
+            all_commits: list = []
+            for commits in await fetch_each_repo(repo_names, fetch_repo, config_obj):
+                all_commits.extend(commits)
             return all_commits
 
     try:
         commits = run_async(fetch_commits())
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         raise SystemExit(1) from None
 
-    if author:
-        commits = [c for c in commits if c.contributor.username == author]
-
     commits.sort(key=lambda a: a.timestamp, reverse=True)
 
-    repo_names = list({c.repository.full_name for c in commits})
+    repo_names = list({c.repository for c in commits})
     repo_colors = assign_repo_colors(repo_names)
     display_names = get_display_names(repo_names)
 
-    render_log(console, commits, repo_colors, display_names)
+    render_log(get_console(), commits, repo_colors, display_names)
 
 
 @cli.command()
@@ -390,41 +708,43 @@ def standup(ctx: click.Context, repos: tuple, days: int, author: str | None) ->
 
     REPOS should be in the format owner/name (e.g., octocat/hello-world)
     """
+    from giteagle.cli.standup_renderer import (
+        build_standup_data,
+        compute_standup_since,
+        render_standup,
+    )
+    from giteagle.core import to_record
+
     config_obj = ctx.obj["config"]
-    token = config_obj.github.token.get_secret_value() if config_obj.github.token else None
     since = compute_standup_since(days)
+    repo_names = valid_repo_names(repos)
 
     async def fetch_standup() -> tuple[list, str | None]:
-        client = GitHubClient(token=token)
+        client = github_client(config_obj)
         try:
+            await check_rate_budget(client, planned_requests(len(repo_names), 200) + 1)
             resolved_author = author
-            if resolved_author is None and token:
+            if resolved_author is None and config_obj.github.all_tokens():
                 try:
                     resolved_author = await client.get_authenticated_user()
                 except Exception:
                     pass
 
-            all_activities: list = []
-            for repo_name in repos:
-                if "/" not in repo_name:
-                    console.print(f"[yellow]Warning:[/yellow] Skipping invalid repo: {repo_name}")
-                    continue
-
-                owner, name = repo_name.split("/", 1)
-                try:
-                    repository = await client.get_repository(owner, name)
-                    activities = await client.get_activities(
-                        repository,
-                        since=since,
-                        limit=200,
-                    )
-                    all_activities.extend(activities)
-                    console.print(
-                        f"[dim]Fetched {len(activities)} activities from {repo_name}[/dim]"
-                    )
-                except Exception as e:
-                    console.print(f"[yellow]Warning:[/yellow] Failed to fetch {repo_name}: {e}")
+            async def fetch_repo(owner: str, name: str) -> list[Activity]:
+                repository = await client.get_repository(owner, name)
+                activities = await client.get_activities(
+                    repository,
+                    since=since,
+                    limit=200,
+                )
+                get_console().print(
+                    f"[dim]Fetched {len(activities)} activities from {owner}/{name}[/dim]"
+                )
+                return activities
 
+            all_activities: list = []
+            for activities in await fetch_each_repo(repo_names, fetch_repo, config_obj):
+                all_activities.extend(activities)
             return all_activities, resolved_author
         finally:
             await client.close()
@@ -432,83 +752,55 @@ def standup(ctx: click.Context, repos: tuple, days: int, author: str | None) ->
     try:
         activities, resolved_author = run_async(fetch_standup())
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         raise SystemExit(1) from None
 
     if resolved_author:
         activities = [a for a in activities if a.contributor.username == resolved_author]
 
-    standup_data = build_standup_data(activities, since)
-    render_standup(console, standup_data, author=resolved_author, since=since)
+    records: list[ActivityRecord] = [to_record(a) for a in activities]
+    standup_data = build_standup_data(records, since)
+    render_standup(get_console(), standup_data, author=resolved_author, since=since)
 
 
 @cli.command()
 @click.argument("repos", nargs=-1, required=True)
 @click.option("--author", default=None, help="Filter by PR author")
 @click.option("--stale", default=7, type=int, help="Days after which a PR is considered stale")
+@click.option(
+    "--api",
+    type=click.Choice(["graphql", "rest"]),
+    default="graphql",
+    help="API for reviews and CI status (GraphQL falls back to REST)",
+)
 @click.pass_context
-def prs(ctx: click.Context, repos: tuple, author: str | None, stale: int) -> None:
+def prs(ctx: click.Context, repos: tuple, author: str | None, stale: int, api: str) -> None:
     """Show open pull requests across repositories.
 
     REPOS should be in the format owner/name (e.g., octocat/hello-world)
     """
+    from giteagle.cli.prs_renderer import build_pr_infos, render_prs
+
     config_obj = ctx.obj["config"]
-    token = config_obj.github.token.get_secret_value() if config_obj.github.token else None
+    repo_names = valid_repo_names(repos)
 
     async def fetch_prs() -> list:
-        client = GitHubClient(token=token)
+        client = github_client(config_obj)
         try:
-            all_pr_infos: list = []
 
-            for repo_name in repos:
-                if "/" not in repo_name:
-                    console.print(f"[yellow]Warning:[/yellow] Skipping invalid repo: {repo_name}")
-                    continue
-
-                owner, name = repo_name.split("/", 1)
-                try:
-                    repository = await client.get_repository(owner, name)
-                    raw_prs = await client.get_open_pull_requests(repository)
-                    console.print(f"[dim]Fetched {len(raw_prs)} open PRs from {repo_name}[/dim]")
-
-                    if not raw_prs:
-                        continue
-
-                    # Fetch reviews and statuses concurrently
-                    review_tasks = [
-                        client.get_pr_reviews(repository, pr["number"]) for pr in raw_prs
-                    ]
-                    status_tasks = [
-                        client.get_commit_status(repository, pr.get("head", {}).get("sha", ""))
-                        for pr in raw_prs
-                        if pr.get("head", {}).get("sha")
-                    ]
-
-                    reviews_results = await asyncio.gather(*review_tasks, return_exceptions=True)
-                    status_results = await asyncio.gather(*status_tasks, return_exceptions=True)
-
-                    reviews_map: dict[int, list] = {}
-                    for pr, result in zip(raw_prs, reviews_results):
-                        if isinstance(result, list):
-                            reviews_map[pr["number"]] = result
-                        else:
-                            reviews_map[pr["number"]] = []
-
-                    status_map: dict[str, dict] = {}
-                    prs_with_sha = [pr for pr in raw_prs if pr.get("head", {}).get("sha")]
-                    for pr, status_result in zip(prs_with_sha, status_results):
-                        sha = pr["head"]["sha"]
-                        if isinstance(status_result, dict):
-                            status_map[sha] = status_result
-                        else:
-                            status_map[sha] = {"state": "unknown"}
-
-                    pr_infos = build_pr_infos(raw_prs, reviews_map, status_map, repo_name)
-                    all_pr_infos.extend(pr_infos)
-
-                except Exception as e:
-                    console.print(f"[yellow]Warning:[/yellow] Failed to fetch {repo_name}: {e}")
+            async def fetch_repo(owner: str, name: str) -> list:
+                repo_name = f"{owner}/{name}"
+                repository = await client.get_repository(owner, name)
+                details = await client.get_open_pull_request_details(
+                    repository, use_graphql=api == "graphql"
+                )
+                raw_prs = details.pull_requests
+                get_console().print(f"[dim]Fetched {len(raw_prs)} open PRs from {repo_name}[/dim]")
+                return build_pr_infos(raw_prs, details.reviews, details.statuses, repo_name)
 
+            all_pr_infos: list = []
+            for pr_infos in await fetch_each_repo(repo_names, fetch_repo, config_obj):
+                all_pr_infos.extend(pr_infos)
             return all_pr_infos
         finally:
             await client.close()
@@ -516,108 +808,90 @@ def prs(ctx: click.Context, repos: tuple, author: str | None, stale: int) -> Non
     try:
         pr_infos = run_async(fetch_prs())
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         raise SystemExit(1) from None
 
-    render_prs(console, pr_infos, stale_days=stale, author_filter=author)
+    render_prs(get_console(), pr_infos, stale_days=stale, author_filter=author)
 
 
 @cli.command()
 @click.argument("repos", nargs=-1, required=True)
 @click.option("--days", default=30, help="Time window in days for metrics")
+@click.option(
+    "--api",
+    type=click.Choice(["graphql", "rest"]),
+    default="graphql",
+    help="API for PRs and reviews (GraphQL falls back to REST)",
+)
 @click.pass_context
-def stats(ctx: click.Context, repos: tuple, days: int) -> None:
+def stats(ctx: click.Context, repos: tuple, days: int, api: str) -> None:
     """Show DORA-style PR metrics across repositories.
 
     REPOS should be in the format owner/name (e.g., octocat/hello-world)
     """
+    from giteagle.cli.stats_renderer import build_pr_metrics, compute_repo_stats, render_stats
+
     config_obj = ctx.obj["config"]
-    token = config_obj.github.token.get_secret_value() if config_obj.github.token else None
     now = datetime.now(tz=timezone.utc)
     current_since = now - timedelta(days=days)
     prev_since = current_since - timedelta(days=days)
+    repo_names = valid_repo_names(repos)
 
     async def fetch_stats() -> tuple[list, list]:
-        client = GitHubClient(token=token)
+        client = github_client(config_obj)
         try:
-            current_repo_stats: list = []
-            previous_repo_stats: list = []
-
-            for repo_name in repos:
-                if "/" not in repo_name:
-                    console.print(f"[yellow]Warning:[/yellow] Skipping invalid repo: {repo_name}")
-                    continue
 
-                owner, name = repo_name.split("/", 1)
-                try:
-                    repository = await client.get_repository(owner, name)
-
-                    # Fetch closed PRs covering both windows
-                    closed_prs = await client.get_closed_pull_requests(
-                        repository, since=prev_since, limit=200
-                    )
-                    console.print(
-                        f"[dim]Fetched {len(closed_prs)} closed PRs from {repo_name}[/dim]"
+            async def fetch_repo(owner: str, name: str) -> tuple:
+                repo_name = f"{owner}/{name}"
+                repository = await client.get_repository(owner, name)
+
+                # Fetch closed PRs covering both windows, with reviews for merged ones
+                details = await client.get_closed_pull_request_details(
+                    repository, since=prev_since, limit=200, use_graphql=api == "graphql"
+                )
+                closed_prs = details.pull_requests
+                reviews_map = details.reviews
+                get_console().print(
+                    f"[dim]Fetched {len(closed_prs)} closed PRs from {repo_name}[/dim]"
+                )
+
+                # Split into current and previous windows
+                current_prs: list[dict] = []
+                previous_prs: list[dict] = []
+                for pr in closed_prs:
+                    closed_at = pr.get("closed_at")
+                    if closed_at:
+                        window = current_prs if closed_at >= current_since else previous_prs
+                        window.append(pr)
+
+                # Build metrics for current and previous
+                current_metrics = build_pr_metrics(current_prs, reviews_map, repo_name)
+                previous_metrics = build_pr_metrics(previous_prs, reviews_map, repo_name)
+
+                current = compute_repo_stats(
+                    current_metrics,
+                    len(current_prs),
+                    repo_name,
+                    window_days=days,
+                )
+                previous = (
+                    compute_repo_stats(
+                        previous_metrics,
+                        len(previous_prs),
+                        repo_name,
+                        window_days=days,
                     )
+                    if previous_metrics
+                    else None
+                )
+                return current, previous
 
-                    # Split into current and previous windows
-                    current_prs = [
-                        pr
-                        for pr in closed_prs
-                        if pr.get("closed_at")
-                        and datetime.fromisoformat(pr["closed_at"].replace("Z", "+00:00"))
-                        >= current_since
-                    ]
-                    previous_prs = [
-                        pr
-                        for pr in closed_prs
-                        if pr.get("closed_at")
-                        and datetime.fromisoformat(pr["closed_at"].replace("Z", "+00:00"))
-                        < current_since
-                    ]
-
-                    # Fetch reviews for merged PRs concurrently
-                    merged_current = [pr for pr in current_prs if pr.get("merged_at")]
-                    merged_previous = [pr for pr in previous_prs if pr.get("merged_at")]
-
-                    all_merged = merged_current + merged_previous
-                    review_tasks = [
-                        client.get_pr_reviews(repository, pr["number"]) for pr in all_merged
-                    ]
-                    review_results = await asyncio.gather(*review_tasks, return_exceptions=True)
-
-                    reviews_map: dict[int, list] = {}
-                    for pr, result in zip(all_merged, review_results):
-                        if isinstance(result, list):
-                            reviews_map[pr["number"]] = result
-                        else:
-                            reviews_map[pr["number"]] = []
-
-                    # Build metrics for current and previous
-                    current_metrics = build_pr_metrics(current_prs, reviews_map, repo_name)
-                    previous_metrics = build_pr_metrics(previous_prs, reviews_map, repo_name)
-
-                    current_repo_stats.append(
-                        compute_repo_stats(
-                            current_metrics,
-                            len(current_prs),
-                            repo_name,
-                            window_days=days,
-                        )
-                    )
-                    if previous_metrics:
-                        previous_repo_stats.append(
-                            compute_repo_stats(
-                                previous_metrics,
-                                len(previous_prs),
-                                repo_name,
-                                window_days=days,
-                            )
-                        )
-
-                except Exception as e:
-                    console.print(f"[yellow]Warning:[/yellow] Failed to fetch {repo_name}: {e}")
-
+            current_repo_stats: list = []
+            previous_repo_stats: list = []
+            for current, previous in await fetch_each_repo(repo_names, fetch_repo, config_obj):
+                current_repo_stats.append(current)
+                if previous is not None:
+                    previous_repo_stats.append(previous)
             return current_repo_stats, previous_repo_stats
         finally:
             await client.close()
@@ -625,10 +899,10 @@ def stats(ctx: click.Context, repos: tuple, days: int) -> None:
     try:
         current_stats, previous_stats = run_async(fetch_stats())
     except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         raise SystemExit(1) from None
 
-    render_stats(console, current_stats, previous_stats, window_days=days)
+    render_stats(get_console(), current_stats, previous_stats, window_days=days)
 
 
 if __name__ == "__main__":
@@ -44,6 +44,9 @@ class PullRequestInfo:
     url: str = ""
 
 
+_UNSUBMITTED = datetime.min.replace(tzinfo=timezone.utc)
+
+
 def age_display(created_at: datetime, *, now: datetime | None = None) -> str:
     """Format age as human-readable string like '3d', '2h', '5w'."""
     now = now or datetime.now(tz=timezone.utc)
@@ -62,12 +65,17 @@ def age_display(created_at: datetime, *, now: datetime | None = None) -> str:
     return f"{weeks}w"
 
 
+def _submitted_at(review: dict) -> datetime:
+    """Return when a review was submitted, with unsubmitted reviews first."""
+    return review.get("submitted_at") or _UNSUBMITTED
+
+
 def _build_review_status(reviews: list[dict]) -> ReviewStatus:
-    """Build ReviewStatus from raw GitHub review dicts."""
+    """Build ReviewStatus from GitHub review dicts with parsed timestamps."""
     status = ReviewStatus()
     # Track latest review state per reviewer
     reviewer_states: dict[str, str] = {}
-    for review in sorted(reviews, key=lambda r: r.get("submitted_at", "")):
+    for review in sorted(reviews, key=_submitted_at):
         reviewer = review.get("user", {}).get("login", "")
         state = review.get("state", "")
         if state in ("APPROVED", "CHANGES_REQUESTED", "DISMISSED"):
@@ -91,10 +99,12 @@ def build_pr_infos(
     status_map: dict[str, dict],
     repo_name: str,
 ) -> list[PullRequestInfo]:
-    """Convert raw API data into PullRequestInfo objects."""
+    """Convert pull request details into PullRequestInfo objects.
+
+    Timestamps are expected already parsed, as :class:`PullRequestDetails` holds them.
+    """
     infos: list[PullRequestInfo] = []
     for pr in raw_prs:
-        created_at = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
         head_sha = pr.get("head", {}).get("sha", "")
         labels = [label["name"] for label in pr.get("labels", [])]
 
@@ -110,7 +120,7 @@ def build_pr_infos(
                 number=pr["number"],
                 title=pr.get("title", ""),
                 author=pr.get("user", {}).get("login", "unknown"),
-                created_at=created_at,
+                created_at=pr["created_at"],
                 labels=labels,
                 head_sha=head_sha,
                 review_status=review_status,
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta, timezone
 
 from rich.console import Console
 
-from giteagle.core.models import Activity, ActivityType
+from giteagle.core.records import ActivityRecord, CommitRecord, IssueRecord, PullRequestRecord
 
 
 @dataclass
@@ -15,12 +15,12 @@ class RepoStandup:
     """Aggregated standup data for a single repository."""
 
     repo_name: str
-    commits: list[Activity] = field(default_factory=list)
-    prs_opened: list[Activity] = field(default_factory=list)
-    prs_merged: list[Activity] = field(default_factory=list)
-    prs_closed: list[Activity] = field(default_factory=list)
-    issues_opened: list[Activity] = field(default_factory=list)
-    issues_closed: list[Activity] = field(default_factory=list)
+    commits: list[CommitRecord] = field(default_factory=list)
+    prs_opened: list[PullRequestRecord] = field(default_factory=list)
+    prs_merged: list[PullRequestRecord] = field(default_factory=list)
+    prs_closed: list[PullRequestRecord] = field(default_factory=list)
+    issues_opened: list[IssueRecord] = field(default_factory=list)
+    issues_closed: list[IssueRecord] = field(default_factory=list)
 
     @property
     def total(self) -> int:
@@ -50,47 +50,36 @@ def compute_standup_since(days: int, *, now: datetime | None = None) -> datetime
     return since
 
 
-def _parse_iso_datetime(value: str | None) -> datetime | None:
-    """Parse an ISO datetime string from GitHub API."""
-    if not value:
-        return None
-    try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
-        return None
-
-
 def build_standup_data(
-    activities: list[Activity],
+    activities: list[ActivityRecord],
     since: datetime,
 ) -> list[RepoStandup]:
-    """Group activities into per-repo standup summaries."""
+    """Group activity records into per-repo standup summaries."""
     repos: dict[str, RepoStandup] = {}
 
     for activity in activities:
-        repo_name = activity.repository.full_name
+        repo_name = activity.repository
         if repo_name not in repos:
             repos[repo_name] = RepoStandup(repo_name=repo_name)
         standup = repos[repo_name]
 
-        if activity.type == ActivityType.COMMIT:
+        if isinstance(activity, CommitRecord):
             if activity.timestamp >= since:
                 standup.commits.append(activity)
 
-        elif activity.type == ActivityType.PULL_REQUEST:
-            merged_at = _parse_iso_datetime(activity.metadata.get("merged_at"))
-            closed_at = _parse_iso_datetime(activity.metadata.get("closed_at"))
-            is_merged = activity.metadata.get("merged", False)
+        elif isinstance(activity, PullRequestRecord):
+            merged_at = activity.merged_at
+            closed_at = activity.closed_at
 
             if activity.timestamp >= since:
                 standup.prs_opened.append(activity)
-            if is_merged and merged_at and merged_at >= since:
+            if activity.merged and merged_at and merged_at >= since:
                 standup.prs_merged.append(activity)
-            elif not is_merged and closed_at and closed_at >= since:
+            elif not activity.merged and closed_at and closed_at >= since:
                 standup.prs_closed.append(activity)
 
-        elif activity.type == ActivityType.ISSUE:
-            closed_at = _parse_iso_datetime(activity.metadata.get("closed_at"))
+        elif isinstance(activity, IssueRecord):
+            closed_at = activity.closed_at
 
             if activity.timestamp >= since:
                 standup.issues_opened.append(activity)
@@ -103,6 +92,11 @@ def build_standup_data(
     return result
 
 
+def _number(record: PullRequestRecord | IssueRecord) -> str:
+    """Return a pull request or issue number for display."""
+    return "?" if record.number is None else str(record.number)
+
+
 def render_standup(
     console: Console,
     standup_data: list[RepoStandup],
@@ -134,37 +128,25 @@ def render_standup(
             console.print(f"  [green]Commits ({len(standup.commits)}):[/green] {titles}")
 
         if standup.prs_opened:
-            titles = ", ".join(
-                f"#{a.metadata.get('number', '?')} {a.title[:40]}" for a in standup.prs_opened[:5]
-            )
+            titles = ", ".join(f"#{_number(a)} {a.title[:40]}" for a in standup.prs_opened[:5])
             console.print(f"  [magenta]PRs opened ({len(standup.prs_opened)}):[/magenta] {titles}")
 
         if standup.prs_merged:
-            titles = ", ".join(
-                f"#{a.metadata.get('number', '?')} {a.title[:40]}" for a in standup.prs_merged[:5]
-            )
+            titles = ", ".join(f"#{_number(a)} {a.title[:40]}" for a in standup.prs_merged[:5])
             console.print(f"  [blue]PRs merged ({len(standup.prs_merged)}):[/blue] {titles}")
 
         if standup.prs_closed:
-            titles = ", ".join(
-                f"#{a.metadata.get('number', '?')} {a.title[:40]}" for a in standup.prs_closed[:5]
-            )
+            titles = ", ".join(f"#{_number(a)} {a.title[:40]}" for a in standup.prs_closed[:5])
             console.print(f"  [dim]PRs closed ({len(standup.prs_closed)}):[/dim] {titles}")
 
         if standup.issues_opened:
-            titles = ", ".join(
-                f"#{a.metadata.get('number', '?')} {a.title[:40]}"
-                for a in standup.issues_opened[:5]
-            )
+            titles = ", ".join(f"#{_number(a)} {a.title[:40]}" for a in standup.issues_opened[:5])
             console.print(
                 f"  [yellow]Issues opened ({len(standup.issues_opened)}):[/yellow] {titles}"
             )
 
         if standup.issues_closed:
-            titles = ", ".join(
-                f"#{a.metadata.get('number', '?')} {a.title[:40]}"
-                for a in standup.issues_closed[:5]
-            )
+            titles = ", ".join(f"#{_number(a)} {a.title[:40]}" for a in standup.issues_closed[:5])
             console.print(f"  [dim]Issues closed ({len(standup.issues_closed)}):[/dim] {titles}")
 
     repo_count = len(standup_data)
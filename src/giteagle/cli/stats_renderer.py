@@ -80,26 +80,29 @@ def build_pr_metrics(
     reviews_map: dict[int, list[dict]],
     repo_name: str,
 ) -> list[PRMetrics]:
-    """Convert raw API data into PRMetrics objects for merged PRs."""
+    """Convert pull request details into PRMetrics objects for merged PRs.
+
+    Timestamps are expected already parsed, as :class:`PullRequestDetails` holds them.
+    """
     metrics: list[PRMetrics] = []
     for pr in raw_prs:
-        merged_at_str = pr.get("merged_at")
-        if not merged_at_str:
+        merged_at = pr.get("merged_at")
+        if not merged_at:
             continue
 
-        created_at = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
-        merged_at = datetime.fromisoformat(merged_at_str.replace("Z", "+00:00"))
+        created_at = pr["created_at"]
 
         # Find first review timestamp (excluding COMMENTED-only)
         reviews = reviews_map.get(pr["number"], [])
-        first_review_at: datetime | None = None
-        for review in sorted(reviews, key=lambda r: r.get("submitted_at", "")):
-            state = review.get("state", "")
-            if state in ("APPROVED", "CHANGES_REQUESTED", "DISMISSED"):
-                submitted = review.get("submitted_at")
-                if submitted:
-                    first_review_at = datetime.fromisoformat(submitted.replace("Z", "+00:00"))
-                    break
+        first_review_at: datetime | None = min(
+            (
+                review["submitted_at"]
+                for review in reviews
+                if review.get("state", "") in ("APPROVED", "CHANGES_REQUESTED", "DISMISSED")
+                and review.get("submitted_at")
+            ),
+            default=None,
+        )
 
         time_to_merge = merged_at - created_at
         time_to_first_review = (first_review_at - created_at) if first_review_at else None
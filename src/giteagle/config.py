@@ -3,10 +3,9 @@
 import os
 import stat
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 from urllib.parse import urlparse
 
-import yaml
 from pydantic import BaseModel, ConfigDict, Field, SecretStr, field_validator
 
 
@@ -14,6 +13,9 @@ class PlatformConfig(BaseModel):
     """Configuration for a single platform."""
 
     token: Optional[SecretStr] = Field(default=None, description="API token")
+    tokens: list[SecretStr] = Field(
+        default_factory=list, description="Additional API tokens sharing the request load"
+    )
     base_url: Optional[str] = Field(default=None, description="Base API URL (for enterprise)")
 
     @field_validator("base_url")
@@ -29,6 +31,11 @@ class PlatformConfig(BaseModel):
             raise ValueError("base_url must include a valid hostname")
         return v
 
+    def all_tokens(self) -> list[str]:
+        """Return the token and any additional tokens, without duplicates."""
+        tokens = [self.token, *self.tokens] if self.token else self.tokens
+        return list(dict.fromkeys(token.get_secret_value() for token in tokens))
+
 
 class GiteagleConfig(BaseModel):
     """Main configuration for Giteagle."""
@@ -40,7 +47,19 @@ class GiteagleConfig(BaseModel):
     bitbucket: PlatformConfig = PlatformConfig()
     default_platform: str = "github"
     cache_ttl: int = 300
-    max_concurrent_requests: int = 10
+    cache_max_size_mb: int = Field(default=100, ge=0)
+    max_concurrent_requests: int = Field(default=10, ge=1)
+    incremental_sync: bool = True
+    # Longest pause, in seconds, for a spent rate-limit budget to reset before failing
+    max_rate_limit_wait: float = Field(default=900.0, ge=0)
+    # JSON decoder for API responses; "auto" picks the fastest installed one
+    json_decoder: Literal["auto", "orjson", "msgspec", "json"] = "auto"
+    # HTTP/2 multiplexes concurrent requests over one connection; needs the h2 package
+    http2: bool = False
+    # Connection pool size; defaults to max_concurrent_requests
+    max_connections: Optional[int] = Field(default=None, ge=1)
+    # Seconds an idle connection is kept open for reuse
+    keepalive_expiry: float = Field(default=30.0, ge=0)
 
 
 def get_config_path() -> Path:
@@ -64,13 +83,27 @@ def get_config_path() -> Path:
     return xdg_path
 
 
+def get_cache_dir() -> Path:
+    """Get the directory used for cached API responses."""
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return Path(xdg_cache) / "giteagle"
+
+
+def get_data_dir() -> Path:
+    """Get the directory used for locally stored activity history."""
+    xdg_data = os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share"))
+    return Path(xdg_data) / "giteagle"
+
+
 def load_config(path: Optional[Path] = None) -> GiteagleConfig:
     """Load configuration from file and environment variables."""
     config_path = path or get_config_path()
     config_data: dict[str, Any] = {}
 
-    # Load from file if exists
+    # Load from file if exists; yaml is only imported when there is one to read
     if config_path.exists():
+        import yaml
+
         with open(config_path) as f:
             config_data = yaml.safe_load(f) or {}
 
@@ -80,6 +113,12 @@ def load_config(path: Optional[Path] = None) -> GiteagleConfig:
             config_data["github"] = {}
         config_data["github"]["token"] = github_token
 
+    # A comma-separated token pool for syncs larger than one token's rate limit
+    if github_tokens := os.environ.get("GITHUB_TOKENS"):
+        config_data.setdefault("github", {})["tokens"] = [
+            token.strip() for token in github_tokens.split(",") if token.strip()
+        ]
+
     if gitlab_token := os.environ.get("GITLAB_TOKEN"):
         if "gitlab" not in config_data:
             config_data["gitlab"] = {}
@@ -90,6 +129,12 @@ def load_config(path: Optional[Path] = None) -> GiteagleConfig:
             config_data["bitbucket"] = {}
         config_data["bitbucket"]["token"] = bitbucket_token
 
+    if os.environ.get("GITEAGLE_HTTP2", "0") not in ("", "0"):
+        config_data["http2"] = True
+
+    if json_decoder := os.environ.get("GITEAGLE_JSON_DECODER"):
+        config_data["json_decoder"] = json_decoder
+
     return GiteagleConfig(**config_data)
 
 
@@ -105,6 +150,9 @@ def save_config(config: GiteagleConfig, path: Optional[Path] = None) -> None:
     for platform in ["github", "gitlab", "bitbucket"]:
         if data[platform]["token"]:
             data[platform]["token"] = data[platform]["token"].get_secret_value()
+        data[platform]["tokens"] = [token.get_secret_value() for token in data[platform]["tokens"]]
+
+    import yaml
 
     with open(config_path, "w") as f:
         yaml.dump(data, f, default_flow_style=False)
@@ -1,7 +1,17 @@
 """Core data models and business logic."""
 
 from giteagle.core.aggregator import ActivityAggregator
+from giteagle.core.columnar import ActivityTable
+from giteagle.core.interning import EntityRegistry
 from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+from giteagle.core.records import (
+    ActivityRecord,
+    CommitRecord,
+    IssueRecord,
+    PullRequestRecord,
+    to_record,
+)
+from giteagle.core.store import ActivityStore, SyncState
 
 __all__ = [
     "Activity",
@@ -9,4 +19,13 @@ __all__ = [
     "Contributor",
     "Repository",
     "ActivityAggregator",
+    "ActivityTable",
+    "EntityRegistry",
+    "ActivityRecord",
+    "CommitRecord",
+    "PullRequestRecord",
+    "IssueRecord",
+    "to_record",
+    "ActivityStore",
+    "SyncState",
 ]
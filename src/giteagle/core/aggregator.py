@@ -1,11 +1,20 @@
 """Activity aggregation engine for combining data from multiple repositories."""
 
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Callable, Optional
+from datetime import datetime
+from typing import Any, Callable, Optional
 
+from giteagle.core.columnar import ActivityTable
+from giteagle.core.interning import EntityRegistry
 from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+from giteagle.core.records import ActivityRecord, to_record
+from giteagle.core.store import ActivityStore, activity_updated_at
+from giteagle.core.timeline import count_buckets, wall_clock_us
 
 
 @dataclass
@@ -45,22 +54,251 @@ class RepositoryStats:
 
 
 class ActivityAggregator:
-    """Aggregates and analyzes activities across multiple repositories."""
+    """Aggregates and analyzes activities across multiple repositories.
 
-    def __init__(self) -> None:
-        self._activities: list[Activity] = []
+    Activities are unique by id: adding one again replaces the earlier copy.
+    By default activities are held in memory, indexed by repository,
+    contributor, type and timestamp so filters only visit matching activities.
+    Constructed over an :class:`ActivityStore`, the aggregator reads and writes
+    the store instead, and filters, counts and timelines run as indexed SQL
+    queries; results are then ordered newest first rather than by insertion.
 
-    def add_activities(self, activities: list[Activity]) -> None:
-        """Add activities to the aggregator."""
-        self._activities.extend(activities)
+    Activities held in memory are pointed at shared repository and contributor
+    instances from an :class:`EntityRegistry`, so a contributor seen thousands
+    of times is held once.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ActivityStore] = None,
+        entities: Optional[EntityRegistry] = None,
+    ) -> None:
+        self._activities: list[Activity] = []
+        self._store = store
+        self._entities = entities if entities is not None else EntityRegistry()
+        self._rows_by_id: dict[str, int] = {}
+        # Posting lists of row numbers into self._activities, kept in ascending
+        # (insertion) order.
+        self._by_repository: dict[str, list[int]] = {}
+        self._by_contributor: dict[str, list[int]] = {}
+        self._by_type: dict[ActivityType, list[int]] = {}
+        # Row numbers ordered by timestamp, with the timestamps alongside for
+        # bisect. Re-sorted lazily on the first time-range query after an add.
+        self._time_rows: list[int] = []
+        self._times: list[datetime] = []
+        self._time_index_stale = False
+        # Wall-clock time of each row as epoch microseconds, for timeline buckets
+        self._wall_times = array("q")
+        # Compact record of each row, built on first request by records()
+        self._records: list[Optional[ActivityRecord]] = []
+        # Running bounds, so unfiltered aggregates need no scan. Per-group
+        # counts are the lengths of the posting lists above.
+        self._first_timestamp: Optional[datetime] = None
+        self._last_timestamp: Optional[datetime] = None
+        self._bounds_stale = False
+
+    @classmethod
+    def from_table(
+        cls, table: ActivityTable, store: Optional[ActivityStore] = None
+    ) -> "ActivityAggregator":
+        """Create an aggregator holding the activities of a columnar table."""
+        aggregator = cls(store)
+        aggregator.add_activities(table.to_activities())
+        return aggregator
+
+    def to_table(self) -> ActivityTable:
+        """Return the activities as a columnar table, in the order of :attr:`activities`."""
+        return ActivityTable.from_activities(self.activities)
+
+    def add_activities(self, activities: Iterable[Activity]) -> None:
+        """Add activities, replacing any already held with the same id.
+
+        The held copy is kept if it was updated more recently than the new one,
+        so overlapping windows and repeated fetches can be added again without
+        double counting. Each activity costs amortized O(1).
+        """
+        if self._store is not None:
+            self._store.add_activities(activities)
+            return
+
+        intern = self._entities.intern_activity
+        for activity in activities:
+            intern(activity)
+            row = self._rows_by_id.get(activity.id)
+            if row is None:
+                self._append(activity)
+            else:
+                self._replace(row, activity)
+
+    def _append(self, activity: Activity) -> None:
+        """Add a new activity to the end of the table and its indexes."""
+        row = len(self._activities)
+        self._activities.append(activity)
+        self._rows_by_id[activity.id] = row
+        self._by_repository.setdefault(activity.repository.full_name, []).append(row)
+        self._by_contributor.setdefault(activity.contributor.username, []).append(row)
+        self._by_type.setdefault(activity.type, []).append(row)
+        self._time_rows.append(row)
+        self._time_index_stale = True
+        self._wall_times.append(wall_clock_us(activity.timestamp))
+        self._records.append(None)
+        self._extend_bounds(activity.timestamp)
+
+    def _replace(self, row: int, activity: Activity) -> None:
+        """Replace the activity in a row unless the held copy is newer."""
+        old = self._activities[row]
+        if activity_updated_at(activity) < activity_updated_at(old):
+            return
+        self._activities[row] = activity
+        self._records[row] = None
+
+        moves: list[tuple[dict[Any, list[int]], Any, Any]] = [
+            (self._by_repository, old.repository.full_name, activity.repository.full_name),
+            (self._by_contributor, old.contributor.username, activity.contributor.username),
+            (self._by_type, old.type, activity.type),
+        ]
+        for index, old_key, new_key in moves:
+            if old_key != new_key:
+                rows = index[old_key]
+                del rows[bisect_left(rows, row)]
+                if not rows:
+                    del index[old_key]
+                insort(index.setdefault(new_key, []), row)
+
+        if activity.timestamp != old.timestamp:
+            self._time_index_stale = True
+            self._wall_times[row] = wall_clock_us(activity.timestamp)
+            if old.timestamp in (self._first_timestamp, self._last_timestamp):
+                # The old timestamp may have been the only one at a bound
+                self._bounds_stale = True
+            self._extend_bounds(activity.timestamp)
+
+    def _extend_bounds(self, timestamp: datetime) -> None:
+        if self._first_timestamp is None or timestamp < self._first_timestamp:
+            self._first_timestamp = timestamp
+        if self._last_timestamp is None or timestamp > self._last_timestamp:
+            self._last_timestamp = timestamp
 
     def clear(self) -> None:
         """Clear all stored activities."""
+        if self._store is not None:
+            self._store.clear()
+            return
         self._activities.clear()
+        self._by_repository.clear()
+        self._by_contributor.clear()
+        self._by_type.clear()
+        self._time_rows.clear()
+        self._times.clear()
+        self._time_index_stale = False
+        del self._wall_times[:]
+        self._records.clear()
+        self._first_timestamp = None
+        self._last_timestamp = None
+        self._bounds_stale = False
+        self._rows_by_id.clear()
+
+    def remove_activities(self, activities: Iterable[Activity]) -> int:
+        """Remove activities, matched by id. Returns the number removed.
+
+        Unlike adding, removal rebuilds the in-memory indexes, in O(n).
+        """
+        ids = {activity.id for activity in activities}
+        if self._store is not None:
+            return self._store.remove_activities(ids)
+
+        kept = [activity for activity in self._activities if activity.id not in ids]
+        removed = len(self._activities) - len(kept)
+        if removed:
+            self.clear()
+            self.add_activities(kept)
+        return removed
+
+    def _sorted_time_rows(self) -> list[int]:
+        """Return the rows in timestamp order, re-sorting the time index if it is stale."""
+        if self._time_index_stale:
+            activities = self._activities
+            # Mostly-sorted input (new rows appended to a sorted run) sorts in near O(n)
+            self._time_rows.sort(key=lambda row: activities[row].timestamp)
+            self._times = [activities[row].timestamp for row in self._time_rows]
+            self._time_index_stale = False
+        return self._time_rows
+
+    def _newest_first_rows(self) -> list[int]:
+        """Return the rows newest first, ties in insertion order, read off the time index."""
+        rows = self._sorted_time_rows()
+        times = self._times
+        result: list[int] = []
+        hi = len(rows)
+        while hi:
+            lo = bisect_left(times, times[hi - 1], 0, hi)
+            group = rows[lo:hi]
+            if len(group) > 1:
+                # Stable sorts keep ties in index order, which replaced rows can disturb
+                group.sort()
+            result.extend(group)
+            hi = lo
+        return result
+
+    def _time_range(self, since: Optional[datetime], until: Optional[datetime]) -> tuple[int, int]:
+        """Return the slice of the time index between since and until, inclusive."""
+        self._sorted_time_rows()
+        lo = bisect_left(self._times, since) if since is not None else 0
+        hi = bisect_right(self._times, until) if until is not None else len(self._times)
+        return lo, max(lo, hi)
+
+    def _match_rows(
+        self,
+        repositories: Optional[list[Repository]],
+        contributors: Optional[list[str]],
+        activity_types: Optional[list[ActivityType]],
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> Optional[list[int]]:
+        """Return matching row numbers in insertion order, or None if nothing is filtered."""
+
+        def postings(index: dict[Any, list[int]], keys: Iterable[Any]) -> set[int]:
+            rows: set[int] = set()
+            for key in keys:
+                rows.update(index.get(key, ()))
+            return rows
+
+        groups: list[set[int]] = []
+        if repositories:
+            groups.append(postings(self._by_repository, {r.full_name for r in repositories}))
+        if contributors:
+            groups.append(postings(self._by_contributor, set(contributors)))
+        if activity_types:
+            groups.append(postings(self._by_type, set(activity_types)))
+
+        matched: Optional[set[int]] = None
+        if groups:
+            # Intersect starting from the smallest posting list
+            groups.sort(key=len)
+            matched = groups[0].intersection(*groups[1:])
+
+        if since is not None or until is not None:
+            lo, hi = self._time_range(since, until)
+            if matched is None:
+                matched = set(self._time_rows[lo:hi])
+            elif hi - lo < len(matched):
+                matched.intersection_update(self._time_rows[lo:hi])
+            else:
+                activities = self._activities
+                matched = {
+                    row
+                    for row in matched
+                    if (since is None or activities[row].timestamp >= since)
+                    and (until is None or activities[row].timestamp <= until)
+                }
+
+        return None if matched is None else sorted(matched)
 
     @property
     def activities(self) -> list[Activity]:
         """Return all stored activities."""
+        if self._store is not None:
+            return self._store.query()
         return self._activities.copy()
 
     def filter(
@@ -74,31 +312,63 @@ class ActivityAggregator:
         predicate: Optional[Callable[[Activity], bool]] = None,
     ) -> list[Activity]:
         """Filter activities based on criteria."""
-        result = self._activities
-
-        if repositories:
-            repo_set = {r.full_name for r in repositories}
-            result = [a for a in result if a.repository.full_name in repo_set]
-
-        if contributors:
-            contrib_set = set(contributors)
-            result = [a for a in result if a.contributor.username in contrib_set]
-
-        if activity_types:
-            type_set = set(activity_types)
-            result = [a for a in result if a.type in type_set]
-
-        if since:
-            result = [a for a in result if a.timestamp >= since]
+        if self._store is not None:
+            matches = self._store.query(
+                repositories=[r.full_name for r in repositories or []],
+                contributors=contributors,
+                activity_types=activity_types,
+                since=since,
+                until=until,
+            )
+            return [a for a in matches if predicate(a)] if predicate else matches
 
-        if until:
-            result = [a for a in result if a.timestamp <= until]
+        rows = self._match_rows(repositories, contributors, activity_types, since, until)
+        if rows is None:
+            result = self._activities.copy()
+        else:
+            result = [self._activities[row] for row in rows]
 
         if predicate:
             result = [a for a in result if predicate(a)]
 
         return result
 
+    def records(
+        self,
+        *,
+        repositories: Optional[list[Repository]] = None,
+        contributors: Optional[list[str]] = None,
+        activity_types: Optional[list[ActivityType]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[ActivityRecord]:
+        """Filter activities like :meth:`filter`, returned as compact records.
+
+        Each held activity is converted once and its record reused until the
+        activity is replaced.
+        """
+        if self._store is not None:
+            return [
+                to_record(activity)
+                for activity in self.filter(
+                    repositories=repositories,
+                    contributors=contributors,
+                    activity_types=activity_types,
+                    since=since,
+                    until=until,
+                )
+            ]
+
+        rows = self._match_rows(repositories, contributors, activity_types, since, until)
+        cache = self._records
+        result: list[ActivityRecord] = []
+        for row in range(len(cache)) if rows is None else rows:
+            record = cache[row]
+            if record is None:
+                record = cache[row] = to_record(self._activities[row])
+            result.append(record)
+        return result
+
     def aggregate(
         self,
         *,
@@ -109,6 +379,34 @@ class ActivityAggregator:
         until: Optional[datetime] = None,
     ) -> AggregationResult:
         """Aggregate activities and compute statistics."""
+        if self._store is not None:
+            return self._aggregate_store(
+                self._store,
+                repositories=[r.full_name for r in repositories or []],
+                contributors=contributors,
+                activity_types=activity_types,
+                since=since,
+                until=until,
+            )
+
+        if not (repositories or contributors or activity_types or since or until):
+            # Served from the running counts and bounds
+            if self._bounds_stale:
+                timestamps = [a.timestamp for a in self._activities]
+                self._first_timestamp = min(timestamps, default=None)
+                self._last_timestamp = max(timestamps, default=None)
+                self._bounds_stale = False
+            activities = self._activities
+            return AggregationResult(
+                # Newest first, read off the time index instead of sorting again
+                activities=[activities[row] for row in self._newest_first_rows()],
+                total_count=len(self._activities),
+                by_repository={name: len(rows) for name, rows in self._by_repository.items()},
+                by_contributor={name: len(rows) for name, rows in self._by_contributor.items()},
+                by_type={type_: len(rows) for type_, rows in self._by_type.items()},
+                date_range=(self._first_timestamp, self._last_timestamp),
+            )
+
         filtered = self.filter(
             repositories=repositories,
             contributors=contributors,
@@ -146,9 +444,26 @@ class ActivityAggregator:
 
         return result
 
+    @staticmethod
+    def _aggregate_store(store: ActivityStore, **filters: Any) -> AggregationResult:
+        """Aggregate with grouped queries over the store."""
+        activities = store.query(**filters)
+        return AggregationResult(
+            activities=activities,
+            total_count=len(activities),
+            by_repository=dict(store.count_by("repository", **filters)),
+            by_contributor=dict(store.count_by("contributor", **filters)),
+            by_type={ActivityType(key): count for key, count in store.count_by("type", **filters)},
+            date_range=store.date_range(**filters),
+        )
+
     def get_contributor_stats(self, username: str) -> Optional[ContributorStats]:
         """Get statistics for a specific contributor."""
-        user_activities = [a for a in self._activities if a.contributor.username == username]
+        if self._store is not None:
+            user_activities = self._store.query(contributors=[username])
+        else:
+            rows = self._by_contributor.get(username, [])
+            user_activities = [self._activities[row] for row in rows]
 
         if not user_activities:
             return None
@@ -171,9 +486,11 @@ class ActivityAggregator:
 
     def get_repository_stats(self, repository: Repository) -> Optional[RepositoryStats]:
         """Get statistics for a specific repository."""
-        repo_activities = [
-            a for a in self._activities if a.repository.full_name == repository.full_name
-        ]
+        if self._store is not None:
+            repo_activities = self._store.query(repositories=[repository.full_name])
+        else:
+            rows = self._by_repository.get(repository.full_name, [])
+            repo_activities = [self._activities[row] for row in rows]
 
         if not repo_activities:
             return None
@@ -199,43 +516,73 @@ class ActivityAggregator:
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
     ) -> dict[str, int]:
-        """Get activity counts grouped by time period."""
-        filtered = self.filter(since=since, until=until)
-
-        timeline: dict[str, int] = defaultdict(int)
-
-        for activity in filtered:
-            if granularity == "hour":
-                key = activity.timestamp.strftime("%Y-%m-%d %H:00")
-            elif granularity == "day":
-                key = activity.timestamp.strftime("%Y-%m-%d")
-            elif granularity == "week":
-                # Get the Monday of the week
-                monday = activity.timestamp - timedelta(days=activity.timestamp.weekday())
-                key = monday.strftime("%Y-%m-%d")
-            elif granularity == "month":
-                key = activity.timestamp.strftime("%Y-%m")
-            else:
-                key = activity.timestamp.strftime("%Y-%m-%d")
-
-            timeline[key] += 1
+        """Get activity counts grouped by time period.
+
+        Periods follow each activity's own wall-clock time; weeks are keyed by
+        their Monday.
+        """
+        if self._store is not None:
+            return self._store.timeline(granularity, since=since, until=until)
+
+        rows = self._match_rows(None, None, None, since, until)
+        wall_times = self._wall_times
+        return count_buckets(
+            wall_times if rows is None else [wall_times[row] for row in rows], granularity
+        )
 
-        return dict(sorted(timeline.items()))
+    def get_activity_timeline_by(
+        self,
+        split_by: str,
+        *,
+        granularity: str = "day",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> dict[str, dict[str, int]]:
+        """Get a timeline per repository or per activity type.
+
+        ``split_by`` is ``"repository"`` or ``"type"``; timelines are keyed by
+        repository full name or type value.
+        """
+        if self._store is not None:
+            return self._store.timeline_by(split_by, granularity, since=since, until=until)
+
+        index: dict[Any, list[int]]
+        if split_by == "repository":
+            index = self._by_repository
+        elif split_by == "type":
+            index = self._by_type
+        else:
+            raise ValueError(f"Cannot split by {split_by!r}")
+
+        matched = self._match_rows(None, None, None, since, until)
+        rows_in_range = None if matched is None else set(matched)
+        wall_times = self._wall_times
+        timelines: dict[str, dict[str, int]] = {}
+        for key, rows in index.items():
+            if rows_in_range is not None:
+                rows = [row for row in rows if row in rows_in_range]
+            if rows:
+                label = key.value if isinstance(key, ActivityType) else key
+                timelines[label] = count_buckets([wall_times[row] for row in rows], granularity)
+        return timelines
 
     def get_top_contributors(self, limit: int = 10) -> list[tuple[str, int]]:
         """Get the top contributors by activity count."""
-        counts: dict[str, int] = defaultdict(int)
-        for activity in self._activities:
-            counts[activity.contributor.username] += 1
-
-        sorted_contributors = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-        return sorted_contributors[:limit]
+        if self._store is not None:
+            return self._store.count_by("contributor", limit=limit)
+        return self._top(self._by_contributor, limit)
 
     def get_most_active_repositories(self, limit: int = 10) -> list[tuple[str, int]]:
         """Get the most active repositories by activity count."""
-        counts: dict[str, int] = defaultdict(int)
-        for activity in self._activities:
-            counts[activity.repository.full_name] += 1
-
-        sorted_repos = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-        return sorted_repos[:limit]
+        if self._store is not None:
+            return self._store.count_by("repository", limit=limit)
+        return self._top(self._by_repository, limit)
+
+    @staticmethod
+    def _top(index: dict[str, list[int]], limit: int) -> list[tuple[str, int]]:
+        """Return the keys with the longest posting lists, in O(k log limit).
+
+        Ties keep first-seen order, as a stable sort by count would.
+        """
+        counts = ((key, len(rows)) for key, rows in index.items())
+        return heapq.nlargest(limit, counts, key=lambda item: item[1])
@@ -0,0 +1,317 @@
+"""Columnar, array-backed activity table for analytics over many activities."""
+
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from pydantic import HttpUrl
+
+from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+from giteagle.core.timeline import (
+    _NOT_LOADED,
+    _load_numpy,
+    count_buckets,
+    count_buckets_by,
+    epoch_us,
+)
+
+# numpy, or None if not installed; imported on first use to keep startup fast
+_np: Any = _NOT_LOADED
+
+
+def _numpy() -> Any:
+    """Return the numpy module or None, importing it on the first call."""
+    global _np
+    if _np is _NOT_LOADED:
+        _np = _load_numpy()
+    return _np
+
+
+def _view(column: array) -> Any:
+    """Return a zero-copy numpy view of an array column."""
+    # array typecodes and numpy type characters name the same C types
+    return _numpy().frombuffer(column, dtype=column.typecode)
+
+
+_TYPES = list(ActivityType)
+_TYPE_CODES = {activity_type: code for code, activity_type in enumerate(_TYPES)}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+# utc_offset value marking a naive timestamp
+_NAIVE = -(2**31)
+
+
+class ActivityTable:
+    """Activities stored column by column, for counting and bucketing at scale.
+
+    Repositories and contributors are interned into integer codes, so each
+    entity is held once however many activities reference it; a contributor is
+    identified by username, as :class:`Contributor` equality is. Timestamps are
+    int64 microseconds since the epoch plus a UTC offset column, so converting
+    back restores the offset but not a named timezone.
+
+    Filters, counts and timelines are computed with numpy over the columns when
+    it is installed, and with plain loops over the same arrays otherwise.
+    """
+
+    def __init__(self) -> None:
+        self._ids: list[str] = []
+        self._repository_codes = array("i")
+        self._contributor_codes = array("i")
+        self._type_codes = array("b")
+        self._timestamps = array("q")
+        self._utc_offsets = array("i")
+        self._titles: list[str] = []
+        self._descriptions: list[Optional[str]] = []
+        self._urls: list[Optional[HttpUrl]] = []
+        self._metadata: list[dict] = []
+
+        self._repositories: list[Repository] = []
+        self._repository_index: dict[tuple[str, str], int] = {}
+        self._contributors: list[Contributor] = []
+        self._contributor_index: dict[str, int] = {}
+
+    @classmethod
+    def from_activities(cls, activities: Iterable[Activity]) -> "ActivityTable":
+        """Build a table from activities."""
+        table = cls()
+        table.extend(activities)
+        return table
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def append(self, activity: Activity) -> None:
+        """Add an activity as a new row."""
+        repository = activity.repository
+        repository_key = (repository.platform, repository.full_name)
+        repository_code = self._repository_index.get(repository_key)
+        if repository_code is None:
+            repository_code = len(self._repositories)
+            self._repositories.append(repository)
+            self._repository_index[repository_key] = repository_code
+
+        username = activity.contributor.username
+        contributor_code = self._contributor_index.get(username)
+        if contributor_code is None:
+            contributor_code = len(self._contributors)
+            self._contributors.append(activity.contributor)
+            self._contributor_index[username] = contributor_code
+
+        offset = activity.timestamp.utcoffset()
+        self._ids.append(activity.id)
+        self._repository_codes.append(repository_code)
+        self._contributor_codes.append(contributor_code)
+        self._type_codes.append(_TYPE_CODES[activity.type])
+        self._timestamps.append(epoch_us(activity.timestamp))
+        self._utc_offsets.append(_NAIVE if offset is None else int(offset.total_seconds()))
+        self._titles.append(activity.title)
+        self._descriptions.append(activity.description)
+        self._urls.append(activity.url)
+        self._metadata.append(activity.metadata)
+
+    def extend(self, activities: Iterable[Activity]) -> None:
+        """Add activities as new rows."""
+        for activity in activities:
+            self.append(activity)
+
+    def _timestamp(self, row: int) -> datetime:
+        """Rebuild the timestamp of a row."""
+        offset = self._utc_offsets[row]
+        if offset == _NAIVE:
+            return _EPOCH_NAIVE + timedelta(microseconds=self._timestamps[row])
+        tz = timezone.utc if offset == 0 else timezone(timedelta(seconds=offset))
+        return (_EPOCH + timedelta(microseconds=self._timestamps[row])).astimezone(tz)
+
+    def _activity(self, row: int) -> Activity:
+        """Rebuild the activity in a row."""
+        return Activity(
+            id=self._ids[row],
+            type=_TYPES[self._type_codes[row]],
+            repository=self._repositories[self._repository_codes[row]],
+            contributor=self._contributors[self._contributor_codes[row]],
+            timestamp=self._timestamp(row),
+            title=self._titles[row],
+            description=self._descriptions[row],
+            url=self._urls[row],
+            metadata=self._metadata[row],
+        )
+
+    def _select(
+        self,
+        repositories: Optional[Iterable[Repository]] = None,
+        contributors: Optional[Iterable[str]] = None,
+        activity_types: Optional[Iterable[ActivityType]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Any:
+        """Return the matching row numbers in ascending order, or None for all rows.
+
+        The rows are a numpy array when numpy is available, else a list.
+        """
+        code_filters: list[tuple[array, set[int]]] = []
+        if repositories:
+            names = {r.full_name for r in repositories}
+            codes = {c for (_, name), c in self._repository_index.items() if name in names}
+            code_filters.append((self._repository_codes, codes))
+        if contributors:
+            index = self._contributor_index
+            codes = {index[username] for username in contributors if username in index}
+            code_filters.append((self._contributor_codes, codes))
+        if activity_types:
+            code_filters.append((self._type_codes, {_TYPE_CODES[t] for t in activity_types}))
+        low = epoch_us(since) if since is not None else None
+        high = epoch_us(until) if until is not None else None
+
+        if not code_filters and low is None and high is None:
+            return None
+
+        np = _numpy()
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            for column, codes in code_filters:
+                mask &= np.isin(_view(column), list(codes))
+            timestamps = _view(self._timestamps)
+            if low is not None:
+                mask &= timestamps >= low
+            if high is not None:
+                mask &= timestamps <= high
+            return np.flatnonzero(mask)
+
+        rows: Iterable[int] = range(len(self))
+        for column, codes in code_filters:
+            rows = [row for row in rows if column[row] in codes]
+        if low is not None:
+            rows = [row for row in rows if self._timestamps[row] >= low]
+        if high is not None:
+            rows = [row for row in rows if self._timestamps[row] <= high]
+        return list(rows)
+
+    def to_activities(self, **filters: Any) -> list[Activity]:
+        """Return the activities in matching rows, in row order.
+
+        Accepts the filters of :meth:`ActivityAggregator.filter`, except ``predicate``.
+        """
+        rows = self._select(**filters)
+        return [self._activity(int(row)) for row in (range(len(self)) if rows is None else rows)]
+
+    def count(self, **filters: Any) -> int:
+        """Return the number of matching rows."""
+        rows = self._select(**filters)
+        return len(self) if rows is None else len(rows)
+
+    def count_by(
+        self,
+        column: str,
+        *,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> list[tuple[str, int]]:
+        """Count matching rows per repository, contributor or type, largest first.
+
+        Ties keep the order in which the keys were first added.
+        """
+        if column == "repository":
+            codes, labels = (
+                self._repository_codes,
+                [repository.full_name for repository in self._repositories],
+            )
+        elif column == "contributor":
+            codes, labels = (
+                self._contributor_codes,
+                [contributor.username for contributor in self._contributors],
+            )
+        elif column == "type":
+            codes, labels = self._type_codes, [t.value for t in _TYPES]
+        else:
+            raise ValueError(f"Cannot group by {column!r}")
+        rows = self._select(**filters)
+
+        np = _numpy()
+        if np is not None:
+            selected = _view(codes) if rows is None else _view(codes)[rows]
+            per_code = np.bincount(selected, minlength=len(labels)).tolist()
+        else:
+            tally = Counter(codes if rows is None else (codes[row] for row in rows))
+            per_code = [tally[code] for code in range(len(labels))]
+
+        counts: dict[str, int] = {}
+        for label, n in zip(labels, per_code):
+            if n:
+                counts[label] = counts.get(label, 0) + n
+        ranked = sorted(counts.items(), key=lambda item: -item[1])
+        return ranked[:limit] if limit is not None else ranked
+
+    def date_range(self, **filters: Any) -> tuple[Optional[datetime], Optional[datetime]]:
+        """Return the earliest and latest timestamps of matching rows."""
+        rows = self._select(**filters)
+        if rows is None:
+            rows = range(len(self))
+        if len(rows) == 0:
+            return None, None
+        np = _numpy()
+        if np is not None:
+            timestamps = _view(self._timestamps)[rows]
+            first, last = rows[int(timestamps.argmin())], rows[int(timestamps.argmax())]
+        else:
+            first = min(rows, key=self._timestamps.__getitem__)
+            last = max(rows, key=self._timestamps.__getitem__)
+        return self._timestamp(int(first)), self._timestamp(int(last))
+
+    def _wall_times(self, rows: Any) -> Any:
+        """Return the wall-clock times of rows (all rows if None) as epoch microseconds."""
+        np = _numpy()
+        if np is not None:
+            timestamps = _view(self._timestamps)
+            offsets = _view(self._utc_offsets)
+            if rows is not None:
+                timestamps, offsets = timestamps[rows], offsets[rows]
+            return timestamps + np.where(offsets == _NAIVE, 0, offsets).astype(np.int64) * 1_000_000
+        wall_times = []
+        for row in range(len(self)) if rows is None else rows:
+            offset = self._utc_offsets[row]
+            wall_times.append(
+                self._timestamps[row] + (0 if offset == _NAIVE else offset * 1_000_000)
+            )
+        return wall_times
+
+    def timeline(self, granularity: str = "day", **filters: Any) -> dict[str, int]:
+        """Count matching rows per time bucket, in bucket order.
+
+        Buckets follow each activity's own wall-clock time and use the keys of
+        :meth:`ActivityAggregator.get_activity_timeline`.
+        """
+        return count_buckets(self._wall_times(self._select(**filters)), granularity)
+
+    def timeline_by(
+        self, split_by: str, granularity: str = "day", **filters: Any
+    ) -> dict[str, dict[str, int]]:
+        """Count matching rows per repository or type and time bucket.
+
+        Returns a :meth:`timeline` for each repository full name or type value.
+        """
+        if split_by == "repository":
+            column, labels = (
+                self._repository_codes,
+                [repository.full_name for repository in self._repositories],
+            )
+        elif split_by == "type":
+            column, labels = self._type_codes, [t.value for t in _TYPES]
+        else:
+            raise ValueError(f"Cannot split by {split_by!r}")
+        rows = self._select(**filters)
+        np = _numpy()
+        if np is not None:
+            codes = _view(column) if rows is None else _view(column)[rows]
+        else:
+            codes = column if rows is None else [column[row] for row in rows]
+
+        timelines: dict[str, dict[str, int]] = {}
+        for code, counts in count_buckets_by(self._wall_times(rows), codes, granularity).items():
+            timeline = timelines.setdefault(labels[code], {})
+            for key, n in counts.items():
+                timeline[key] = timeline.get(key, 0) + n
+        return {label: dict(sorted(counts.items())) for label, counts in timelines.items()}
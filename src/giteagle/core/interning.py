@@ -0,0 +1,109 @@
+"""Shared instances of repositories and contributors."""
+
+from typing import Any, Optional
+
+from giteagle.core.models import Activity, Contributor, Repository
+
+
+class EntityRegistry:
+    """Hands out one shared instance per repository and contributor.
+
+    Repositories are keyed like :meth:`Repository.__hash__` and contributors by
+    username. An entity is only shared while all its fields match the held
+    instance; one that differs, such as a commit author with another email,
+    replaces it as the shared instance, so no data is ever swapped out.
+    """
+
+    def __init__(self) -> None:
+        self._repositories: dict[tuple[str, str, str], tuple[tuple, Repository]] = {}
+        self._contributors: dict[str, tuple[tuple, Contributor]] = {}
+
+    def __len__(self) -> int:
+        return len(self._repositories) + len(self._contributors)
+
+    def repository(
+        self,
+        *,
+        name: str,
+        owner: str,
+        platform: str,
+        url: Any,
+        description: Optional[str] = None,
+        default_branch: str = "main",
+        is_private: bool = False,
+    ) -> Repository:
+        """Return the shared repository with these fields, creating it if needed."""
+        key = (platform, owner, name)
+        details = (str(url), description, default_branch, is_private)
+        held = self._repositories.get(key)
+        if held is not None and held[0] == details:
+            return held[1]
+        repository = Repository(
+            name=name,
+            owner=owner,
+            platform=platform,
+            url=url,
+            description=description,
+            default_branch=default_branch,
+            is_private=is_private,
+        )
+        self._repositories[key] = (details, repository)
+        return repository
+
+    def contributor(
+        self,
+        username: str,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+        avatar_url: Optional[str] = None,
+    ) -> Contributor:
+        """Return the shared contributor with these fields, creating it if needed."""
+        details = (name, email, avatar_url)
+        held = self._contributors.get(username)
+        if held is not None and held[0] == details:
+            return held[1]
+        contributor = Contributor(username=username, name=name, email=email, avatar_url=avatar_url)
+        self._contributors[username] = (details, contributor)
+        return contributor
+
+    def intern_repository(self, repository: Repository) -> Repository:
+        """Return the shared instance equal to a repository in every field."""
+        key = (repository.platform, repository.owner, repository.name)
+        details = (
+            str(repository.url),
+            repository.description,
+            repository.default_branch,
+            repository.is_private,
+        )
+        held = self._repositories.get(key)
+        if held is not None and held[0] == details:
+            return held[1]
+        self._repositories[key] = (details, repository)
+        return repository
+
+    def intern_contributor(self, contributor: Contributor) -> Contributor:
+        """Return the shared instance equal to a contributor in every field."""
+        details = (contributor.name, contributor.email, contributor.avatar_url)
+        held = self._contributors.get(contributor.username)
+        if held is not None and held[0] == details:
+            return held[1]
+        self._contributors[contributor.username] = (details, contributor)
+        return contributor
+
+    def intern_activity(self, activity: Activity) -> Activity:
+        """Point an activity at the shared repository and contributor instances.
+
+        The activity is updated in place and returned.
+        """
+        repository = self.intern_repository(activity.repository)
+        if repository is not activity.repository:
+            activity.repository = repository
+        contributor = self.intern_contributor(activity.contributor)
+        if contributor is not activity.contributor:
+            activity.contributor = contributor
+        return activity
+
+    def clear(self) -> None:
+        """Forget all shared instances."""
+        self._repositories.clear()
+        self._contributors.clear()
@@ -65,7 +65,12 @@ class Repository(BaseModel):
 
 
 class Activity(BaseModel):
-    """An activity event in a repository."""
+    """An activity event in a repository.
+
+    Timestamps in ``metadata`` (``updated_at``, ``merged_at`` and the like) are
+    datetimes, or None where the platform gave none; they become ISO 8601
+    strings only when an activity is serialized to JSON.
+    """
 
     id: str = Field(..., description="Unique identifier for this activity")
     type: ActivityType = Field(..., description="Type of activity")
@@ -0,0 +1,173 @@
+"""Compact, typed records of activities for reports."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from giteagle.core.models import Activity, ActivityType
+from giteagle.core.timestamps import parse_optional_timestamp
+
+
+class ActivityRecord:
+    """The fields of an activity that reports read, held in slots.
+
+    Records are built once from an :class:`Activity`, with repository and
+    contributor reduced to their keys and metadata timestamps pulled out, so
+    renderers read attributes instead of looking up metadata. Metadata
+    timestamps given as ISO 8601 strings rather than datetimes are parsed.
+    Like activities, records are equal when their ids are.
+    """
+
+    __slots__ = ("id", "type", "repository", "author", "timestamp", "title", "updated_at")
+
+    def __init__(
+        self,
+        id: str,
+        type: ActivityType,
+        repository: str,
+        author: str,
+        timestamp: datetime,
+        title: str,
+        updated_at: Optional[datetime] = None,
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.repository = repository
+        self.author = author
+        self.timestamp = timestamp
+        self.title = title
+        self.updated_at = updated_at if updated_at is not None else timestamp
+
+    @classmethod
+    def _common_fields(cls, activity: Activity) -> dict[str, Any]:
+        return {
+            "id": activity.id,
+            "type": activity.type,
+            "repository": activity.repository.full_name,
+            "author": activity.contributor.username,
+            "timestamp": activity.timestamp,
+            "title": activity.title,
+            "updated_at": parse_optional_timestamp(activity.metadata.get("updated_at")),
+        }
+
+    @classmethod
+    def from_activity(cls, activity: Activity) -> "ActivityRecord":
+        """Build a record from an activity."""
+        return cls(**cls._common_fields(activity))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ActivityRecord):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r}, title={self.title!r})"
+
+
+class CommitRecord(ActivityRecord):
+    """A commit, with its sha and parent shas."""
+
+    __slots__ = ("sha", "parents")
+
+    def __init__(self, *, sha: str, parents: tuple[str, ...] = (), **fields: Any) -> None:
+        super().__init__(**fields)
+        self.sha = sha
+        self.parents = parents
+
+    @classmethod
+    def from_activity(cls, activity: Activity) -> "CommitRecord":
+        """Build a record from a commit activity."""
+        metadata = activity.metadata
+        return cls(
+            sha=metadata.get("sha", "???????"),
+            parents=tuple(metadata.get("parents", ())),
+            **cls._common_fields(activity),
+        )
+
+    @property
+    def is_merge(self) -> bool:
+        """Return whether the commit has more than one parent."""
+        return len(self.parents) > 1
+
+
+class PullRequestRecord(ActivityRecord):
+    """A pull request, with its number, state and merge and close times."""
+
+    __slots__ = ("number", "state", "merged", "merged_at", "closed_at")
+
+    def __init__(
+        self,
+        *,
+        number: Optional[int] = None,
+        state: Optional[str] = None,
+        merged: bool = False,
+        merged_at: Optional[datetime] = None,
+        closed_at: Optional[datetime] = None,
+        **fields: Any,
+    ) -> None:
+        super().__init__(**fields)
+        self.number = number
+        self.state = state
+        self.merged = merged
+        self.merged_at = merged_at
+        self.closed_at = closed_at
+
+    @classmethod
+    def from_activity(cls, activity: Activity) -> "PullRequestRecord":
+        """Build a record from a pull request activity."""
+        metadata = activity.metadata
+        return cls(
+            number=metadata.get("number"),
+            state=metadata.get("state"),
+            merged=bool(metadata.get("merged", False)),
+            merged_at=parse_optional_timestamp(metadata.get("merged_at")),
+            closed_at=parse_optional_timestamp(metadata.get("closed_at")),
+            **cls._common_fields(activity),
+        )
+
+
+class IssueRecord(ActivityRecord):
+    """An issue, with its number, state, close time and labels."""
+
+    __slots__ = ("number", "state", "closed_at", "labels")
+
+    def __init__(
+        self,
+        *,
+        number: Optional[int] = None,
+        state: Optional[str] = None,
+        closed_at: Optional[datetime] = None,
+        labels: tuple[str, ...] = (),
+        **fields: Any,
+    ) -> None:
+        super().__init__(**fields)
+        self.number = number
+        self.state = state
+        self.closed_at = closed_at
+        self.labels = labels
+
+    @classmethod
+    def from_activity(cls, activity: Activity) -> "IssueRecord":
+        """Build a record from an issue activity."""
+        metadata = activity.metadata
+        return cls(
+            number=metadata.get("number"),
+            state=metadata.get("state"),
+            closed_at=parse_optional_timestamp(metadata.get("closed_at")),
+            labels=tuple(metadata.get("labels", ())),
+            **cls._common_fields(activity),
+        )
+
+
+_RECORD_TYPES: dict[ActivityType, type[ActivityRecord]] = {
+    ActivityType.COMMIT: CommitRecord,
+    ActivityType.PULL_REQUEST: PullRequestRecord,
+    ActivityType.ISSUE: IssueRecord,
+}
+
+
+def to_record(activity: Activity) -> ActivityRecord:
+    """Build the record for an activity, of the class matching its type."""
+    return _RECORD_TYPES.get(activity.type, ActivityRecord).from_activity(activity)
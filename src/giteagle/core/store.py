@@ -0,0 +1,389 @@
+"""Durable local store of activities and incremental sync state."""
+
+import sqlite3
+import stat
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from giteagle.core.models import Activity, ActivityType, Repository
+from giteagle.core.timestamps import parse_optional_timestamp
+
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS activities (
+    id TEXT PRIMARY KEY,
+    platform TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    contributor TEXT NOT NULL,
+    type TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    local_time TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_activities_repo_updated
+    ON activities (platform, repository, updated_at);
+CREATE INDEX IF NOT EXISTS idx_activities_repo_time ON activities (repository, timestamp);
+CREATE INDEX IF NOT EXISTS idx_activities_contributor_time
+    ON activities (contributor, timestamp);
+CREATE INDEX IF NOT EXISTS idx_activities_type_time ON activities (type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_activities_time ON activities (timestamp);
+CREATE TABLE IF NOT EXISTS sync_state (
+    platform TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    type TEXT NOT NULL,
+    watermark REAL NOT NULL,
+    covered_since REAL NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (platform, repository, type)
+);
+"""
+
+
+def activity_updated_at(activity: Activity) -> datetime:
+    """Return when an activity last changed.
+
+    Pull requests and issues record ``updated_at`` in their metadata, and
+    commits the ``committed_at`` they landed at; for other activities this is
+    the activity timestamp.
+    """
+    metadata = activity.metadata
+    updated_at = parse_optional_timestamp(
+        metadata.get("updated_at") or metadata.get("committed_at")
+    )
+    return updated_at if updated_at is not None else activity.timestamp
+
+
+# Metadata timestamps the integrations store as datetimes; JSON gives them back as strings
+_METADATA_TIMESTAMPS = ("updated_at", "committed_at", "merged_at", "closed_at")
+
+
+def _load_activity(data: str) -> Activity:
+    """Load a stored activity, parsing its metadata timestamps back into datetimes."""
+    activity = Activity.model_validate_json(data)
+    metadata = activity.metadata
+    for key in _METADATA_TIMESTAMPS:
+        if key in metadata:
+            metadata[key] = parse_optional_timestamp(metadata[key])
+    return activity
+
+
+def _from_epoch(value: float) -> datetime:
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+# SQL expressions bucketing the activity's wall-clock time (ISO 8601 text in
+# the activity's own timezone), matching ActivityAggregator.get_activity_timeline
+_TIMELINE_BUCKETS = {
+    "hour": "substr(local_time, 1, 10) || ' ' || substr(local_time, 12, 2) || ':00'",
+    "day": "substr(local_time, 1, 10)",
+    # Step back six days, then forward to the next Monday: the week's Monday
+    "week": "date(substr(local_time, 1, 10), '-6 days', 'weekday 1')",
+    "month": "substr(local_time, 1, 7)",
+}
+
+_GROUP_COLUMNS = ("repository", "contributor", "type")
+
+
+@dataclass
+class SyncState:
+    """How far the stored history of one repository and activity type reaches.
+
+    ``watermark`` is the newest change already stored, and everything changed
+    since ``covered_since`` is known to be stored.
+    """
+
+    watermark: datetime
+    covered_since: datetime
+    synced_at: datetime
+
+
+class ActivityStore:
+    """SQLite-backed activity history with per-repository sync watermarks.
+
+    Activities are keyed by id, so storing an activity again replaces the
+    earlier copy unless that copy has a newer ``updated_at``. Timestamps must be
+    timezone-aware.
+    """
+
+    FILENAME = "activities.sqlite3"
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            # Stored history can always be refetched, so rebuild rather than migrate
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS activities; DROP TABLE IF EXISTS sync_state;"
+            )
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        # Stored activities may include private repository data
+        path.chmod(stat.S_IRUSR | stat.S_IWUSR)
+
+    @classmethod
+    def in_directory(cls, directory: Path) -> "ActivityStore":
+        """Open the store file inside a data directory."""
+        return cls(directory / cls.FILENAME)
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the store database."""
+        return self._path
+
+    def add_activities(self, activities: Iterable[Activity]) -> int:
+        """Insert activities, or update stored ones unless those were updated more recently.
+
+        Returns the number of activities given.
+        """
+        rows = [
+            (
+                activity.id,
+                activity.repository.platform,
+                activity.repository.full_name,
+                activity.contributor.username,
+                activity.type.value,
+                activity.timestamp.timestamp(),
+                activity.timestamp.isoformat(),
+                activity_updated_at(activity).timestamp(),
+                activity.model_dump_json(),
+            )
+            for activity in activities
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO activities "
+                "(id, platform, repository, contributor, type, timestamp, local_time, "
+                "updated_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET platform = excluded.platform, "
+                "repository = excluded.repository, contributor = excluded.contributor, "
+                "type = excluded.type, timestamp = excluded.timestamp, "
+                "local_time = excluded.local_time, updated_at = excluded.updated_at, "
+                "data = excluded.data WHERE excluded.updated_at >= activities.updated_at",
+                rows,
+            )
+        return len(rows)
+
+    def remove_activities(self, ids: Iterable[str]) -> int:
+        """Delete activities by id. Returns the number removed."""
+        with self._conn:
+            cursor = self._conn.executemany(
+                "DELETE FROM activities WHERE id = ?", [(activity_id,) for activity_id in ids]
+            )
+        return cursor.rowcount
+
+    def get_activities(
+        self,
+        repository: Repository,
+        *,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[Activity]:
+        """Return stored activities for a repository, newest first.
+
+        With ``since``, this matches what the API returns for the same window:
+        commits made since then and pull requests or issues updated since then.
+        """
+        query = "SELECT data FROM activities WHERE platform = ? AND repository = ?"
+        params: list[Any] = [repository.platform, repository.full_name]
+        if since is not None:
+            query += " AND updated_at >= ?"
+            params.append(since.timestamp())
+        query += " ORDER BY timestamp DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self._conn.execute(query, params).fetchall()
+        return [_load_activity(data) for (data,) in rows]
+
+    @staticmethod
+    def _where(
+        repositories: Optional[Iterable[str]] = None,
+        contributors: Optional[Iterable[str]] = None,
+        activity_types: Optional[Iterable[ActivityType]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> tuple[str, list[Any]]:
+        """Build a WHERE clause and its parameters from query filters."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, values in (
+            ("repository", repositories),
+            ("contributor", contributors),
+            ("type", [t.value for t in activity_types] if activity_types else None),
+        ):
+            values = list(values or ())
+            if values:
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append("timestamp <= ?")
+            params.append(until.timestamp())
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(
+        self,
+        *,
+        repositories: Optional[Iterable[str]] = None,
+        contributors: Optional[Iterable[str]] = None,
+        activity_types: Optional[Iterable[ActivityType]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[Activity]:
+        """Return activities matching the filters, newest first.
+
+        Repositories are given by full name. ``since`` and ``until`` bound the
+        activity timestamp, inclusively.
+        """
+        where, params = self._where(repositories, contributors, activity_types, since, until)
+        query = f"SELECT data FROM activities{where} ORDER BY timestamp DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self._conn.execute(query, params).fetchall()
+        return [_load_activity(data) for (data,) in rows]
+
+    def count(self, **filters: Any) -> int:
+        """Return the number of activities matching the filters of :meth:`query`."""
+        where, params = self._where(**filters)
+        (total,) = self._conn.execute(f"SELECT COUNT(*) FROM activities{where}", params).fetchone()
+        return int(total)
+
+    def count_by(
+        self,
+        column: str,
+        *,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> list[tuple[str, int]]:
+        """Count matching activities per repository, contributor or type, largest first."""
+        if column not in _GROUP_COLUMNS:
+            raise ValueError(f"Cannot group by {column!r}")
+        where, params = self._where(**filters)
+        query = (
+            f"SELECT {column}, COUNT(*) AS n FROM activities{where} "
+            f"GROUP BY {column} ORDER BY n DESC, MIN(rowid)"
+        )
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self._conn.execute(query, params).fetchall()
+
+    def date_range(self, **filters: Any) -> tuple[Optional[datetime], Optional[datetime]]:
+        """Return the earliest and latest timestamps of matching activities."""
+        where, params = self._where(**filters)
+        bounds: list[Optional[datetime]] = []
+        for order in ("ASC", "DESC"):
+            row = self._conn.execute(
+                f"SELECT local_time FROM activities{where} ORDER BY timestamp {order} LIMIT 1",
+                params,
+            ).fetchone()
+            bounds.append(datetime.fromisoformat(row[0]) if row else None)
+        return bounds[0], bounds[1]
+
+    def timeline(
+        self,
+        granularity: str = "day",
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> dict[str, int]:
+        """Count activities per time bucket, in bucket order."""
+        bucket = _TIMELINE_BUCKETS.get(granularity, _TIMELINE_BUCKETS["day"])
+        where, params = self._where(since=since, until=until)
+        rows = self._conn.execute(
+            f"SELECT {bucket} AS bucket, COUNT(*) FROM activities{where} "
+            "GROUP BY bucket ORDER BY bucket",
+            params,
+        ).fetchall()
+        return dict(rows)
+
+    def timeline_by(
+        self,
+        split_by: str,
+        granularity: str = "day",
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> dict[str, dict[str, int]]:
+        """Count activities per repository or type and time bucket."""
+        if split_by not in ("repository", "type"):
+            raise ValueError(f"Cannot split by {split_by!r}")
+        bucket = _TIMELINE_BUCKETS.get(granularity, _TIMELINE_BUCKETS["day"])
+        where, params = self._where(since=since, until=until)
+        rows = self._conn.execute(
+            f"SELECT {split_by}, {bucket} AS bucket, COUNT(*) FROM activities{where} "
+            f"GROUP BY {split_by}, bucket ORDER BY MIN(rowid), bucket",
+            params,
+        ).fetchall()
+        timelines: dict[str, dict[str, int]] = {}
+        for group, key, n in rows:
+            timelines.setdefault(group, {})[key] = n
+        return timelines
+
+    def get_sync_state(
+        self,
+        repository: Repository,
+        activity_type: ActivityType,
+    ) -> Optional[SyncState]:
+        """Return the sync state of a repository and activity type, if synced before."""
+        row = self._conn.execute(
+            "SELECT watermark, covered_since, synced_at FROM sync_state "
+            "WHERE platform = ? AND repository = ? AND type = ?",
+            (repository.platform, repository.full_name, activity_type.value),
+        ).fetchone()
+        if row is None:
+            return None
+        watermark, covered_since, synced_at = row
+        return SyncState(
+            watermark=_from_epoch(watermark),
+            covered_since=_from_epoch(covered_since),
+            synced_at=_from_epoch(synced_at),
+        )
+
+    def set_sync_state(
+        self,
+        repository: Repository,
+        activity_type: ActivityType,
+        *,
+        watermark: datetime,
+        covered_since: datetime,
+    ) -> None:
+        """Record how far the stored history of a repository and activity type reaches."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state "
+                "(platform, repository, type, watermark, covered_since, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    repository.platform,
+                    repository.full_name,
+                    activity_type.value,
+                    watermark.timestamp(),
+                    covered_since.timestamp(),
+                    time.time(),
+                ),
+            )
+
+    def clear(self) -> int:
+        """Remove all stored activities and sync state. Returns the number removed."""
+        with self._conn:
+            removed = self._conn.execute("DELETE FROM activities").rowcount
+            self._conn.execute("DELETE FROM sync_state")
+        self._conn.execute("VACUUM")
+        return removed
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
@@ -0,0 +1,169 @@
+"""Bucket activity timestamps into timeline periods with integer arithmetic."""
+
+from collections import Counter
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+
+def _load_numpy() -> Any:
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+# Marks a module whose numpy has not been looked up yet
+_NOT_LOADED: Any = object()
+
+# numpy, or None if not installed; imported on first use, as it adds ~100 ms to startup
+_np: Any = _NOT_LOADED
+
+
+def _numpy() -> Any:
+    """Return the numpy module or None, importing it on the first call."""
+    global _np
+    if _np is _NOT_LOADED:
+        _np = _load_numpy()
+    return _np
+
+
+GRANULARITIES = ("hour", "day", "week", "month")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_MICROSECOND = timedelta(microseconds=1)
+HOUR_US = 3600 * 1_000_000
+DAY_US = 24 * HOUR_US
+
+
+def epoch_us(when: datetime) -> int:
+    """Return microseconds since the Unix epoch; naive datetimes are taken as UTC."""
+    if when.tzinfo is None:
+        return (when - _EPOCH_NAIVE) // _MICROSECOND
+    return (when - _EPOCH) // _MICROSECOND
+
+
+def wall_clock_us(when: datetime) -> int:
+    """Return the wall-clock reading of a datetime, in its own timezone, as epoch microseconds.
+
+    Bucketing this value groups activities by the local date and hour they
+    were made, as ``strftime`` on the datetime would.
+    """
+    return (when.replace(tzinfo=None) - _EPOCH_NAIVE) // _MICROSECOND
+
+
+def _bucket_keys(wall_times: Any, granularity: str) -> Any:
+    """Map wall-clock microseconds to integer buckets.
+
+    Works elementwise on an int or a numpy array. Hours and days count from
+    the epoch, weeks are the day number of their Monday and months count from
+    January 1970.
+    """
+    if granularity == "hour":
+        return wall_times // HOUR_US
+    days = wall_times // DAY_US
+    if granularity == "week":
+        # 1970-01-01 was a Thursday
+        return days - (days + 3) % 7
+    if granularity != "month":
+        return days
+    # Civil date from a day number (H. Hinnant's days_from_civil, inverted)
+    z = days + 719468
+    era = z // 146097
+    day_of_era = z - era * 146097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153  # 0 is March
+    month = shifted_month + 3 - 12 * (shifted_month >= 10)
+    year = year_of_era + era * 400 + (month <= 2)
+    return (year - 1970) * 12 + month - 1
+
+
+def bucket_label(granularity: str, key: int) -> str:
+    """Format an integer bucket as a timeline key.
+
+    Keys are ``YYYY-MM-DD HH:00`` for hours, ``YYYY-MM-DD`` for days and for
+    weeks (their Monday) and ``YYYY-MM`` for months.
+    """
+    if granularity == "hour":
+        return (_EPOCH_NAIVE + timedelta(hours=key)).strftime("%Y-%m-%d %H:00")
+    if granularity == "month":
+        year, month = divmod(key, 12)
+        return f"{1970 + year:04d}-{month + 1:02d}"
+    return date.fromordinal(_EPOCH_ORDINAL + key).isoformat()
+
+
+def _histogram(wall_times: Sequence[int], granularity: str) -> list[tuple[int, int]]:
+    """Count wall-clock times per bucket, returning (bucket, count) pairs in bucket order."""
+    np = _numpy()
+    if np is not None:
+        times = np.asarray(wall_times, dtype=np.int64)
+        keys, totals = np.unique(_bucket_keys(times, granularity), return_counts=True)
+        return list(zip(keys.tolist(), totals.tolist()))
+
+    # One pass counting whole hours or days, then regroup the distinct ones
+    unit = HOUR_US if granularity == "hour" else DAY_US
+    per_unit = Counter(wall_time // unit for wall_time in wall_times)
+    counts: dict[int, int] = {}
+    for unit_key, n in per_unit.items():
+        key = _bucket_keys(unit_key * unit, granularity)
+        counts[key] = counts.get(key, 0) + n
+    return sorted(counts.items())
+
+
+def count_buckets(wall_times: Sequence[int], granularity: str = "day") -> dict[str, int]:
+    """Count wall-clock times (see :func:`wall_clock_us`) per period, in period order.
+
+    Granularity is hour, day, week or month; anything else counts per day.
+    The count runs over numpy arrays when numpy is installed.
+    """
+    if granularity not in GRANULARITIES:
+        granularity = "day"
+    return {bucket_label(granularity, key): n for key, n in _histogram(wall_times, granularity)}
+
+
+def count_buckets_by(
+    wall_times: Sequence[int],
+    groups: Sequence[int],
+    granularity: str = "day",
+) -> dict[int, dict[str, int]]:
+    """Count wall-clock times per group code and period.
+
+    Returns a timeline as from :func:`count_buckets` for every group code
+    present, with groups in ascending code order.
+    """
+    if granularity not in GRANULARITIES:
+        granularity = "day"
+    np = _numpy()
+    if np is not None:
+        times = np.asarray(wall_times, dtype=np.int64)
+        codes = np.asarray(groups, dtype=np.int64)
+        if len(times) == 0:
+            return {}
+        keys = _bucket_keys(times, granularity)
+        first = int(keys.min())
+        span = int(keys.max()) - first + 1
+        # A single histogram over (group, bucket) pairs packed into one integer
+        packed, counts = np.unique(codes * span + (keys - first), return_counts=True)
+        per_group: dict[int, dict[str, int]] = {}
+        for value, n in zip(packed.tolist(), counts.tolist()):
+            code, key = divmod(value, span)
+            per_group.setdefault(code, {})[bucket_label(granularity, key + first)] = n
+        return per_group
+
+    unit = HOUR_US if granularity == "hour" else DAY_US
+    per_unit = Counter(zip(groups, (wall_time // unit for wall_time in wall_times)))
+    pairs: dict[tuple[int, int], int] = {}
+    for (code, unit_key), n in per_unit.items():
+        pair = (code, _bucket_keys(unit_key * unit, granularity))
+        pairs[pair] = pairs.get(pair, 0) + n
+    timelines: dict[int, dict[str, int]] = {}
+    for (code, key), n in sorted(pairs.items()):
+        timelines.setdefault(code, {})[bucket_label(granularity, key)] = n
+    return timelines
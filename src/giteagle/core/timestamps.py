@@ -0,0 +1,37 @@
+"""Parsing of ISO 8601 timestamps from platform APIs."""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a ``Z`` suffix for UTC.
+
+    Results are memoized: API responses repeat the same instants (a merged pull
+    request's ``merged_at`` and ``closed_at``, pages of one bulk import), and
+    datetimes are immutable, so repeated values cost a dictionary lookup.
+
+    Raises:
+        ValueError: If the value is not an ISO 8601 timestamp.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def parse_optional_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a timestamp that may be missing, malformed or already parsed.
+
+    Datetimes are returned as they are; anything else that is not a parsable
+    string gives None.
+    """
+    if isinstance(value, datetime):
+        return value
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return parse_timestamp(value)
+    except ValueError:
+        return None
@@ -1,9 +1,30 @@
 """Platform integrations for fetching repository data."""
 
 from giteagle.integrations.base import PlatformClient
-from giteagle.integrations.github import GitHubClient
+from giteagle.integrations.cache import CacheStats, ResponseCache
+from giteagle.integrations.github import ActivityPage, GitHubClient, PullRequestDetails
+from giteagle.integrations.limiter import LimiterStats, RequestLimiter
+from giteagle.integrations.ratelimit import RateLimitBudget, RateLimitScheduler, RateLimitStats
+from giteagle.integrations.retry import RetryPolicy, RetryStats
+from giteagle.integrations.sync import SyncResult, sync_repository
+from giteagle.integrations.tokens import TokenPool, TokenUsage
 
 __all__ = [
     "PlatformClient",
+    "ActivityPage",
     "GitHubClient",
+    "PullRequestDetails",
+    "CacheStats",
+    "LimiterStats",
+    "RequestLimiter",
+    "RateLimitBudget",
+    "RateLimitScheduler",
+    "RateLimitStats",
+    "RetryPolicy",
+    "RetryStats",
+    "ResponseCache",
+    "SyncResult",
+    "TokenPool",
+    "TokenUsage",
+    "sync_repository",
 ]
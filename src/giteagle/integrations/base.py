@@ -1,11 +1,14 @@
 """Base class for platform integrations."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TypeVar
 
 from giteagle.core.models import Activity, Repository
 
+_ClientT = TypeVar("_ClientT", bound="PlatformClient")
+
 
 class PlatformClient(ABC):
     """Abstract base class for platform-specific API clients."""
@@ -41,12 +44,26 @@ class PlatformClient(ABC):
         """Fetch activities for a repository."""
         pass
 
+    async def aiter_activities(
+        self,
+        repository: Repository,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[list[Activity]]:
+        """Yield activities for a repository in batches.
+
+        Platforms that can stream results page by page should override this.
+        The default yields the result of ``get_activities`` as a single batch.
+        """
+        yield await self.get_activities(repository, since=since, until=until, limit=limit)
+
     @abstractmethod
     async def close(self) -> None:
         """Close the client and release resources."""
         pass
 
-    async def __aenter__(self) -> "PlatformClient":
+    async def __aenter__(self: _ClientT) -> _ClientT:
         """Enter async context manager."""
         return self
 
@@ -0,0 +1,284 @@
+"""Persistent on-disk cache for API responses."""
+
+import hashlib
+import json
+import sqlite3
+import stat
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    headers TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A response body stored in the cache, with its revalidation headers."""
+
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+    fresh: bool = True
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Return conditional request headers for revalidating this response."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """Summary of the cache contents and its hit rate."""
+
+    path: Path
+    entries: int
+    size_bytes: int
+    max_size_bytes: int
+    hits: int
+    misses: int
+    revalidated: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL expiry and size-capped LRU eviction.
+
+    Entries are keyed by request method, URL, query parameters and the identity
+    of the token used, so responses are never shared between credentials.
+    Entries older than the TTL are kept if they carry an ETag or Last-Modified
+    header so they can be revalidated with a conditional request.
+    """
+
+    FILENAME = "http-cache.sqlite3"
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl: int = 300,
+        max_size_bytes: int = 100 * 1024 * 1024,
+    ) -> None:
+        self._path = path
+        self._ttl = ttl
+        self._max_size_bytes = max_size_bytes
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            # Cached data is disposable, so rebuild rather than migrate
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS responses; DROP TABLE IF EXISTS counters;"
+            )
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        # Cached responses may include private repository data
+        path.chmod(stat.S_IRUSR | stat.S_IWUSR)
+
+    @classmethod
+    def in_directory(cls, directory: Path, **kwargs: Any) -> "ResponseCache":
+        """Open the cache file inside a cache directory."""
+        return cls(directory / cls.FILENAME, **kwargs)
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the cache database."""
+        return self._path
+
+    @property
+    def ttl(self) -> int:
+        """Return the time-to-live of cache entries, in seconds."""
+        return self._ttl
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        token: Optional[str] = None,
+    ) -> str:
+        """Build a cache key for a request."""
+        token_id = hashlib.sha256(token.encode()).hexdigest() if token else ""
+        normalized_params = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        raw = json.dumps([method.upper(), url, normalized_params, token_id])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for a key, or None if there is none.
+
+        A response older than the TTL is returned with ``fresh=False`` when it
+        can be revalidated, and counted as a miss.
+        """
+        row = self._conn.execute(
+            "SELECT body, headers, etag, last_modified, stored_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            self._misses += 1
+            return None
+
+        body, headers, etag, last_modified, stored_at = row
+        now = time.time()
+        fresh = now - stored_at < self._ttl
+        if not fresh and not (etag or last_modified):
+            self._misses += 1
+            with self._conn:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+
+        if fresh:
+            self._hits += 1
+        else:
+            self._misses += 1
+        with self._conn:
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return CachedResponse(
+            body=body,
+            headers=json.loads(headers),
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=stored_at,
+            fresh=fresh,
+        )
+
+    def touch(self, key: str) -> None:
+        """Mark a stale entry as fresh again after a successful revalidation."""
+        self._revalidated += 1
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+
+    def set(
+        self,
+        key: str,
+        body: bytes,
+        headers: Optional[Mapping[str, str]] = None,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a response body, evicting least recently used entries if needed."""
+        size = len(body)
+        if size > self._max_size_bytes:
+            return
+
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, body, headers, etag, last_modified, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    body,
+                    json.dumps(dict(headers or {})),
+                    etag,
+                    last_modified,
+                    size,
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones until under the size cap."""
+        self._conn.execute(
+            "DELETE FROM responses WHERE stored_at <= ? AND etag IS NULL AND last_modified IS NULL",
+            (time.time() - self._ttl,),
+        )
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self._max_size_bytes:
+            return
+
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        evicted: list[tuple[str]] = []
+        for key, size in rows:
+            if total <= self._max_size_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def stats(self) -> CacheStats:
+        """Return cache statistics, including hits and misses from earlier runs."""
+        entries, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        counters = dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+        return CacheStats(
+            path=self._path,
+            entries=entries,
+            size_bytes=size,
+            max_size_bytes=self._max_size_bytes,
+            hits=counters.get("hits", 0) + self._hits,
+            misses=counters.get("misses", 0) + self._misses,
+            revalidated=counters.get("revalidated", 0) + self._revalidated,
+        )
+
+    def clear(self) -> int:
+        """Remove all cached responses and reset counters. Returns the number removed."""
+        with self._conn:
+            removed = self._conn.execute("DELETE FROM responses").rowcount
+            self._conn.execute("DELETE FROM counters")
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._conn.execute("VACUUM")
+        return removed
+
+    def close(self) -> None:
+        """Persist hit/miss counters and close the database."""
+        with self._conn:
+            for name, value in (
+                ("hits", self._hits),
+                ("misses", self._misses),
+                ("revalidated", self._revalidated),
+            ):
+                self._conn.execute(
+                    "INSERT INTO counters (name, value) VALUES (?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                    (name, value),
+                )
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._conn.close()
@@ -0,0 +1,60 @@
+"""Connection reuse statistics for an HTTP client."""
+
+import weakref
+from dataclasses import dataclass, field, replace
+
+import httpx
+
+
+@dataclass
+class ConnectionStats:
+    """Counters describing how responses were spread over connections."""
+
+    responses: int = 0
+    connections: int = 0
+    http_versions: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def reused(self) -> int:
+        """Return how many responses arrived on an already open connection."""
+        return self.responses - self.connections
+
+    @property
+    def reuse_rate(self) -> float:
+        """Return the fraction of responses that needed no new connection."""
+        if self.responses == 0:
+            return 0.0
+        return self.reused / self.responses
+
+
+class ConnectionTracker:
+    """Count the distinct connections that served responses.
+
+    httpx reports the network stream each response arrived on; a stream not
+    seen before is a new connection, with its own TCP and TLS handshake.
+    Streams are held weakly, so a connection opened after another was closed
+    is counted even if Python reuses the old stream's memory.
+    """
+
+    def __init__(self) -> None:
+        self._streams: weakref.WeakSet[object] = weakref.WeakSet()
+        self._stats = ConnectionStats()
+
+    @property
+    def stats(self) -> ConnectionStats:
+        """Return a snapshot of the connection counters."""
+        return replace(self._stats, http_versions=dict(self._stats.http_versions))
+
+    def record(self, response: httpx.Response) -> None:
+        """Count a response and the connection it arrived on."""
+        stream = response.extensions.get("network_stream")
+        if stream is None:
+            # Not sent over the network, e.g. by a mock transport
+            return
+        stats = self._stats
+        stats.responses += 1
+        version = response.http_version
+        stats.http_versions[version] = stats.http_versions.get(version, 0) + 1
+        if stream not in self._streams:
+            self._streams.add(stream)
+            stats.connections += 1
@@ -0,0 +1,55 @@
+"""JSON decoding of API responses, with the fastest installed decoder."""
+
+import json
+from typing import Any, Callable
+
+JsonDecoder = Callable[[bytes], Any]
+
+DECODERS = ("orjson", "msgspec", "json")
+
+
+def _stdlib_decoder() -> JsonDecoder:
+    return json.loads
+
+
+def _orjson_decoder() -> JsonDecoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec_decoder() -> JsonDecoder:
+    import msgspec
+
+    decode: JsonDecoder = msgspec.json.Decoder().decode
+    return decode
+
+
+_FACTORIES: dict[str, Callable[[], JsonDecoder]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": _stdlib_decoder,
+}
+
+
+def load_decoder(name: str = "auto") -> tuple[str, JsonDecoder]:
+    """Return the name and decode function of a JSON decoder.
+
+    ``auto`` picks the first installed of :data:`DECODERS`; orjson and msgspec
+    decode large API pages several times faster than the standard library and
+    build the same dicts and lists. Naming a decoder that is not installed
+    raises ImportError.
+
+    Raises:
+        ValueError: If the name is not ``auto`` or one of :data:`DECODERS`.
+        ImportError: If the named decoder is not installed.
+    """
+    if name == "auto":
+        for candidate in DECODERS:
+            try:
+                return candidate, _FACTORIES[candidate]()
+            except ImportError:
+                continue
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON decoder {name!r}, expected one of {', '.join(DECODERS)}")
+    return name, _FACTORIES[name]()
@@ -1,19 +1,71 @@
 """GitHub API integration."""
 
 import asyncio
+import functools
 import logging
 import re
+import time
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
 
 import httpx
 
+from giteagle.core.interning import EntityRegistry
 from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+from giteagle.core.records import CommitRecord
+from giteagle.core.timestamps import parse_optional_timestamp, parse_timestamp
 from giteagle.integrations.base import PlatformClient
+from giteagle.integrations.cache import CachedResponse, ResponseCache
+from giteagle.integrations.connections import ConnectionStats, ConnectionTracker
+from giteagle.integrations.decoding import load_decoder
+from giteagle.integrations.limiter import LimiterStats, RequestLimiter
+from giteagle.integrations.ratelimit import RateLimitBudget, RateLimitStats
+from giteagle.integrations.retry import (
+    RETRY_STATUSES,
+    RetryPolicy,
+    RetryState,
+    RetryStats,
+    is_secondary_rate_limit,
+)
+from giteagle.integrations.tokens import PooledToken, TokenPool, TokenUsage
 
 logger = logging.getLogger(__name__)
 
 _SAFE_PATH_SEGMENT = re.compile(r"^[a-zA-Z0-9._-]+$")
+_LINK_LAST = re.compile(r'<([^>]+)>;\s*rel="last"')
+
+# Page size for GraphQL pull request queries. Each PR also pulls its latest 100
+# reviews, so larger pages risk exceeding GitHub's per-query node limit.
+_GRAPHQL_PAGE_SIZE = 50
+
+_PULL_REQUESTS_QUERY = """
+query(
+  $owner: String!, $name: String!, $states: [PullRequestState!], $first: Int!,
+  $after: String, $orderField: IssueOrderField!, $orderDirection: OrderDirection!,
+  $withStatus: Boolean!
+) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(
+      states: $states, first: $first, after: $after,
+      orderBy: {field: $orderField, direction: $orderDirection}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title url state createdAt updatedAt closedAt mergedAt headRefOid
+        author { login }
+        labels(first: 20) { nodes { name } }
+        reviews(last: 100) { nodes { author { login } state submittedAt } }
+        commits(last: 1) @include(if: $withStatus) {
+          nodes { commit { statusCheckRollup { state } } }
+        }
+      }
+    }
+  }
+}
+"""
 
 
 def _validate_path_segment(value: str, name: str) -> str:
@@ -23,6 +75,28 @@ def _validate_path_segment(value: str, name: str) -> str:
     return value
 
 
+def _cacheable_since(since: datetime) -> str:
+    """Format a ``since`` filter floored to the hour.
+
+    Rounding keeps the request URL stable across runs so cached responses can be
+    reused and revalidated. Callers drop the extra results older than ``since``.
+    """
+    return since.replace(minute=0, second=0, microsecond=0).isoformat()
+
+
+def _parse_last_page(link_header: Optional[str]) -> Optional[int]:
+    """Extract the page number of the ``rel="last"`` entry from a Link header."""
+    if not link_header:
+        return None
+    match = _LINK_LAST.search(link_header)
+    if not match:
+        return None
+    pages = parse_qs(urlparse(match.group(1)).query).get("page")
+    if not pages or not pages[0].isdigit():
+        return None
+    return int(pages[0])
+
+
 class GitHubAPIError(Exception):
     """Error from GitHub API."""
 
@@ -40,6 +114,118 @@ class RateLimitError(GitHubAPIError):
         self.reset_at = reset_at
 
 
+class RateLimitBudgetError(RateLimitError):
+    """A planned fetch needs more requests than the rate limit has left."""
+
+    def __init__(self, reset_at: datetime, requests: int, remaining: int):
+        super().__init__(
+            reset_at,
+            f"Planned up to {requests} API requests but only {remaining} remain "
+            f"until {reset_at:%H:%M} UTC",
+        )
+        self.requests = requests
+        self.remaining = remaining
+
+
+_PULL_REQUEST_TIMES = ("created_at", "updated_at", "closed_at", "merged_at")
+
+
+@dataclass
+class PullRequestDetails:
+    """Pull requests with their reviews and CI status, in REST API shape.
+
+    Unlike raw API dicts, timestamps (``created_at``, ``updated_at``,
+    ``closed_at``, ``merged_at`` and reviews' ``submitted_at``) are parsed into
+    timezone-aware datetimes, or None where GitHub sent none.
+    """
+
+    pull_requests: list[dict] = field(default_factory=list)
+    reviews: dict[int, list[dict]] = field(default_factory=dict)
+    statuses: dict[str, dict] = field(default_factory=dict)
+
+
+@dataclass
+class ActivityPage:
+    """Activities parsed from one page of an API listing."""
+
+    activities: list[Activity]
+    items: int  # Items the API returned on the page, before parsing dropped any
+
+
+def _parse_pull_request_times(details: PullRequestDetails) -> PullRequestDetails:
+    """Replace the ISO timestamp strings of pull requests and reviews with datetimes.
+
+    The dicts are copied rather than updated, as the decoded API responses they
+    come from may be shared with concurrent callers.
+    """
+    details.pull_requests = [
+        {**pr, **{key: parse_optional_timestamp(pr.get(key)) for key in _PULL_REQUEST_TIMES}}
+        for pr in details.pull_requests
+    ]
+    details.reviews = {
+        number: [
+            {**review, "submitted_at": parse_optional_timestamp(review.get("submitted_at"))}
+            for review in reviews
+        ]
+        for number, reviews in details.reviews.items()
+    }
+    return details
+
+
+def _closed_since(prs: list[Any], since: datetime) -> list[Any]:
+    """Keep pull requests closed (or last updated) at or after since."""
+    result: list[Any] = []
+    for pr in prs:
+        closed_at_str = pr.get("closed_at") or pr.get("updated_at", "")
+        if closed_at_str:
+            closed_dt = parse_timestamp(closed_at_str)
+            if closed_dt >= since:
+                result.append(pr)
+    return result
+
+
+def _graphql_pull_request(node: dict) -> tuple[dict, list[dict], Optional[dict]]:
+    """Convert a GraphQL pull request node into REST-shaped PR, reviews and status dicts."""
+
+    def user(actor: Optional[dict]) -> dict:
+        # Deleted accounts come back as a null author
+        return {"login": actor["login"]} if actor else {}
+
+    pr = {
+        "number": node["number"],
+        "title": node.get("title", ""),
+        "html_url": node.get("url", ""),
+        "state": "open" if node.get("state") == "OPEN" else "closed",
+        "created_at": node["createdAt"],
+        "updated_at": node.get("updatedAt"),
+        "closed_at": node.get("closedAt"),
+        "merged_at": node.get("mergedAt"),
+        "user": user(node.get("author")),
+        "labels": [{"name": label["name"]} for label in node["labels"]["nodes"]],
+        "head": {"sha": node.get("headRefOid") or ""},
+    }
+    reviews = [
+        {
+            "user": user(review.get("author")),
+            "state": review.get("state", ""),
+            "submitted_at": review.get("submittedAt"),
+        }
+        for review in node["reviews"]["nodes"]
+    ]
+
+    status: Optional[dict] = None
+    commits = node.get("commits")
+    if commits is not None:
+        status = {"state": "unknown"}
+        for commit in commits["nodes"]:
+            rollup = commit["commit"].get("statusCheckRollup")
+            if rollup:
+                # EXPECTED means a required check has not reported yet
+                state = rollup["state"].lower()
+                status = {"state": "pending" if state == "expected" else state}
+    return pr, reviews, status
+
+
 class GitHubClient(PlatformClient):
     """Client for GitHub API."""
 
@@ -50,68 +236,349 @@ class GitHubClient(PlatformClient):
         token: Optional[str] = None,
         base_url: str = BASE_URL,
         timeout: float = 30.0,
+        max_concurrent_requests: int = 10,
+        cache: Optional[ResponseCache] = None,
+        entities: Optional[EntityRegistry] = None,
+        json_decoder: str = "auto",
+        max_rate_limit_wait: float = 900.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        tokens: Sequence[str] = (),
+        http2: bool = False,
+        max_connections: Optional[int] = None,
+        keepalive_expiry: float = 30.0,
+        on_rate_limit_pause: Optional[Callable[[str, float], None]] = None,
     ):
-        self._token = token
+        self._token = token or next(iter(tokens), None)
         self._base_url = base_url.rstrip("/")
+        # GitHub Enterprise serves GraphQL at /api/graphql next to the /api/v3 REST root
+        if self._base_url.endswith("/v3"):
+            self._graphql_url = self._base_url[: -len("/v3")] + "/graphql"
+        else:
+            self._graphql_url = self._base_url + "/graphql"
         headers = {
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token}"
 
+        # Keep a connection open for every request that may be in flight, and long
+        # enough to span paced requests; HTTP/2 multiplexes them over fewer still
+        pool_size = max_connections or max_concurrent_requests
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             headers=headers,
             timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=keepalive_expiry,
+            ),
         )
+        self._connections = ConnectionTracker()
+        # GET requests being sent, by path and query, for concurrent callers to share
+        self._in_flight: dict[str, asyncio.Future[tuple[Any, Mapping[str, str]]]] = {}
+        self._coalesced_requests = 0
+        self._limiter = RequestLimiter(max_concurrent_requests)
+        # Requests go to the pooled token with the most budget left and are paced by
+        # that token's budget; a spent pool waits for a reset up to the maximum
+        self._tokens = TokenPool([token, *tokens])
+        self._max_rate_limit_wait = max_rate_limit_wait
+        # Told the resource and seconds left once per spent budget, not per waiting request
+        self._on_rate_limit_pause = on_rate_limit_pause
+        self._announced_resets: dict[str, float] = {}
+        # Backoff for throttled and failed requests, shared by concurrent requests
+        self._retry = retry_policy or RetryPolicy()
+        self._cache = cache
+        # Parsed repositories and contributors share one instance per entity
+        self._entities = entities if entities is not None else EntityRegistry()
+        self._json_decoder, self._decode_json = load_decoder(json_decoder)
 
     @property
     def platform_name(self) -> str:
         return "github"
 
+    @property
+    def json_decoder(self) -> str:
+        """Return the name of the JSON decoder used for responses."""
+        return self._json_decoder
+
+    @property
+    def limiter_stats(self) -> LimiterStats:
+        """Return admission counters for requests made by this client."""
+        return self._limiter.stats
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Return how many GET requests shared a response with an identical one in flight."""
+        return self._coalesced_requests
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Return how many connections served this client's responses."""
+        return self._connections.stats
+
+    @property
+    def rate_limit_stats(self) -> RateLimitStats:
+        """Return how much requests were delayed to stay within the rate limit."""
+        return self._tokens.stats
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Return how often and how long requests were retried."""
+        return self._retry.stats
+
+    @property
+    def token_usage(self) -> list[TokenUsage]:
+        """Return the requests made with each token, in configured order."""
+        return self._tokens.usage()
+
+    def rate_limit_budget(self, resource: str = "core") -> Optional[RateLimitBudget]:
+        """Return the rate-limit budget of a resource left across all tokens, if known."""
+        return self._tokens.budget(resource)
+
+    async def get_rate_limits(self) -> None:
+        """Refresh the rate-limit budgets of all resources for every token.
+
+        Reading ``/rate_limit`` does not count against the limit. Servers with
+        rate limiting disabled answer 404, which leaves the budgets unknown, as
+        does a request that fails; the headers of later responses fill them in.
+        """
+        for token in self._tokens.tokens:
+            try:
+                async with self._limiter:
+                    response = await self._client.request(
+                        "GET", "/rate_limit", headers=self._auth_headers(token)
+                    )
+                if response.status_code != 200:
+                    continue
+                resources = self._decode_json(response.content).get("resources", {})
+            except (httpx.HTTPError, ValueError) as e:
+                logger.debug("Could not read the rate limit of token %s: %s", token.usage.label, e)
+                continue
+            for resource, values in resources.items():
+                token.rate_limits.update(
+                    values["limit"], values["remaining"], values["reset"], resource
+                )
+
+    async def check_rate_budget(self, requests: int, resource: str = "core") -> bool:
+        """Check that a planned fetch of up to ``requests`` requests can finish.
+
+        ``requests`` is an upper bound that cached and stored activity usually
+        undercut, so a plan the remaining budget cannot cover is only refused
+        when the fetch could not wait for the reset either.
+
+        Returns:
+            True if the remaining budget covers the plan, False if the fetch
+            may have to pause until the reset.
+
+        Raises:
+            RateLimitBudgetError: If fewer requests remain and the reset is
+                further away than ``max_rate_limit_wait``.
+        """
+        if self._tokens.budget(resource) is None:
+            await self.get_rate_limits()
+        # An unknown budget (rate limiting disabled) fits any plan
+        budget = self._tokens.budget(resource)
+        if budget is None or requests <= budget.remaining:
+            return True
+        if budget.reset_at - time.time() > self._max_rate_limit_wait:
+            raise RateLimitBudgetError(budget.reset_datetime, requests, budget.remaining)
+        return False
+
+    def _auth_headers(self, token: PooledToken) -> dict[str, str]:
+        """Return the headers sending a request with a pooled token.
+
+        A lone token is already among the client's default headers.
+        """
+        return token.headers if len(self._tokens) > 1 else {}
+
+    async def _wait_for_rate_limit(self, resource: str) -> PooledToken:
+        """Pick the token for the next request and wait as long as its budget asks."""
+        token = self._tokens.select(resource)
+        delay = token.rate_limits.reserve(resource)
+        token.usage.requests += 1
+        if delay <= 0:
+            return token
+        budget = token.rate_limits.budget(resource)
+        if delay > self._max_rate_limit_wait:
+            reset_at = budget.reset_datetime if budget else datetime.now(tz=timezone.utc)
+            raise RateLimitError(reset_at)
+        if delay > 1:
+            logger.info("Waiting %.0fs for the %s rate limit", delay, resource)
+        # Paced requests go out before the reset; only a spent budget waits past it
+        if (
+            self._on_rate_limit_pause is not None
+            and budget is not None
+            and delay >= budget.reset_at - time.time()
+            and self._announced_resets.get(resource) != budget.reset_at
+        ):
+            self._announced_resets[resource] = budget.reset_at
+            self._on_rate_limit_pause(resource, delay)
+        await asyncio.sleep(delay)
+        return token
+
     async def _request(
         self,
         method: str,
         path: str,
         params: Optional[dict] = None,
-        retry_count: int = 3,
+        json_body: Optional[dict] = None,
     ) -> Any:
-        """Make an API request with retry logic."""
-        last_error: Optional[Exception] = None
+        """Make an API request with retry logic and return the decoded body."""
+        data, _ = await self._request_with_headers(method, path, params, json_body)
+        return data
 
-        for attempt in range(retry_count):
+    async def _request_with_headers(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        json_body: Optional[dict] = None,
+    ) -> tuple[Any, Mapping[str, str]]:
+        """Make an API request with retry logic, returning the body and response headers.
+
+        Concurrent identical GET requests share one network call and one decoded
+        body, which callers must therefore not modify.
+        """
+        if method != "GET":
+            return await self._send_request(method, path, params, json_body)
+
+        key = path + "?" + urlencode(sorted((params or {}).items()), doseq=True)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(method, path, params))
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._request_done, key))
+        else:
+            self._coalesced_requests += 1
+        # Shielded so a cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: str, task: asyncio.Future[Any]) -> None:
+        """Forget a finished shared request, so the next identical one is sent anew."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the error retrieved, in case every caller was cancelled meanwhile
+        if not task.cancelled():
+            task.exception()
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        json_body: Optional[dict] = None,
+    ) -> tuple[Any, Mapping[str, str]]:
+        """Send an API request with retry logic, returning the body and response headers.
+
+        GET responses are served from and stored in the response cache, if any.
+        Stale cached responses are revalidated with a conditional request; a
+        ``304 Not Modified`` reply does not count against the rate limit.
+
+        Timeouts, network errors, throttled responses (429 and secondary rate
+        limits) and gateway errors are retried as the retry policy allows.
+        """
+        cache = self._cache if method == "GET" else None
+        cache_key = ""
+        cached: Optional[CachedResponse] = None
+        conditional_headers: dict[str, str] = {}
+        if cache is not None:
+            # Pooled tokens are expected to see the same data, so they share entries
+            cache_key = cache.make_key(method, self._base_url + path, params, self._token)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                if cached.fresh:
+                    return self._decode_json(cached.body), cached.headers
+                conditional_headers = cached.validators
+
+        resource = "graphql" if path == self._graphql_url else "core"
+        retry = RetryState()
+
+        while True:
             try:
-                response = await self._client.request(method, path, params=params)
-
-                if response.status_code == 403:
-                    # Check for rate limiting
+                # Hold off while another request's throttling cools down
+                cooldown = self._retry.cooldown_remaining()
+                if cooldown > 0:
+                    await asyncio.sleep(cooldown)
+                token = await self._wait_for_rate_limit(resource)
+                async with self._limiter:
+                    response = await self._client.request(
+                        method,
+                        path,
+                        params=params,
+                        headers={**conditional_headers, **self._auth_headers(token)},
+                        json=json_body,
+                    )
+                token.rate_limits.update_from_headers(response.headers, resource)
+                self._connections.record(response)
+
+                if response.status_code == 304 and cache is not None and cached is not None:
+                    cache.touch(cache_key)
+                    return self._decode_json(cached.body), cached.headers
+
+                if response.status_code in (403, 429):
+                    # Out of budget: fail over to another token, or retry after the reset
+                    # if the scheduler will wait that long
                     remaining = response.headers.get("X-RateLimit-Remaining", "1")
                     if remaining == "0":
                         reset_timestamp = int(response.headers.get("X-RateLimit-Reset", "0"))
                         reset_at = datetime.fromtimestamp(reset_timestamp, tz=timezone.utc)
-                        raise RateLimitError(reset_at)
+                        limit = int(response.headers.get("X-RateLimit-Limit", "0"))
+                        token.rate_limits.update(limit, 0, reset_timestamp, resource)
+                        token.usage.rate_limited += 1
+                        retry.attempts += 1
+                        if retry.attempts >= self._retry.max_attempts:
+                            raise RateLimitError(reset_at)
+                        continue
+
+                status = response.status_code
+                if status in RETRY_STATUSES or is_secondary_rate_limit(
+                    status, response.headers, response.content
+                ):
+                    delay = self._retry.response_backoff(retry, status, response.headers)
+                    if delay is not None:
+                        logger.info(
+                            "Retrying %s %s in %.1fs after HTTP %d", method, path, delay, status
+                        )
+                        await asyncio.sleep(delay)
+                        continue
 
                 if response.status_code == 404:
                     raise GitHubAPIError("Resource not found", 404)
 
-                if response.status_code >= 400:
-                    error_data = response.json() if response.content else {}
-                    message = error_data.get("message", f"HTTP {response.status_code}")
-                    raise GitHubAPIError(message, response.status_code, error_data)
-
-                return response.json()
+                if status >= 400:
+                    # Proxies and gateways answer with HTML error pages, not JSON
+                    try:
+                        error_data = self._decode_json(response.content) if response.content else {}
+                    except ValueError:
+                        error_data = {}
+                    if not isinstance(error_data, dict):
+                        error_data = {}
+                    message = error_data.get("message", f"HTTP {status}")
+                    raise GitHubAPIError(message, status, error_data)
+
+                if cache is not None:
+                    link = response.headers.get("Link")
+                    cache.set(
+                        cache_key,
+                        response.content,
+                        {"link": link} if link else None,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                return self._decode_json(response.content), response.headers
 
             except httpx.TimeoutException:
-                last_error = GitHubAPIError("Request timed out")
-                if attempt < retry_count - 1:
-                    await asyncio.sleep(2**attempt)
+                error = GitHubAPIError("Request timed out")
             except httpx.NetworkError as e:
-                last_error = GitHubAPIError(f"Network error: {e}")
-                if attempt < retry_count - 1:
-                    await asyncio.sleep(2**attempt)
+                error = GitHubAPIError(f"Network error: {e}")
 
-        raise last_error or GitHubAPIError("Unknown error")
+            delay = self._retry.backoff(retry)
+            if delay is None:
+                raise error
+            await asyncio.sleep(delay)
 
     async def _paginate(
         self,
@@ -119,15 +586,39 @@ class GitHubClient(PlatformClient):
         params: Optional[dict] = None,
         limit: int = 100,
     ) -> list[Any]:
-        """Paginate through API results."""
-        params = params or {}
-        params["per_page"] = min(100, limit)
-        page = 1
-        results: list[Any] = []
+        """Paginate through API results.
+
+        The first page's ``Link: rel="last"`` header reveals the page count, so
+        the remaining pages (up to what ``limit`` needs) are fetched concurrently
+        and reassembled in order. Without the header, pages are walked one by one.
+        """
+        params = dict(params or {})
+        per_page = min(100, limit)
+        params["per_page"] = per_page
+        max_pages = -(-limit // per_page)
+
+        data, headers = await self._request_with_headers("GET", path, params={**params, "page": 1})
+        if not data:
+            return []
+
+        results: list[Any] = list(data)
+        if len(data) < per_page or max_pages == 1:
+            return results[:limit]
+
+        last_page = _parse_last_page(headers.get("link"))
+        if last_page is not None:
+            pages = range(2, min(last_page, max_pages) + 1)
+            page_results = await asyncio.gather(
+                *(self._request("GET", path, params={**params, "page": page}) for page in pages)
+            )
+            for page_data in page_results:
+                if page_data:
+                    results.extend(page_data)
+            return results[:limit]
 
+        page = 2
         while len(results) < limit:
-            params["page"] = page
-            data = await self._request("GET", path, params=params)
+            data = await self._request("GET", path, params={**params, "page": page})
 
             if not data:
                 break
@@ -135,14 +626,40 @@ class GitHubClient(PlatformClient):
             results.extend(data)
             page += 1
 
-            if len(data) < params["per_page"]:
+            if len(data) < per_page:
                 break
 
         return results[:limit]
 
+    async def _aiter_pages(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[list[Any]]:
+        """Yield API result pages in order, fetching each page only when requested."""
+        params = dict(params or {})
+        per_page = min(100, limit)
+        params["per_page"] = per_page
+        remaining = limit
+        page = 1
+
+        while remaining > 0:
+            data = await self._request("GET", path, params={**params, "page": page})
+
+            if not data:
+                return
+
+            yield data[:remaining]
+            remaining -= len(data)
+            page += 1
+
+            if len(data) < per_page:
+                return
+
     def _parse_repository(self, data: dict) -> Repository:
         """Parse GitHub API response into Repository model."""
-        return Repository(
+        return self._entities.repository(
             name=data["name"],
             owner=data["owner"]["login"],
             platform="github",
@@ -154,7 +671,7 @@ class GitHubClient(PlatformClient):
 
     def _parse_contributor(self, data: dict) -> Contributor:
         """Parse GitHub API user data into Contributor model."""
-        return Contributor(
+        return self._entities.contributor(
             username=data.get("login", data.get("name", "unknown")),
             name=data.get("name"),
             email=data.get("email"),
@@ -186,23 +703,17 @@ class GitHubClient(PlatformClient):
         data = await self._paginate(path, limit=100)
         return [self._parse_repository(repo) for repo in data]
 
-    async def get_commits(
+    def _parse_commits(
         self,
         repository: Repository,
+        commits: list[Any],
         since: Optional[datetime] = None,
-        until: Optional[datetime] = None,
-        limit: int = 100,
     ) -> list[Activity]:
-        """Fetch commit activities for a repository."""
-        params: dict[str, Any] = {}
-        if since:
-            params["since"] = since.isoformat()
-        if until:
-            params["until"] = until.isoformat()
-
-        path = f"/repos/{repository.owner}/{repository.name}/commits"
-        commits = await self._paginate(path, params=params, limit=limit)
+        """Parse a page of GitHub commits into activities, dropping those committed before since.
 
+        Like the API's ``since`` filter, this goes by committer date: a commit
+        authored earlier but merged later still counts as new.
+        """
         activities = []
         for commit in commits:
             # Handle commits with no author info
@@ -210,19 +721,16 @@ class GitHubClient(PlatformClient):
             commit_data = commit.get("commit", {})
             commit_author = commit_data.get("author", {})
 
-            contributor = Contributor(
+            contributor = self._entities.contributor(
                 username=author_data.get("login", commit_author.get("name", "unknown")),
                 name=commit_author.get("name"),
                 email=commit_author.get("email"),
                 avatar_url=author_data.get("avatar_url"),
             )
 
-            # Parse timestamp
-            timestamp_str = commit_author.get("date", "")
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            except ValueError:
-                timestamp = datetime.now(tz=timezone.utc)
+            timestamp, committed_at = self._commit_times(commit_data)
+            if since and (committed_at or timestamp) < since:
+                continue
 
             activity = Activity(
                 id=f"github:commit:{commit['sha']}",
@@ -237,36 +745,80 @@ class GitHubClient(PlatformClient):
                     "sha": commit["sha"],
                     "parents": [p["sha"] for p in commit.get("parents", [])],
                     "stats": commit.get("stats", {}),
+                    "committed_at": committed_at,
                 },
             )
             activities.append(activity)
 
         return activities
 
-    async def get_pull_requests(
+    def _parse_commit_records(
         self,
         repository: Repository,
+        commits: list[Any],
         since: Optional[datetime] = None,
-        state: str = "all",
-        limit: int = 100,
-    ) -> list[Activity]:
-        """Fetch pull request activities for a repository."""
-        params = {"state": state, "sort": "updated", "direction": "desc"}
+    ) -> list[CommitRecord]:
+        """Parse a page of GitHub commits straight into records, as the log reads them.
+
+        Gives the records that :meth:`CommitRecord.from_activity` builds from
+        :meth:`_parse_commits`, without validating an activity, its contributor
+        and its url for every commit on the way.
+        """
+        full_name = repository.full_name
+        records = []
+        for commit in commits:
+            commit_data = commit.get("commit", {})
+            commit_author = commit_data.get("author", {})
+            timestamp, committed_at = self._commit_times(commit_data)
+            if since and (committed_at or timestamp) < since:
+                continue
 
-        path = f"/repos/{repository.owner}/{repository.name}/pulls"
-        prs = await self._paginate(path, params=params, limit=limit)
+            sha = commit["sha"]
+            records.append(
+                CommitRecord(
+                    id=f"github:commit:{sha}",
+                    type=ActivityType.COMMIT,
+                    repository=full_name,
+                    author=(commit.get("author") or {}).get(
+                        "login", commit_author.get("name", "unknown")
+                    ),
+                    timestamp=timestamp,
+                    title=commit_data.get("message", "").split("\n")[0][:100],
+                    sha=sha,
+                    parents=tuple(p["sha"] for p in commit.get("parents", [])),
+                )
+            )
 
+        return records
+
+    @staticmethod
+    def _commit_times(commit_data: dict[str, Any]) -> tuple[datetime, Optional[datetime]]:
+        """Return when a commit was authored and, if known, when it was committed."""
+        try:
+            timestamp = parse_timestamp(commit_data.get("author", {}).get("date", ""))
+        except ValueError:
+            timestamp = datetime.now(tz=timezone.utc)
+        committed_at = parse_optional_timestamp((commit_data.get("committer") or {}).get("date"))
+        return timestamp, committed_at
+
+    def _parse_pull_requests(
+        self,
+        repository: Repository,
+        prs: list[Any],
+        since: Optional[datetime] = None,
+    ) -> list[Activity]:
+        """Parse a page of GitHub pull requests into activities, dropping stale ones."""
         activities = []
         for pr in prs:
             # Filter by date if specified
-            updated_at = datetime.fromisoformat(pr["updated_at"].replace("Z", "+00:00"))
+            updated_at = parse_timestamp(pr["updated_at"])
             if since and updated_at < since:
                 continue
 
             user_data = pr.get("user", {})
             contributor = self._parse_contributor(user_data)
 
-            created_at = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
+            created_at = parse_timestamp(pr["created_at"])
 
             activity = Activity(
                 id=f"github:pr:{repository.full_name}:{pr['number']}",
@@ -281,8 +833,9 @@ class GitHubClient(PlatformClient):
                     "number": pr["number"],
                     "state": pr["state"],
                     "merged": pr.get("merged", False),
-                    "merged_at": pr.get("merged_at"),
-                    "closed_at": pr.get("closed_at"),
+                    "merged_at": parse_optional_timestamp(pr.get("merged_at")),
+                    "closed_at": parse_optional_timestamp(pr.get("closed_at")),
+                    "updated_at": updated_at,
                     "additions": pr.get("additions", 0),
                     "deletions": pr.get("deletions", 0),
                 },
@@ -291,31 +844,27 @@ class GitHubClient(PlatformClient):
 
         return activities
 
-    async def get_issues(
+    def _parse_issues(
         self,
         repository: Repository,
+        issues: list[Any],
         since: Optional[datetime] = None,
-        state: str = "all",
-        limit: int = 100,
     ) -> list[Activity]:
-        """Fetch issue activities for a repository."""
-        params: dict[str, Any] = {"state": state, "sort": "updated", "direction": "desc"}
-        if since:
-            params["since"] = since.isoformat()
-
-        path = f"/repos/{repository.owner}/{repository.name}/issues"
-        issues = await self._paginate(path, params=params, limit=limit)
-
+        """Parse a page of GitHub issues into activities, skipping pull requests."""
         activities = []
         for issue in issues:
             # Skip pull requests (they appear in the issues endpoint too)
             if "pull_request" in issue:
                 continue
 
+            updated_at = parse_optional_timestamp(issue.get("updated_at"))
+            if since and updated_at and updated_at < since:
+                continue
+
             user_data = issue.get("user", {})
             contributor = self._parse_contributor(user_data)
 
-            created_at = datetime.fromisoformat(issue["created_at"].replace("Z", "+00:00"))
+            created_at = parse_timestamp(issue["created_at"])
 
             activity = Activity(
                 id=f"github:issue:{repository.full_name}:{issue['number']}",
@@ -329,7 +878,8 @@ class GitHubClient(PlatformClient):
                 metadata={
                     "number": issue["number"],
                     "state": issue["state"],
-                    "closed_at": issue.get("closed_at"),
+                    "closed_at": parse_optional_timestamp(issue.get("closed_at")),
+                    "updated_at": updated_at,
                     "labels": [label["name"] for label in issue.get("labels", [])],
                 },
             )
@@ -337,6 +887,217 @@ class GitHubClient(PlatformClient):
 
         return activities
 
+    def _commits_query(
+        self,
+        repository: Repository,
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> tuple[str, dict[str, Any]]:
+        """Return the path and query parameters for listing commits."""
+        params: dict[str, Any] = {}
+        if since:
+            params["since"] = _cacheable_since(since)
+        if until:
+            params["until"] = until.isoformat()
+        return f"/repos/{repository.owner}/{repository.name}/commits", params
+
+    def _pulls_query(self, repository: Repository, state: str) -> tuple[str, dict[str, Any]]:
+        """Return the path and query parameters for listing pull requests by update time."""
+        params: dict[str, Any] = {"state": state, "sort": "updated", "direction": "desc"}
+        return f"/repos/{repository.owner}/{repository.name}/pulls", params
+
+    def _issues_query(
+        self,
+        repository: Repository,
+        since: Optional[datetime],
+        state: str,
+    ) -> tuple[str, dict[str, Any]]:
+        """Return the path and query parameters for listing issues by update time."""
+        params: dict[str, Any] = {"state": state, "sort": "updated", "direction": "desc"}
+        if since:
+            params["since"] = _cacheable_since(since)
+        return f"/repos/{repository.owner}/{repository.name}/issues", params
+
+    async def get_commits(
+        self,
+        repository: Repository,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> list[Activity]:
+        """Fetch commit activities for a repository."""
+        path, params = self._commits_query(repository, since, until)
+        commits = await self._paginate(path, params=params, limit=limit)
+        return self._parse_commits(repository, commits, since)
+
+    async def get_pull_requests(
+        self,
+        repository: Repository,
+        since: Optional[datetime] = None,
+        state: str = "all",
+        limit: int = 100,
+    ) -> list[Activity]:
+        """Fetch pull request activities for a repository."""
+        path, params = self._pulls_query(repository, state)
+        prs = await self._paginate(path, params=params, limit=limit)
+        return self._parse_pull_requests(repository, prs, since)
+
+    async def get_issues(
+        self,
+        repository: Repository,
+        since: Optional[datetime] = None,
+        state: str = "all",
+        limit: int = 100,
+    ) -> list[Activity]:
+        """Fetch issue activities for a repository."""
+        path, params = self._issues_query(repository, since, state)
+        issues = await self._paginate(path, params=params, limit=limit)
+        return self._parse_issues(repository, issues, since)
+
+    async def _aiter_activity_pages(
+        self,
+        path: str,
+        params: dict[str, Any],
+        parse: Callable[[list[Any]], list[Activity]],
+        limit: int,
+        stop_at_cutoff: bool = False,
+    ) -> AsyncIterator[ActivityPage]:
+        """Yield each page of a listing parsed into activities.
+
+        With ``stop_at_cutoff``, iteration stops after the first page from which
+        parsing dropped items, for listings ordered newest first.
+        """
+        async for page in self._aiter_pages(path, params=params, limit=limit):
+            activities = parse(page)
+            yield ActivityPage(activities, len(page))
+            if stop_at_cutoff and len(activities) < len(page):
+                break
+
+    def aiter_activity_pages(
+        self,
+        repository: Repository,
+        activity_type: ActivityType,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[ActivityPage]:
+        """Yield commit, pull request or issue pages with the items each page held.
+
+        ``limit`` caps the items requested, counted before parsing drops pull
+        requests from the issues listing or items older than ``since``, so a
+        listing that returned ``limit`` items may stop short of ``since`` even
+        if fewer activities were parsed.
+        """
+        if activity_type is ActivityType.COMMIT:
+            path, params = self._commits_query(repository, since, None)
+            return self._aiter_activity_pages(
+                path, params, lambda page: self._parse_commits(repository, page, since), limit
+            )
+        if activity_type is ActivityType.PULL_REQUEST:
+            # Listed most recently updated first, so paging stops at the cut-off
+            path, params = self._pulls_query(repository, "all")
+            return self._aiter_activity_pages(
+                path,
+                params,
+                lambda page: self._parse_pull_requests(repository, page, since),
+                limit,
+                stop_at_cutoff=True,
+            )
+        if activity_type is ActivityType.ISSUE:
+            path, params = self._issues_query(repository, since, "all")
+            return self._aiter_activity_pages(
+                path, params, lambda page: self._parse_issues(repository, page, since), limit
+            )
+        raise ValueError(f"Cannot list {activity_type.value} activities")
+
+    async def aiter_commits(
+        self,
+        repository: Repository,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[list[Activity]]:
+        """Yield commit activities for a repository one page at a time."""
+        path, params = self._commits_query(repository, since, until)
+        async for page in self._aiter_activity_pages(
+            path, params, lambda page: self._parse_commits(repository, page, since), limit
+        ):
+            if page.activities:
+                yield page.activities
+
+    async def aiter_commit_records(
+        self,
+        repository: Repository,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[list[CommitRecord]]:
+        """Yield commit records for a repository one page at a time.
+
+        For reports that only read records: the commits are the ones
+        :meth:`aiter_commits` yields, built without going through activities.
+        """
+        path, params = self._commits_query(repository, since, None)
+        async for page in self._aiter_pages(path, params=params, limit=limit):
+            records = self._parse_commit_records(repository, page, since)
+            if records:
+                yield records
+
+    async def aiter_pull_requests(
+        self,
+        repository: Repository,
+        since: Optional[datetime] = None,
+        state: str = "all",
+        limit: int = 100,
+    ) -> AsyncIterator[list[Activity]]:
+        """Yield pull request activities for a repository one page at a time.
+
+        Pull requests are listed most recently updated first, so iteration stops
+        at the first page that reaches back past ``since``.
+        """
+        path, params = self._pulls_query(repository, state)
+        async for page in self._aiter_activity_pages(
+            path,
+            params,
+            lambda page: self._parse_pull_requests(repository, page, since),
+            limit,
+            stop_at_cutoff=True,
+        ):
+            if page.activities:
+                yield page.activities
+
+    async def aiter_issues(
+        self,
+        repository: Repository,
+        since: Optional[datetime] = None,
+        state: str = "all",
+        limit: int = 100,
+    ) -> AsyncIterator[list[Activity]]:
+        """Yield issue activities for a repository one page at a time."""
+        path, params = self._issues_query(repository, since, state)
+        async for page in self._aiter_activity_pages(
+            path, params, lambda page: self._parse_issues(repository, page, since), limit
+        ):
+            if page.activities:
+                yield page.activities
+
+    async def aiter_activities(
+        self,
+        repository: Repository,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[list[Activity]]:
+        """Yield commits, then pull requests, then issues, one page at a time.
+
+        Unlike ``get_activities``, ``limit`` applies to each activity type and
+        the batches are not sorted across types.
+        """
+        async for batch in self.aiter_commits(repository, since=since, until=until, limit=limit):
+            yield batch
+        async for batch in self.aiter_pull_requests(repository, since=since, limit=limit):
+            yield batch
+        async for batch in self.aiter_issues(repository, since=since, limit=limit):
+            yield batch
+
     async def get_activities(
         self,
         repository: Repository,
@@ -405,14 +1166,7 @@ class GitHubClient(PlatformClient):
         prs = await self._paginate(path, params=params, limit=limit)
 
         if since:
-            result: list[Any] = []
-            for pr in prs:
-                closed_at_str = pr.get("closed_at") or pr.get("updated_at", "")
-                if closed_at_str:
-                    closed_dt = datetime.fromisoformat(closed_at_str.replace("Z", "+00:00"))
-                    if closed_dt >= since:
-                        result.append(pr)
-            return result
+            return _closed_since(prs, since)
         return prs
 
     async def get_pr_reviews(
@@ -441,6 +1195,213 @@ class GitHubClient(PlatformClient):
             return result
         return {"state": "unknown"}
 
+    async def get_open_pull_request_details(
+        self,
+        repository: Repository,
+        *,
+        limit: int = 100,
+        use_graphql: bool = True,
+    ) -> PullRequestDetails:
+        """Fetch open pull requests with their reviews and combined CI status.
+
+        With a token, the GraphQL API returns everything in a few paged queries.
+        Without one, or if the GraphQL query fails, this falls back to REST with
+        two extra requests per pull request.
+        """
+        if use_graphql and self._token:
+            try:
+                return await self._graphql_pull_request_details(
+                    repository,
+                    states=["OPEN"],
+                    order=("CREATED_AT", "ASC"),
+                    with_status=True,
+                    limit=limit,
+                )
+            except GitHubAPIError as e:
+                logger.warning(
+                    "GraphQL fetch failed for %s, falling back to REST: %s",
+                    repository.full_name,
+                    e,
+                )
+
+        prs = await self.get_open_pull_requests(repository, limit=limit)
+        return await self._rest_pull_request_details(repository, prs, prs, with_status=True)
+
+    async def get_closed_pull_request_details(
+        self,
+        repository: Repository,
+        *,
+        since: Optional[datetime] = None,
+        limit: int = 200,
+        use_graphql: bool = True,
+    ) -> PullRequestDetails:
+        """Fetch closed pull requests, with reviews for the merged ones.
+
+        Uses GraphQL when possible and falls back to REST, as
+        :meth:`get_open_pull_request_details` does. CI status is not fetched.
+        """
+        if use_graphql and self._token:
+            try:
+                return await self._graphql_pull_request_details(
+                    repository,
+                    states=["CLOSED", "MERGED"],
+                    order=("UPDATED_AT", "DESC"),
+                    with_status=False,
+                    since=since,
+                    limit=limit,
+                )
+            except GitHubAPIError as e:
+                logger.warning(
+                    "GraphQL fetch failed for %s, falling back to REST: %s",
+                    repository.full_name,
+                    e,
+                )
+
+        prs = await self.get_closed_pull_requests(repository, since=since, limit=limit)
+        merged = [pr for pr in prs if pr.get("merged_at")]
+        return await self._rest_pull_request_details(repository, prs, merged, with_status=False)
+
+    async def _rest_pull_request_details(
+        self,
+        repository: Repository,
+        prs: list[Any],
+        reviewed_prs: list[Any],
+        *,
+        with_status: bool,
+    ) -> PullRequestDetails:
+        """Fetch reviews and CI status concurrently, one REST request per PR each."""
+        details = PullRequestDetails(pull_requests=prs)
+
+        review_results = await asyncio.gather(
+            *(self.get_pr_reviews(repository, pr["number"]) for pr in reviewed_prs),
+            return_exceptions=True,
+        )
+        for pr, reviews in zip(reviewed_prs, review_results):
+            details.reviews[pr["number"]] = reviews if isinstance(reviews, list) else []
+
+        if with_status:
+            shas = [pr["head"]["sha"] for pr in prs if pr.get("head", {}).get("sha")]
+            status_results = await asyncio.gather(
+                *(self.get_commit_status(repository, sha) for sha in shas),
+                return_exceptions=True,
+            )
+            for sha, status in zip(shas, status_results):
+                details.statuses[sha] = status if isinstance(status, dict) else {"state": "unknown"}
+
+        return _parse_pull_request_times(details)
+
+    async def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Run a GraphQL query and return its ``data`` object."""
+        result = await self._request(
+            "POST", self._graphql_url, json_body={"query": query, "variables": variables}
+        )
+        if not isinstance(result, dict):
+            raise GitHubAPIError("Unexpected GraphQL response")
+        errors = result.get("errors")
+        if errors:
+            message = "; ".join(error.get("message", "unknown error") for error in errors)
+            raise GitHubAPIError(f"GraphQL error: {message}", response=result)
+        return result.get("data") or {}
+
+    async def _graphql_pull_request_details(
+        self,
+        repository: Repository,
+        *,
+        states: list[str],
+        order: tuple[str, str],
+        with_status: bool,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> PullRequestDetails:
+        """Page through pull requests, reviews and CI status with GraphQL.
+
+        With ``since``, results must be ordered by most recently updated first so
+        paging can stop at the first page that reaches past the window.
+        """
+        details = PullRequestDetails()
+        variables: dict[str, Any] = {
+            "owner": repository.owner,
+            "name": repository.name,
+            "states": states,
+            "orderField": order[0],
+            "orderDirection": order[1],
+            "withStatus": with_status,
+        }
+        after: Optional[str] = None
+
+        while len(details.pull_requests) < limit:
+            first = min(_GRAPHQL_PAGE_SIZE, limit - len(details.pull_requests))
+            data = await self._graphql(
+                _PULL_REQUESTS_QUERY, {**variables, "first": first, "after": after}
+            )
+            if not data.get("repository"):
+                raise GitHubAPIError("Resource not found", 404)
+
+            connection = data["repository"]["pullRequests"]
+            nodes = connection["nodes"]
+            for node in nodes:
+                pr, reviews, status = _graphql_pull_request(node)
+                details.pull_requests.append(pr)
+                details.reviews[pr["number"]] = reviews
+                if status is not None and pr["head"]["sha"]:
+                    details.statuses[pr["head"]["sha"]] = status
+
+            if not connection["pageInfo"]["hasNextPage"] or not nodes:
+                break
+            if since:
+                oldest = parse_timestamp(nodes[-1]["updatedAt"])
+                if oldest < since:
+                    break
+            after = connection["pageInfo"]["endCursor"]
+
+        if since:
+            details.pull_requests = _closed_since(details.pull_requests, since)
+        return _parse_pull_request_times(details)
+
     async def close(self) -> None:
         """Close the HTTP client."""
+        stats = self._limiter.stats
+        logger.debug(
+            "GitHub requests: %d total, %d queued (max depth %d), wait avg %.3fs max %.3fs",
+            stats.total_requests,
+            stats.queued_requests,
+            stats.max_queue_depth,
+            stats.average_wait_time,
+            stats.max_wait_time,
+        )
+        if self._coalesced_requests:
+            logger.debug(
+                "GitHub requests coalesced with identical ones in flight: %d",
+                self._coalesced_requests,
+            )
+        connection_stats = self._connections.stats
+        if connection_stats.responses:
+            logger.debug(
+                "GitHub connections: %d opened for %d responses (%.0f%% reused), %s",
+                connection_stats.connections,
+                connection_stats.responses,
+                connection_stats.reuse_rate * 100,
+                ", ".join(
+                    f"{version} {count}"
+                    for version, count in sorted(connection_stats.http_versions.items())
+                ),
+            )
+        rate_stats = self._tokens.stats
+        if rate_stats.paced_requests or rate_stats.pauses:
+            logger.debug(
+                "GitHub rate limit: %d requests paced, %d paused, %.1fs delay in total",
+                rate_stats.paced_requests,
+                rate_stats.pauses,
+                rate_stats.total_delay,
+            )
+        retry_stats = self._retry.stats
+        if retry_stats.retries:
+            logger.debug(
+                "GitHub retries: %d retried, %d cooldowns, %.1fs delay in total",
+                retry_stats.retries,
+                retry_stats.cooldowns,
+                retry_stats.total_delay,
+            )
         await self._client.aclose()
+        if self._cache is not None:
+            self._cache.close()
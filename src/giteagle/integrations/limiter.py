@@ -0,0 +1,91 @@
+"""Client-wide admission control for outgoing API requests."""
+
+import asyncio
+import time
+from dataclasses import dataclass, replace
+from typing import Optional
+
+
+@dataclass
+class LimiterStats:
+    """Counters describing how requests moved through a RequestLimiter."""
+
+    max_concurrent: int
+    in_flight: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    total_requests: int = 0
+    queued_requests: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        """Return the mean time a request waited for admission, in seconds."""
+        if self.total_requests == 0:
+            return 0.0
+        return self.total_wait_time / self.total_requests
+
+
+class RequestLimiter:
+    """Bound the number of in-flight requests and record queueing statistics.
+
+    Use as an async context manager around each request. Requests beyond
+    ``max_concurrent`` wait in FIFO order until a slot is released.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        self._max_concurrent = max_concurrent
+        # Created lazily so the semaphore binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._stats = LimiterStats(max_concurrent=max_concurrent)
+
+    @property
+    def max_concurrent(self) -> int:
+        """Return the maximum number of concurrent requests."""
+        return self._max_concurrent
+
+    @property
+    def stats(self) -> LimiterStats:
+        """Return a snapshot of the limiter counters."""
+        return replace(self._stats)
+
+    async def acquire(self) -> None:
+        """Wait for a request slot."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+
+        stats = self._stats
+        must_wait = self._semaphore.locked()
+        start = time.monotonic()
+        if must_wait:
+            stats.queued_requests += 1
+            stats.queue_depth += 1
+            stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            if must_wait:
+                stats.queue_depth -= 1
+
+        waited = time.monotonic() - start
+        stats.total_requests += 1
+        stats.total_wait_time += waited
+        stats.max_wait_time = max(stats.max_wait_time, waited)
+        stats.in_flight += 1
+
+    def release(self) -> None:
+        """Release a request slot."""
+        if self._semaphore is None:
+            raise RuntimeError("release() called before acquire()")
+        self._stats.in_flight -= 1
+        self._semaphore.release()
+
+    async def __aenter__(self) -> "RequestLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        self.release()
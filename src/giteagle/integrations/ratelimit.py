@@ -0,0 +1,121 @@
+"""Pacing of API requests against GitHub's rate-limit budget."""
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Optional
+
+# Extra wait after a reset time, as the API's clock and ours may disagree
+_RESET_MARGIN = 1.0
+
+
+@dataclass
+class RateLimitBudget:
+    """The request budget of one rate-limit resource, as last reported by the API."""
+
+    resource: str
+    limit: int
+    remaining: int
+    reset_at: float  # Epoch seconds when the budget is refilled
+    next_slot: float = 0.0  # Earliest start of the next paced request, epoch seconds
+
+    @property
+    def reset_datetime(self) -> datetime:
+        """Return when the budget is refilled, as an aware datetime."""
+        return datetime.fromtimestamp(self.reset_at, tz=timezone.utc)
+
+
+@dataclass
+class RateLimitStats:
+    """Counters describing how a RateLimitScheduler delayed requests."""
+
+    paced_requests: int = 0
+    pauses: int = 0
+    total_delay: float = 0.0
+
+
+class RateLimitScheduler:
+    """Spread requests over what is left of the rate-limit window.
+
+    Budgets are tracked per resource (``core``, ``graphql``, ...) from the
+    ``X-RateLimit-*`` headers of every response. :meth:`reserve` books a request
+    against its budget and returns how long to wait before sending it:
+
+    * nothing while plenty of the budget is left;
+    * once the remaining budget drops below ``pace_below`` of the limit, enough
+      to space the rest of it evenly until the reset time, so a long sync slows
+      down instead of running dry;
+    * once it is spent, until the reset time.
+
+    The scheduler never sleeps itself; callers await the returned delay.
+    """
+
+    def __init__(self, pace_below: float = 0.1) -> None:
+        if not 0 <= pace_below <= 1:
+            raise ValueError(f"pace_below must be between 0 and 1, got {pace_below}")
+        self._pace_below = pace_below
+        self._budgets: dict[str, RateLimitBudget] = {}
+        self._stats = RateLimitStats()
+
+    @property
+    def stats(self) -> RateLimitStats:
+        """Return a snapshot of the scheduler counters."""
+        return replace(self._stats)
+
+    def budget(
+        self, resource: str = "core", now: Optional[float] = None
+    ) -> Optional[RateLimitBudget]:
+        """Return a copy of a resource's current budget, or None if unknown or expired."""
+        budget = self._current(resource, time.time() if now is None else now)
+        return None if budget is None else replace(budget)
+
+    def _current(self, resource: str, now: float) -> Optional[RateLimitBudget]:
+        budget = self._budgets.get(resource)
+        if budget is not None and budget.reset_at <= now:
+            # The window has rolled over; the next response reports the new one
+            del self._budgets[resource]
+            return None
+        return budget
+
+    def update(self, limit: int, remaining: int, reset_at: float, resource: str = "core") -> None:
+        """Record a budget reported by the API."""
+        budget = self._budgets.get(resource)
+        if budget is None or reset_at > budget.reset_at:
+            self._budgets[resource] = RateLimitBudget(resource, limit, remaining, reset_at)
+        elif reset_at == budget.reset_at:
+            # Responses to concurrent requests arrive out of order, and requests
+            # already reserved are not counted yet; the lowest count is freshest
+            budget.remaining = min(budget.remaining, remaining)
+
+    def update_from_headers(self, headers: Mapping[str, str], resource: str = "core") -> None:
+        """Record the budget in a response's ``X-RateLimit-*`` headers, if present."""
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_at = float(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        self.update(limit, remaining, reset_at, headers.get("X-RateLimit-Resource", resource))
+
+    def reserve(self, resource: str = "core", now: Optional[float] = None) -> float:
+        """Book a request against a resource and return the seconds to wait before sending it."""
+        now = time.time() if now is None else now
+        budget = self._current(resource, now)
+        if budget is None:
+            return 0.0
+
+        if budget.remaining <= 0:
+            delay = budget.reset_at - now + _RESET_MARGIN
+            self._stats.pauses += 1
+        elif budget.remaining <= budget.limit * self._pace_below:
+            slot = max(now, budget.next_slot)
+            budget.next_slot = slot + (budget.reset_at - slot) / budget.remaining
+            delay = slot - now
+            if delay > 0:
+                self._stats.paced_requests += 1
+        else:
+            delay = 0.0
+        budget.remaining = max(budget.remaining - 1, 0)
+        self._stats.total_delay += delay
+        return delay
@@ -0,0 +1,159 @@
+"""Backoff policy for retrying throttled and failed API requests."""
+
+import random
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Statuses worth retrying: throttling and transient gateway failures
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# GitHub asks for at least a minute's wait after a secondary rate limit without Retry-After
+_SECONDARY_LIMIT_DELAY = 60.0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Return the seconds a ``Retry-After`` header asks to wait, or None if absent or invalid.
+
+    The header holds either a number of seconds or an HTTP date.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = time.time() if now is None else now
+    return max(retry_at.timestamp() - now, 0.0)
+
+
+def is_secondary_rate_limit(status_code: int, headers: Mapping[str, str], body: bytes) -> bool:
+    """Return whether a 403 response is GitHub's secondary (abuse) rate limit."""
+    if status_code != 403:
+        return False
+    return "Retry-After" in headers or b"secondary rate limit" in body.lower()
+
+
+@dataclass
+class RetryState:
+    """Backoff progress of one request."""
+
+    attempts: int = 0
+    last_delay: float = 0.0
+    total_delay: float = 0.0
+
+
+@dataclass
+class RetryStats:
+    """Counters describing how a RetryPolicy delayed requests."""
+
+    retries: int = 0
+    cooldowns: int = 0
+    total_delay: float = 0.0
+
+
+class RetryPolicy:
+    """Decide whether and how long to wait before retrying a failed request.
+
+    Delays use decorrelated jitter: each is drawn between ``base_delay`` and
+    three times the previous one, capped at ``max_delay``, so retries of
+    requests that failed together drift apart. A ``Retry-After`` header sets
+    the least a retry waits. A request gives up after ``max_attempts`` or once
+    its waits would exceed ``max_total_delay`` seconds.
+
+    Throttling is shared: after a throttled response the policy starts a
+    cooldown that every request of the client waits out before being sent, so
+    concurrent page fetches back off together instead of each hitting the
+    limit once more. Like the rate-limit scheduler, the policy never sleeps
+    itself; callers await the returned delays.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        max_total_delay: float = 120.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+        if not 0 < base_delay <= max_delay:
+            raise ValueError("base_delay must be positive and no greater than max_delay")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_total_delay = max_total_delay
+        self._rng = rng or random.Random()
+        self._resume_at = 0.0  # Monotonic time until which requests hold off
+        self._stats = RetryStats()
+
+    @property
+    def stats(self) -> RetryStats:
+        """Return a snapshot of the retry counters."""
+        return replace(self._stats)
+
+    def backoff(
+        self,
+        state: RetryState,
+        retry_after: Optional[float] = None,
+        minimum: float = 0.0,
+    ) -> Optional[float]:
+        """Record a failed attempt and return the delay before the next one.
+
+        Returns None when the request should give up instead: its attempts are
+        used up, or the delay would take its total wait past ``max_total_delay``.
+        """
+        state.attempts += 1
+        if state.attempts >= self.max_attempts:
+            return None
+
+        upper = max(state.last_delay * 3, self.base_delay)
+        delay = min(self.max_delay, self._rng.uniform(self.base_delay, upper))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        delay = max(delay, minimum)
+        if state.total_delay + delay > self.max_total_delay:
+            return None
+
+        state.last_delay = delay
+        state.total_delay += delay
+        self._stats.retries += 1
+        self._stats.total_delay += delay
+        return delay
+
+    def response_backoff(
+        self, state: RetryState, status_code: int, headers: Mapping[str, str]
+    ) -> Optional[float]:
+        """Record a retryable response and return the delay before the next attempt, or None.
+
+        Throttled responses (429, secondary rate limits, or any ``Retry-After``)
+        also start the shared cooldown. Secondary rate limits without
+        ``Retry-After`` wait at least a minute.
+        """
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        minimum = _SECONDARY_LIMIT_DELAY if status_code == 403 and retry_after is None else 0.0
+        delay = self.backoff(state, retry_after, minimum)
+        if delay is not None and (status_code in (403, 429) or retry_after is not None):
+            self.cool_down(delay)
+        return delay
+
+    def cool_down(self, delay: float, now: Optional[float] = None) -> None:
+        """Hold off all requests for ``delay`` seconds."""
+        now = time.monotonic() if now is None else now
+        if now + delay > self._resume_at:
+            self._resume_at = now + delay
+            self._stats.cooldowns += 1
+
+    def cooldown_remaining(self, now: Optional[float] = None) -> float:
+        """Return the seconds left in the shared cooldown."""
+        now = time.monotonic() if now is None else now
+        return max(self._resume_at - now, 0.0)
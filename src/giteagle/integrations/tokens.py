@@ -0,0 +1,120 @@
+"""Pool of API tokens sharing the request load of one client."""
+
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from giteagle.integrations.ratelimit import RateLimitBudget, RateLimitScheduler, RateLimitStats
+
+
+def mask_token(token: Optional[str]) -> str:
+    """Return a label for a token that does not reveal it."""
+    if not token:
+        return "anonymous"
+    return f"...{token[-4:]}" if len(token) >= 12 else "..."
+
+
+@dataclass
+class TokenUsage:
+    """Requests made with one token of a TokenPool."""
+
+    label: str
+    requests: int = 0
+    rate_limited: int = 0
+    remaining: Optional[int] = None  # Core budget left, as last reported
+
+
+class PooledToken:
+    """One token of a TokenPool, with its own rate-limit budget and usage counters."""
+
+    def __init__(self, token: Optional[str], label: str, pace_below: float = 0.1) -> None:
+        self.token = token
+        self.rate_limits = RateLimitScheduler(pace_below)
+        self.usage = TokenUsage(label)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Return the headers authenticating a request with this token."""
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+
+class TokenPool:
+    """Route each request to the token with the most rate-limit budget left.
+
+    Every token tracks its own budget. Tokens whose budget is not known yet
+    count as unused, so each is tried before any is preferred by budget; once a
+    token runs dry, requests fail over to the others. Only when all are spent
+    does a request wait, for the token that resets first.
+    """
+
+    def __init__(self, tokens: Sequence[Optional[str]], pace_below: float = 0.1) -> None:
+        unique: list[Optional[str]] = [*dict.fromkeys(token for token in tokens if token)]
+        if not unique:
+            unique = [None]
+        self._tokens = [
+            PooledToken(token, f"#{index} ({mask_token(token)})", pace_below)
+            for index, token in enumerate(unique, 1)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    @property
+    def tokens(self) -> list[PooledToken]:
+        """Return the pooled tokens in configured order."""
+        return list(self._tokens)
+
+    def select(self, resource: str = "core", now: Optional[float] = None) -> PooledToken:
+        """Return the token the next request for a resource should use."""
+        now = time.time() if now is None else now
+
+        def headroom(token: PooledToken) -> tuple[float, float]:
+            budget = token.rate_limits.budget(resource, now)
+            if budget is None:
+                return math.inf, 0.0
+            # Among equally spent tokens, the one refilled first
+            return budget.remaining, -budget.reset_at
+
+        return max(self._tokens, key=headroom)
+
+    def budget(
+        self, resource: str = "core", now: Optional[float] = None
+    ) -> Optional[RateLimitBudget]:
+        """Return the combined budget of all tokens, or None if any token's is unknown.
+
+        The combined budget resets when the first token does.
+        """
+        now = time.time() if now is None else now
+        budgets = [token.rate_limits.budget(resource, now) for token in self._tokens]
+        known = [budget for budget in budgets if budget is not None]
+        if len(known) < len(budgets):
+            return None
+        return RateLimitBudget(
+            resource,
+            limit=sum(budget.limit for budget in known),
+            remaining=sum(budget.remaining for budget in known),
+            reset_at=min(budget.reset_at for budget in known),
+        )
+
+    @property
+    def stats(self) -> RateLimitStats:
+        """Return the rate-limit scheduler counters summed over all tokens."""
+        total = RateLimitStats()
+        for token in self._tokens:
+            stats = token.rate_limits.stats
+            total.paced_requests += stats.paced_requests
+            total.pauses += stats.pauses
+            total.total_delay += stats.total_delay
+        return total
+
+    def usage(self) -> list[TokenUsage]:
+        """Return a snapshot of each token's usage, in configured order."""
+        snapshots = []
+        for token in self._tokens:
+            budget = token.rate_limits.budget("core")
+            snapshots.append(
+                replace(token.usage, remaining=None if budget is None else budget.remaining)
+            )
+        return snapshots
@@ -1,9 +1,14 @@
 """Tests for the activity aggregator."""
 
-from datetime import datetime, timedelta
+import random
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
 
 from giteagle.core.aggregator import ActivityAggregator
-from giteagle.core.models import Activity, ActivityType, Repository
+from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+from giteagle.core.store import ActivityStore
 
 
 class TestActivityAggregator:
@@ -227,6 +232,39 @@ class TestActivityAggregator:
         assert len(timeline) == 5
         assert all(count == 1 for count in timeline.values())
 
+    def test_activity_timeline_follows_replaced_timestamp(
+        self, sample_repository, sample_contributor
+    ):
+        """Test that replacing an activity moves it to its new bucket."""
+        aggregator = ActivityAggregator()
+        activity = Activity(
+            id="c1",
+            type=ActivityType.COMMIT,
+            repository=sample_repository,
+            contributor=sample_contributor,
+            timestamp=datetime(2024, 1, 31, 23, 0, tzinfo=timezone(timedelta(hours=-3))),
+            title="Commit",
+        )
+        aggregator.add_activities([activity])
+        assert aggregator.get_activity_timeline(granularity="month") == {"2024-01": 1}
+
+        aggregator.add_activities(
+            [activity.model_copy(update={"timestamp": datetime(2024, 2, 2, tzinfo=timezone.utc)})]
+        )
+        assert aggregator.get_activity_timeline(granularity="month") == {"2024-02": 1}
+
+    def test_get_activity_timeline_by_type(self, sample_activities):
+        """Test splitting the timeline per activity type."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(sample_activities)
+
+        timelines = aggregator.get_activity_timeline_by("type", granularity="month")
+
+        assert set(timelines) == {a.type.value for a in sample_activities}
+        assert sum(sum(t.values()) for t in timelines.values()) == len(sample_activities)
+        with pytest.raises(ValueError):
+            aggregator.get_activity_timeline_by("contributor")
+
     def test_get_top_contributors(self, sample_activities):
         """Test getting top contributors."""
         aggregator = ActivityAggregator()
@@ -285,3 +323,445 @@ class TestActivityAggregator:
         assert len(result.by_repository) == 0
         assert len(result.by_contributor) == 0
         assert len(result.by_type) == 0
+
+
+class TestRunningAggregates:
+    """Tests for aggregates maintained as activities are added and removed."""
+
+    def test_unfiltered_aggregate_matches_filtered_path(self, sample_activities):
+        """Test that the running counts agree with a filtered aggregation."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(sample_activities)
+
+        fast = aggregator.aggregate()
+        # A since far in the past matches everything but takes the filtered path
+        slow = aggregator.aggregate(since=datetime.now() - timedelta(days=365))
+
+        assert fast.total_count == slow.total_count
+        assert fast.by_repository == slow.by_repository
+        assert fast.by_contributor == slow.by_contributor
+        assert fast.by_type == slow.by_type
+        assert fast.date_range == slow.date_range
+        assert fast.activities == slow.activities
+
+    def test_unfiltered_aggregate_reads_time_index(self, sample_activities):
+        """Test that unfiltered results come newest first without re-sorting per call."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(sample_activities[::2])
+        aggregator.aggregate()
+        aggregator.add_activities(sample_activities[1::2])
+
+        with mock.patch("giteagle.core.aggregator.sorted", create=True) as sorted_mock:
+            result = aggregator.aggregate()
+
+        sorted_mock.assert_not_called()
+        assert result.activities == sorted(
+            sample_activities, key=lambda a: a.timestamp, reverse=True
+        )
+
+    def test_unfiltered_aggregate_keeps_ties_in_insertion_order(self, sample_activities):
+        """Test that same-time activities come in insertion order with or without filters."""
+        when = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        ties = [
+            activity.model_copy(update={"id": f"tie-{i}", "timestamp": when})
+            for i, activity in enumerate(sample_activities[:3])
+        ]
+        later = sample_activities[3].model_copy(
+            update={"id": "later", "timestamp": when + timedelta(hours=1)}
+        )
+        aggregator = ActivityAggregator()
+        aggregator.add_activities([later, *ties])
+        aggregator.aggregate()
+        # Moving the first row onto the tied timestamp puts it ahead of the ties
+        aggregator.add_activities(
+            [
+                later.model_copy(
+                    update={"timestamp": when, "metadata": {"updated_at": "2099-01-01T00:00:00Z"}}
+                )
+            ]
+        )
+
+        unfiltered = [a.id for a in aggregator.aggregate().activities]
+        filtered = [a.id for a in aggregator.aggregate(since=when - timedelta(days=1)).activities]
+
+        assert unfiltered == filtered == ["later", "tie-0", "tie-1", "tie-2"]
+
+    def test_remove_activities_updates_counts_and_bounds(self, sample_activities):
+        """Test that removal is reflected in counts, bounds and top-N."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(sample_activities)
+        newest = max(sample_activities, key=lambda a: a.timestamp)
+        prs = [a for a in sample_activities if a.type == ActivityType.PULL_REQUEST]
+
+        assert aggregator.remove_activities([newest, *prs]) == 4
+
+        result = aggregator.aggregate()
+        assert result.total_count == 6
+        assert ActivityType.PULL_REQUEST not in result.by_type
+        assert result.by_contributor == {"testuser": 6}
+        assert result.date_range[1] == max(
+            a.timestamp for a in sample_activities if a not in prs and a != newest
+        )
+        assert aggregator.get_top_contributors() == [("testuser", 6)]
+
+    def test_remove_unknown_activity(self, sample_activities, sample_activity):
+        """Test that removing an activity that was never added is a no-op."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(sample_activities)
+
+        assert aggregator.remove_activities([sample_activity]) == 0
+        assert aggregator.aggregate().total_count == len(sample_activities)
+
+    def test_top_n_ties_keep_first_seen_order(self, multiple_repos, sample_contributor):
+        """Test that equal counts are ranked in first-seen order."""
+        aggregator = ActivityAggregator()
+        now = datetime.now()
+        aggregator.add_activities(
+            [
+                Activity(
+                    id=f"{repo.name}-{i}",
+                    type=ActivityType.COMMIT,
+                    repository=repo,
+                    contributor=sample_contributor,
+                    timestamp=now,
+                    title="Commit",
+                )
+                for repo in reversed(multiple_repos)
+                for i in range(2)
+            ]
+        )
+
+        assert aggregator.get_most_active_repositories(limit=2) == [
+            ("org2/repo-3", 2),
+            ("org1/repo-2", 2),
+        ]
+
+
+class TestDeduplicatingIngestion:
+    """Tests for id-keyed upserts in add_activities."""
+
+    @staticmethod
+    def pr(repo, updated_at, username="alice", hours_ago=0, state="open"):
+        """Create a pull request activity with a fixed id."""
+        return Activity(
+            id="github:pr:1",
+            type=ActivityType.PULL_REQUEST,
+            repository=repo,
+            contributor=Contributor(username=username),
+            timestamp=datetime(2024, 1, 10, tzinfo=timezone.utc) - timedelta(hours=hours_ago),
+            title="PR",
+            metadata={"state": state, "updated_at": updated_at},
+        )
+
+    def test_adding_twice_does_not_double_count(self, sample_activities):
+        """Test that repeated fetches of the same activities are merged."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(sample_activities)
+        aggregator.add_activities(sample_activities)
+
+        result = aggregator.aggregate()
+        assert result.total_count == len(sample_activities)
+        assert result.by_contributor["testuser"] == 7
+        assert len(aggregator.filter(activity_types=[ActivityType.COMMIT])) == 5
+
+    def test_shares_entity_instances(self, sample_activities):
+        """Test that deserialized copies are pointed at shared entities."""
+        copies = [Activity.model_validate_json(a.model_dump_json()) for a in sample_activities]
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(copies)
+
+        held = aggregator.activities
+        assert len({id(a.repository) for a in held}) == len({a.repository for a in held})
+        assert len({id(a.contributor) for a in held}) == len({a.contributor for a in held})
+
+    def test_newer_metadata_wins(self, sample_repository):
+        """Test that a more recently updated copy replaces the held one, in place."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities([self.pr(sample_repository, "2024-01-11T00:00:00Z")])
+        aggregator.add_activities(
+            [self.pr(sample_repository, "2024-01-12T00:00:00Z", state="closed")]
+        )
+        aggregator.add_activities(
+            [self.pr(sample_repository, "2024-01-11T12:00:00Z", state="reopened")]
+        )
+
+        assert [a.metadata["state"] for a in aggregator.activities] == ["closed"]
+
+    def test_replacement_moves_index_entries(self, sample_repository):
+        """Test that a changed contributor and timestamp are re-indexed."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities([self.pr(sample_repository, "2024-01-11T00:00:00Z")])
+        aggregator.filter(since=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        aggregator.add_activities(
+            [self.pr(sample_repository, "2024-01-12T00:00:00Z", username="bob", hours_ago=48)]
+        )
+
+        assert aggregator.filter(contributors=["alice"]) == []
+        assert len(aggregator.filter(contributors=["bob"])) == 1
+        assert aggregator.get_top_contributors() == [("bob", 1)]
+        assert aggregator.filter(since=datetime(2024, 1, 9, tzinfo=timezone.utc)) == []
+        expected = datetime(2024, 1, 8, tzinfo=timezone.utc)
+        assert aggregator.aggregate().date_range == (expected, expected)
+
+    def test_duplicates_within_a_batch(self, sample_activity):
+        """Test that duplicates inside one batch are merged."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities([sample_activity, sample_activity])
+        assert aggregator.aggregate().total_count == 1
+
+    def test_records_follow_replacements(self, sample_repository):
+        """Test that cached records are reused and rebuilt when a row is replaced."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities([self.pr(sample_repository, "2024-01-11T00:00:00Z")])
+        first = aggregator.records()
+        assert aggregator.records(contributors=["alice"])[0] is first[0]
+
+        aggregator.add_activities(
+            [self.pr(sample_repository, "2024-01-12T00:00:00Z", username="bob", state="closed")]
+        )
+
+        (record,) = aggregator.records()
+        assert record is not first[0]
+        assert (record.author, record.state) == ("bob", "closed")
+        assert aggregator.records(contributors=["alice"]) == []
+
+
+class TestIndexedFilter:
+    """Tests that indexed filtering matches a full scan."""
+
+    @staticmethod
+    def scan(activities, repositories, contributors, activity_types, since, until):
+        """Filter activities the straightforward way."""
+        repo_names = {r.full_name for r in repositories or []}
+        return [
+            a
+            for a in activities
+            if (not repo_names or a.repository.full_name in repo_names)
+            and (not contributors or a.contributor.username in contributors)
+            and (not activity_types or a.type in activity_types)
+            and (since is None or a.timestamp >= since)
+            and (until is None or a.timestamp <= until)
+        ]
+
+    def test_random_filters_match_scan(self, multiple_repos):
+        """Test many filter combinations against a full scan, in insertion order."""
+        rng = random.Random(42)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        types = list(ActivityType)
+        aggregator = ActivityAggregator()
+        added: list[Activity] = []
+
+        for batch in range(3):
+            activities = [
+                Activity(
+                    id=f"activity-{batch}-{i}",
+                    type=rng.choice(types),
+                    repository=rng.choice(multiple_repos),
+                    contributor=Contributor(username=f"user{rng.randrange(5)}"),
+                    timestamp=start + timedelta(hours=rng.randrange(24 * 60)),
+                    title=f"Activity {i}",
+                )
+                for i in range(150)
+            ]
+            aggregator.add_activities(activities)
+            added.extend(activities)
+
+            for _ in range(50):
+                filters = {
+                    "repositories": rng.choice([None, rng.sample(multiple_repos, 2)]),
+                    "contributors": rng.choice([None, ["user1"], ["user2", "user3"]]),
+                    "activity_types": rng.choice([None, rng.sample(types, 2)]),
+                    "since": rng.choice([None, start + timedelta(days=rng.randrange(60))]),
+                    "until": rng.choice([None, start + timedelta(days=rng.randrange(60))]),
+                }
+                assert aggregator.filter(**filters) == self.scan(added, **filters)
+
+    def test_time_filter_sees_activities_added_later(self, sample_repository):
+        """Test that the time index picks up activities added after a query."""
+        aggregator = ActivityAggregator()
+        since = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+        def commit(activity_id, day):
+            return Activity(
+                id=activity_id,
+                type=ActivityType.COMMIT,
+                repository=sample_repository,
+                contributor=Contributor(username="alice"),
+                timestamp=datetime(2024, 1, day, tzinfo=timezone.utc),
+                title=activity_id,
+            )
+
+        aggregator.add_activities([commit("a", 3), commit("b", 1)])
+        assert [a.id for a in aggregator.filter(since=since)] == ["a"]
+
+        aggregator.add_activities([commit("c", 2)])
+        assert [a.id for a in aggregator.filter(since=since)] == ["a", "c"]
+
+    def test_clear_resets_indexes(self, sample_activities, sample_contributor):
+        """Test that indexes are emptied with the activities."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(sample_activities)
+        aggregator.clear()
+
+        assert aggregator.filter(contributors=[sample_contributor.username]) == []
+        assert aggregator.filter(since=datetime.now() - timedelta(days=1)) == []
+        assert aggregator.get_contributor_stats(sample_contributor.username) is None
+
+
+class TestStoreBackedAggregator:
+    """Tests for an ActivityAggregator constructed over an ActivityStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a store in a temporary directory."""
+        activity_store = ActivityStore.in_directory(tmp_path)
+        yield activity_store
+        activity_store.close()
+
+    @pytest.fixture
+    def history(self, multiple_repos):
+        """Create two months of activity across repos, contributors and types."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        types = [ActivityType.COMMIT, ActivityType.PULL_REQUEST, ActivityType.ISSUE]
+        return [
+            Activity(
+                id=f"activity-{i}",
+                type=types[i % 3],
+                repository=multiple_repos[i % len(multiple_repos)],
+                contributor=Contributor(username=f"user{i % 4}"),
+                timestamp=start + timedelta(hours=7 * i),
+                title=f"Activity {i}",
+            )
+            for i in range(200)
+        ]
+
+    @pytest.fixture
+    def aggregators(self, store, history):
+        """Create an in-memory and a store-backed aggregator with the same history."""
+        memory = ActivityAggregator()
+        memory.add_activities(history)
+        backed = ActivityAggregator(store=store)
+        backed.add_activities(history)
+        return memory, backed
+
+    def test_filter_matches_in_memory(self, aggregators, multiple_repos):
+        """Test that indexed filters return the same activities."""
+        memory, backed = aggregators
+        since = datetime(2024, 1, 10, tzinfo=timezone.utc)
+        until = datetime(2024, 1, 30, tzinfo=timezone.utc)
+        filters = {
+            "repositories": multiple_repos[:2],
+            "contributors": ["user1", "user2"],
+            "activity_types": [ActivityType.COMMIT, ActivityType.ISSUE],
+            "since": since,
+            "until": until,
+        }
+
+        expected = memory.filter(**filters)
+        result = backed.filter(**filters)
+
+        assert expected
+        assert {a.id for a in result} == {a.id for a in expected}
+        assert [a.timestamp for a in result] == sorted((a.timestamp for a in result), reverse=True)
+
+    def test_records_match_in_memory(self, aggregators):
+        """Test that records of stored activities match the in-memory ones."""
+        memory, backed = aggregators
+        since = datetime(2024, 1, 20, tzinfo=timezone.utc)
+
+        expected = memory.records(activity_types=[ActivityType.PULL_REQUEST], since=since)
+        result = backed.records(activity_types=[ActivityType.PULL_REQUEST], since=since)
+
+        assert expected
+        assert set(result) == set(expected)
+
+    def test_filter_with_predicate(self, aggregators):
+        """Test that a predicate is applied to the query results."""
+        _, backed = aggregators
+        result = backed.filter(predicate=lambda a: a.title.endswith("7"))
+        assert {a.title for a in result} == {f"Activity {i}" for i in range(7, 200, 10)}
+
+    def test_aggregate_matches_in_memory(self, aggregators):
+        """Test that grouped counts and the date range match."""
+        memory, backed = aggregators
+        since = datetime(2024, 1, 20, tzinfo=timezone.utc)
+
+        expected = memory.aggregate(since=since, activity_types=[ActivityType.COMMIT])
+        result = backed.aggregate(since=since, activity_types=[ActivityType.COMMIT])
+
+        assert result.total_count == expected.total_count
+        assert result.by_repository == expected.by_repository
+        assert result.by_contributor == expected.by_contributor
+        assert result.by_type == expected.by_type
+        assert result.date_range == expected.date_range
+        assert [a.id for a in result.activities] == [a.id for a in expected.activities]
+
+    @pytest.mark.parametrize("granularity", ["hour", "day", "week", "month"])
+    def test_timeline_matches_in_memory(self, aggregators, granularity):
+        """Test that SQL bucketing matches the in-memory timeline."""
+        memory, backed = aggregators
+        since = datetime(2024, 1, 5, tzinfo=timezone.utc)
+
+        assert backed.get_activity_timeline(
+            granularity=granularity, since=since
+        ) == memory.get_activity_timeline(granularity=granularity, since=since)
+
+    @pytest.mark.parametrize("split_by", ["repository", "type"])
+    def test_split_timeline_matches_in_memory(self, aggregators, split_by):
+        """Test that SQL split timelines match the in-memory ones."""
+        memory, backed = aggregators
+        since = datetime(2024, 1, 5, tzinfo=timezone.utc)
+
+        assert backed.get_activity_timeline_by(
+            split_by, granularity="week", since=since
+        ) == memory.get_activity_timeline_by(split_by, granularity="week", since=since)
+
+    def test_top_n_matches_in_memory(self, aggregators):
+        """Test top contributors and most active repositories."""
+        memory, backed = aggregators
+        assert backed.get_top_contributors(2) == memory.get_top_contributors(2)
+        assert backed.get_most_active_repositories(3) == memory.get_most_active_repositories(3)
+
+    def test_entity_stats_match_in_memory(self, aggregators, multiple_repos):
+        """Test contributor and repository statistics."""
+        memory, backed = aggregators
+        assert backed.get_contributor_stats("user3") == memory.get_contributor_stats("user3")
+        assert backed.get_repository_stats(multiple_repos[1]) == memory.get_repository_stats(
+            multiple_repos[1]
+        )
+        assert backed.get_contributor_stats("nobody") is None
+
+    def test_history_outlives_aggregator(self, tmp_path, history):
+        """Test that a new aggregator over the same file sees earlier activities."""
+        first = ActivityStore.in_directory(tmp_path)
+        ActivityAggregator(store=first).add_activities(history)
+        first.close()
+
+        second = ActivityStore.in_directory(tmp_path)
+        assert ActivityAggregator(store=second).aggregate().total_count == len(history)
+        second.close()
+
+    def test_remove_activities(self, aggregators, history):
+        """Test that removal deletes activities from the store."""
+        _, backed = aggregators
+        assert backed.remove_activities(history[:10]) == 10
+        assert backed.aggregate().total_count == len(history) - 10
+
+    def test_upsert_keeps_newer_copy(self, store, multiple_repos):
+        """Test that the store ignores an older copy of a stored activity."""
+        backed = ActivityAggregator(store=store)
+        newer = TestDeduplicatingIngestion.pr(
+            multiple_repos[0], "2024-01-12T00:00:00Z", state="closed"
+        )
+        older = TestDeduplicatingIngestion.pr(multiple_repos[0], "2024-01-11T00:00:00Z")
+
+        backed.add_activities([newer])
+        backed.add_activities([older])
+
+        assert [a.metadata["state"] for a in backed.activities] == ["closed"]
+
+    def test_clear(self, aggregators):
+        """Test that clearing empties the store."""
+        _, backed = aggregators
+        backed.clear()
+        assert backed.activities == []
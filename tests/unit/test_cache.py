@@ -0,0 +1,198 @@
+"""Tests for the on-disk response cache."""
+
+import sqlite3
+import stat
+from unittest import mock
+
+import pytest
+
+from giteagle.integrations.cache import CacheStats, ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    response_cache = ResponseCache.in_directory(tmp_path, ttl=300, max_size_bytes=1000)
+    yield response_cache
+    response_cache.close()
+
+
+class TestMakeKey:
+    """Tests for cache key construction."""
+
+    def test_same_request_same_key(self):
+        """Test that identical requests map to the same key."""
+        key1 = ResponseCache.make_key("GET", "https://x/repos", {"a": 1, "b": 2}, "tok")
+        key2 = ResponseCache.make_key("get", "https://x/repos", {"b": 2, "a": 1}, "tok")
+        assert key1 == key2
+
+    def test_params_change_key(self):
+        """Test that different query parameters produce different keys."""
+        key1 = ResponseCache.make_key("GET", "https://x/repos", {"page": 1}, "tok")
+        key2 = ResponseCache.make_key("GET", "https://x/repos", {"page": 2}, "tok")
+        assert key1 != key2
+
+    def test_token_changes_key(self):
+        """Test that responses are not shared between tokens."""
+        key1 = ResponseCache.make_key("GET", "https://x/repos", None, "token-a")
+        key2 = ResponseCache.make_key("GET", "https://x/repos", None, "token-b")
+        key3 = ResponseCache.make_key("GET", "https://x/repos", None, None)
+        assert len({key1, key2, key3}) == 3
+
+    def test_key_does_not_contain_token(self):
+        """Test that the raw token never appears in the key."""
+        key = ResponseCache.make_key("GET", "https://x/repos", None, "secret-token")
+        assert "secret-token" not in key
+
+
+class TestResponseCache:
+    """Tests for the ResponseCache class."""
+
+    def test_get_missing(self, cache):
+        """Test that a missing key returns None."""
+        assert cache.get("missing") is None
+
+    def test_set_and_get(self, cache):
+        """Test storing and retrieving a response."""
+        cache.set("k", b'{"a": 1}', {"link": "<x>"})
+
+        cached = cache.get("k")
+
+        assert cached is not None
+        assert cached.body == b'{"a": 1}'
+        assert cached.headers == {"link": "<x>"}
+
+    def test_expired_entry_is_a_miss(self, cache):
+        """Test that entries older than the TTL are not returned."""
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1000.0):
+            cache.set("k", b"[]")
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1300.0):
+            assert cache.get("k") is None
+        assert cache.stats().entries == 0
+
+    def test_stale_entry_with_etag_is_kept_for_revalidation(self, cache):
+        """Test that expired entries with validators are returned as stale."""
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1000.0):
+            cache.set("k", b"[]", etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1300.0):
+            cached = cache.get("k")
+
+        assert cached is not None
+        assert cached.fresh is False
+        assert cached.validators == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert cache.stats().misses == 1
+
+    def test_touch_makes_entry_fresh(self, cache):
+        """Test that a revalidated entry is fresh again."""
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1000.0):
+            cache.set("k", b"[]", etag='"abc"')
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1300.0):
+            cache.touch("k")
+            cached = cache.get("k")
+
+        assert cached is not None
+        assert cached.fresh is True
+        assert cache.stats().revalidated == 1
+
+    def test_fresh_entry_has_no_validators_without_headers(self, cache):
+        """Test that entries without ETag/Last-Modified produce no conditional headers."""
+        cache.set("k", b"[]")
+        cached = cache.get("k")
+
+        assert cached is not None
+        assert cached.validators == {}
+
+    def test_rebuilds_outdated_schema(self, tmp_path):
+        """Test that a cache file from an older schema is rebuilt."""
+        path = tmp_path / ResponseCache.FILENAME
+        conn = sqlite3.connect(str(path))
+        conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, body BLOB)")
+        conn.commit()
+        conn.close()
+
+        response_cache = ResponseCache(path)
+        response_cache.set("k", b"[]", etag='"abc"')
+        assert response_cache.get("k") is not None
+        response_cache.close()
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test that the size cap evicts the least recently accessed entries."""
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1000.0):
+            cache.set("a", b"x" * 400)
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1001.0):
+            cache.set("b", b"x" * 400)
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1002.0):
+            assert cache.get("a") is not None
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1003.0):
+            cache.set("c", b"x" * 400)
+        with mock.patch("giteagle.integrations.cache.time.time", return_value=1004.0):
+            assert cache.get("a") is not None
+            assert cache.get("b") is None
+            assert cache.get("c") is not None
+
+        assert cache.stats().size_bytes == 800
+
+    def test_skips_oversized_body(self, cache):
+        """Test that a body larger than the cap is not stored."""
+        cache.set("big", b"x" * 2000)
+        assert cache.get("big") is None
+
+    def test_stats(self, cache, tmp_path):
+        """Test that stats report entries, size and hit counts."""
+        cache.set("k", b"12345")
+        cache.get("k")
+        cache.get("missing")
+
+        stats = cache.stats()
+
+        assert stats.path == tmp_path / ResponseCache.FILENAME
+        assert stats.entries == 1
+        assert stats.size_bytes == 5
+        assert stats.max_size_bytes == 1000
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+    def test_counters_persist_across_instances(self, tmp_path):
+        """Test that hit/miss counters survive closing the cache."""
+        first = ResponseCache.in_directory(tmp_path)
+        first.set("k", b"[]")
+        first.get("k")
+        first.close()
+
+        second = ResponseCache.in_directory(tmp_path)
+        second.get("missing")
+        stats = second.stats()
+        second.close()
+
+        assert stats.entries == 1
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+    def test_clear(self, cache):
+        """Test that clear removes entries and resets counters."""
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")
+
+        assert cache.clear() == 2
+
+        stats = cache.stats()
+        assert stats.entries == 0
+        assert stats.hits == 0
+
+    def test_file_is_owner_only(self, cache):
+        """Test that the cache file is readable only by its owner."""
+        mode = cache.path.stat().st_mode
+        assert mode & stat.S_IRWXG == 0
+        assert mode & stat.S_IRWXO == 0
+
+    def test_hit_rate_without_lookups(self, tmp_path):
+        """Test that the hit rate is zero before any lookup."""
+        stats = CacheStats(
+            path=tmp_path, entries=0, size_bytes=0, max_size_bytes=0, hits=0, misses=0
+        )
+        assert stats.hit_rate == 0.0
@@ -0,0 +1,182 @@
+"""Tests for the columnar activity table."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from giteagle.core import columnar, timeline
+from giteagle.core.aggregator import ActivityAggregator
+from giteagle.core.columnar import ActivityTable
+from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+
+NOW = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+ZONES = [timezone.utc, timezone(timedelta(hours=-8)), timezone(timedelta(hours=5, minutes=30))]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test with the pure-Python kernels and, if installed, with numpy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar, "_np", None)
+        monkeypatch.setattr(timeline, "_np", None)
+    return request.param
+
+
+def make_repo(name: str) -> Repository:
+    """Create a test repository."""
+    return Repository(
+        name=name, owner="org", platform="github", url=f"https://github.com/org/{name}"
+    )
+
+
+def make_activities(count: int = 300, seed: int = 7) -> list[Activity]:
+    """Create activities spread over repositories, contributors, types and timezones."""
+    rng = random.Random(seed)
+    repos = [make_repo(f"repo{i}") for i in range(4)]
+    users = [Contributor(username=f"user{i}") for i in range(6)]
+    return [
+        Activity(
+            id=f"a{i}",
+            type=rng.choice(list(ActivityType)),
+            repository=rng.choice(repos),
+            contributor=rng.choice(users),
+            timestamp=(NOW - timedelta(minutes=rng.randrange(60 * 24 * 90))).astimezone(
+                rng.choice(ZONES)
+            ),
+            title=f"Activity {i}",
+            url="https://github.com/org/repo0/commit/abc" if i % 3 == 0 else None,
+            metadata={"n": i},
+        )
+        for i in range(count)
+    ]
+
+
+class TestActivityTable:
+    """Tests for the ActivityTable class."""
+
+    def test_round_trip(self, backend):
+        """Test that activities convert back unchanged and in order."""
+        activities = make_activities(50)
+        table = ActivityTable.from_activities(activities)
+
+        assert len(table) == 50
+        restored = table.to_activities()
+        assert [a.model_dump() for a in restored] == [a.model_dump() for a in activities]
+        assert [a.timestamp.utcoffset() for a in restored] == [
+            a.timestamp.utcoffset() for a in activities
+        ]
+
+    def test_interns_entities(self, backend):
+        """Test that each repository and contributor is held once."""
+        table = ActivityTable.from_activities(make_activities())
+
+        restored = table.to_activities()
+        by_name = {a.repository.full_name: a.repository for a in restored}
+        assert all(a.repository is by_name[a.repository.full_name] for a in restored)
+
+    def test_filters_match_aggregator(self, backend):
+        """Test that filtered rows match ActivityAggregator.filter."""
+        activities = make_activities()
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(activities)
+        table = ActivityTable.from_activities(activities)
+        filters = {
+            "repositories": [make_repo("repo1"), make_repo("repo3")],
+            "contributors": ["user0", "user2", "nobody"],
+            "activity_types": [ActivityType.COMMIT, ActivityType.ISSUE],
+            "since": NOW - timedelta(days=30),
+            "until": NOW - timedelta(days=2),
+        }
+
+        expected = [a.id for a in aggregator.filter(**filters)]
+        assert [a.id for a in table.to_activities(**filters)] == expected
+        assert table.count(**filters) == len(expected)
+        assert table.count(contributors=["nobody"]) == 0
+
+    def test_count_by_matches_aggregate(self, backend):
+        """Test per-group counts against ActivityAggregator.aggregate."""
+        activities = make_activities()
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(activities)
+        table = ActivityTable.from_activities(activities)
+        since = NOW - timedelta(days=10)
+
+        result = aggregator.aggregate(since=since)
+
+        assert dict(table.count_by("repository", since=since)) == result.by_repository
+        assert dict(table.count_by("contributor", since=since)) == result.by_contributor
+        assert dict(table.count_by("type", since=since)) == {
+            t.value: n for t, n in result.by_type.items()
+        }
+        ranked = table.count_by("contributor", limit=3)
+        assert ranked == aggregator.get_top_contributors(3)
+
+    def test_count_by_rejects_unknown_column(self, backend):
+        """Test that only known columns can be grouped by."""
+        with pytest.raises(ValueError):
+            ActivityTable().count_by("title")
+
+    @pytest.mark.parametrize("granularity", ["hour", "day", "week", "month"])
+    def test_timeline_matches_aggregator(self, backend, granularity):
+        """Test that buckets follow each activity's wall-clock time."""
+        activities = make_activities()
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(activities)
+        table = ActivityTable.from_activities(activities)
+        since = NOW - timedelta(days=40)
+
+        assert table.timeline(granularity, since=since) == aggregator.get_activity_timeline(
+            granularity=granularity, since=since
+        )
+
+    @pytest.mark.parametrize("split_by", ["repository", "type"])
+    def test_timeline_by_matches_aggregator(self, backend, split_by):
+        """Test per-repository and per-type timelines."""
+        activities = make_activities()
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(activities)
+        table = ActivityTable.from_activities(activities)
+
+        assert table.timeline_by(split_by, "week") == aggregator.get_activity_timeline_by(
+            split_by, granularity="week"
+        )
+        with pytest.raises(ValueError):
+            table.timeline_by("contributor")
+
+    def test_date_range(self, backend):
+        """Test the earliest and latest timestamps, with their offsets."""
+        activities = make_activities()
+        table = ActivityTable.from_activities(activities)
+
+        first, last = table.date_range()
+
+        assert first == min(a.timestamp for a in activities)
+        assert last == max(a.timestamp for a in activities)
+        assert ActivityTable().date_range() == (None, None)
+
+    def test_naive_timestamps(self, backend):
+        """Test that naive timestamps stay naive."""
+        activity = make_activities(1)[0].model_copy(update={"timestamp": datetime(2024, 1, 1, 9)})
+        table = ActivityTable.from_activities([activity])
+
+        assert table.to_activities()[0].timestamp == datetime(2024, 1, 1, 9)
+        assert table.timeline("hour") == {"2024-01-01 09:00": 1}
+
+
+class TestAggregatorConversion:
+    """Tests for converting between ActivityAggregator and ActivityTable."""
+
+    def test_to_table_and_back(self):
+        """Test that an aggregator survives a round trip through a table."""
+        aggregator = ActivityAggregator()
+        aggregator.add_activities(make_activities(40))
+
+        table = aggregator.to_table()
+        restored = ActivityAggregator.from_table(table)
+
+        assert len(table) == 40
+        assert [a.id for a in restored.activities] == [a.id for a in aggregator.activities]
+        assert restored.aggregate().by_contributor == aggregator.aggregate().by_contributor
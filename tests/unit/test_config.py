@@ -1,15 +1,19 @@
 """Tests for configuration management."""
 
 import os
+from pathlib import Path
 from unittest import mock
 
 import pytest
 import yaml
+from pydantic import ValidationError
 
 from giteagle.config import (
     GiteagleConfig,
     PlatformConfig,
+    get_cache_dir,
     get_config_path,
+    get_data_dir,
     load_config,
     save_config,
 )
@@ -32,6 +36,13 @@ class TestPlatformConfig:
         assert config.token is not None
         assert config.token.get_secret_value() == "test-token"
 
+    def test_all_tokens_merges_pool_without_duplicates(self):
+        """Test that the token and additional tokens form one pool."""
+        config = PlatformConfig(token="a", tokens=["b", "a", "c"])
+
+        assert config.all_tokens() == ["a", "b", "c"]
+        assert PlatformConfig().all_tokens() == []
+
     def test_base_url_rejects_http(self):
         """Test that base_url rejects non-HTTPS schemes."""
         with pytest.raises(ValueError, match="must use HTTPS"):
@@ -81,6 +92,42 @@ class TestGiteagleConfig:
         assert config.max_concurrent_requests == 20
         assert config.github.token.get_secret_value() == "gh-token"
 
+    def test_max_concurrent_requests_must_be_positive(self):
+        """Test that max_concurrent_requests rejects values below 1."""
+        with pytest.raises(ValidationError):
+            GiteagleConfig(max_concurrent_requests=0)
+
+
+class TestGetCacheDir:
+    """Tests for get_cache_dir function."""
+
+    def test_uses_xdg_cache_home(self, tmp_path):
+        """Test that XDG_CACHE_HOME is respected."""
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path)}):
+            assert get_cache_dir() == tmp_path / "giteagle"
+
+    def test_defaults_to_home_cache(self):
+        """Test the default location under ~/.cache."""
+        env = {k: v for k, v in os.environ.items() if k != "XDG_CACHE_HOME"}
+        with mock.patch.dict(os.environ, env, clear=True):
+            assert get_cache_dir() == Path(os.path.expanduser("~/.cache")) / "giteagle"
+
+
+class TestGetDataDir:
+    """Tests for get_data_dir function."""
+
+    def test_uses_xdg_data_home(self, tmp_path):
+        """Test that XDG_DATA_HOME is respected."""
+        with mock.patch.dict(os.environ, {"XDG_DATA_HOME": str(tmp_path)}):
+            assert get_data_dir() == tmp_path / "giteagle"
+
+    def test_defaults_to_home_local_share(self):
+        """Test the default location under ~/.local/share."""
+        env = {k: v for k, v in os.environ.items() if k != "XDG_DATA_HOME"}
+        with mock.patch.dict(os.environ, env, clear=True):
+            expected = Path(os.path.expanduser("~/.local/share")) / "giteagle"
+            assert get_data_dir() == expected
+
 
 class TestGetConfigPath:
     """Tests for get_config_path function."""
@@ -152,6 +199,52 @@ class TestLoadConfig:
 
         assert config.github.token.get_secret_value() == "env-token"
 
+    def test_json_decoder_env_override(self, tmp_path):
+        """Test that GITEAGLE_JSON_DECODER picks the decoder and is validated."""
+        config_file = tmp_path / "config.yaml"
+
+        assert load_config(config_file).json_decoder == "auto"
+        with mock.patch.dict(os.environ, {"GITEAGLE_JSON_DECODER": "json"}):
+            assert load_config(config_file).json_decoder == "json"
+        with mock.patch.dict(os.environ, {"GITEAGLE_JSON_DECODER": "yaml"}):
+            with pytest.raises(ValidationError):
+                load_config(config_file)
+
+    def test_github_token_pool_from_env(self, tmp_path):
+        """Test that GITHUB_TOKENS adds a comma-separated token pool."""
+        config_file = tmp_path / "config.yaml"
+
+        env = {"GITHUB_TOKEN": "t1", "GITHUB_TOKENS": "t2, t3,,"}
+        with mock.patch.dict(os.environ, env):
+            config = load_config(config_file)
+
+        assert config.github.all_tokens() == ["t1", "t2", "t3"]
+
+    def test_connection_settings(self, tmp_path):
+        """Test the connection pool defaults and the GITEAGLE_HTTP2 override."""
+        config_file = tmp_path / "config.yaml"
+
+        config = load_config(config_file)
+        assert config.http2 is False
+        assert config.max_connections is None
+        assert config.keepalive_expiry == 30.0
+
+        with mock.patch.dict(os.environ, {"GITEAGLE_HTTP2": "1"}):
+            assert load_config(config_file).http2 is True
+        with pytest.raises(ValidationError):
+            GiteagleConfig(max_connections=0)
+
+    def test_max_rate_limit_wait(self, tmp_path):
+        """Test the rate-limit wait default and a value from the config file."""
+        config_file = tmp_path / "config.yaml"
+
+        assert load_config(config_file).max_rate_limit_wait == 900.0
+
+        config_file.write_text("max_rate_limit_wait: 60\n")
+        assert load_config(config_file).max_rate_limit_wait == 60.0
+        with pytest.raises(ValidationError):
+            GiteagleConfig(max_rate_limit_wait=-1)
+
     def test_load_config_nonexistent_file(self, tmp_path):
         """Test loading from a nonexistent file returns defaults."""
         config_file = tmp_path / "nonexistent.yaml"
@@ -219,6 +312,14 @@ class TestSaveConfig:
         assert loaded.cache_ttl == 600
         assert loaded.github.token.get_secret_value() == "test-token"
 
+    def test_save_config_preserves_token_pool(self, tmp_path):
+        """Test that additional tokens are saved in plain text and load back."""
+        config_file = tmp_path / "config.yaml"
+
+        save_config(GiteagleConfig(github=PlatformConfig(tokens=["t2", "t3"])), config_file)
+
+        assert load_config(config_file).github.all_tokens() == ["t2", "t3"]
+
     def test_save_config_handles_none_tokens(self, tmp_path):
         """Test saving config with no tokens set."""
         config_file = tmp_path / "config.yaml"
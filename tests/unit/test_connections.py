@@ -0,0 +1,69 @@
+"""Tests for connection reuse statistics."""
+
+import httpx
+
+from giteagle.integrations.connections import ConnectionStats, ConnectionTracker
+
+
+class FakeStream:
+    """Stand-in for the network stream httpx reports per response."""
+
+
+def response_on(stream, http_version: bytes = b"HTTP/1.1") -> httpx.Response:
+    """Build a response as if it arrived on the given stream."""
+    return httpx.Response(200, extensions={"network_stream": stream, "http_version": http_version})
+
+
+class TestConnectionTracker:
+    """Tests for the ConnectionTracker class."""
+
+    def test_counts_new_and_reused_connections(self):
+        """Test that only streams not seen before count as connections."""
+        tracker = ConnectionTracker()
+        first, second = FakeStream(), FakeStream()
+
+        for stream in (first, first, second, first):
+            tracker.record(response_on(stream))
+
+        stats = tracker.stats
+        assert (stats.responses, stats.connections, stats.reused) == (4, 2, 2)
+        assert stats.reuse_rate == 0.5
+        assert stats.http_versions == {"HTTP/1.1": 4}
+
+    def test_counts_http_versions(self):
+        """Test that responses are counted per protocol version."""
+        tracker = ConnectionTracker()
+        stream = FakeStream()
+
+        tracker.record(response_on(stream, b"HTTP/2"))
+        tracker.record(response_on(stream, b"HTTP/2"))
+
+        assert tracker.stats.http_versions == {"HTTP/2": 2}
+        assert tracker.stats.connections == 1
+
+    def test_closed_connection_is_forgotten(self):
+        """Test that a stream that was garbage collected is not treated as reused."""
+        tracker = ConnectionTracker()
+        tracker.record(response_on(FakeStream()))
+        tracker.record(response_on(FakeStream()))
+
+        assert tracker.stats.connections == 2
+
+    def test_ignores_responses_without_network_stream(self):
+        """Test that mocked responses are not counted."""
+        tracker = ConnectionTracker()
+        tracker.record(httpx.Response(200))
+
+        assert tracker.stats == ConnectionStats()
+
+    def test_stats_are_snapshots(self):
+        """Test that returned stats do not change with later responses."""
+        tracker = ConnectionTracker()
+        stream = FakeStream()
+        tracker.record(response_on(stream))
+        snapshot = tracker.stats
+
+        tracker.record(response_on(stream))
+
+        assert snapshot.responses == 1
+        assert snapshot.http_versions == {"HTTP/1.1": 1}
@@ -0,0 +1,46 @@
+"""Tests for JSON decoder selection."""
+
+import sys
+
+import pytest
+
+from giteagle.integrations.decoding import DECODERS, load_decoder
+
+PAGE = (
+    b'[{"sha": "abc", "parents": [{"sha": "p1"}], "stats": {"additions": 3},'
+    b' "commit": {"message": "Fix \\u00e9", "verified": true, "tree": null}}]'
+)
+
+
+class TestLoadDecoder:
+    """Tests for load_decoder."""
+
+    @pytest.mark.parametrize("name", DECODERS)
+    def test_decoders_agree(self, name):
+        """Test that every installed decoder builds the same objects."""
+        if name != "json":
+            pytest.importorskip(name)
+
+        chosen, decode = load_decoder(name)
+
+        assert chosen == name
+        assert decode(PAGE) == load_decoder("json")[1](PAGE)
+
+    def test_auto_prefers_installed_fast_decoder(self, monkeypatch):
+        """Test that auto skips decoders that are not installed."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+
+        assert load_decoder()[0] == "json"
+
+    def test_named_decoder_must_be_installed(self, monkeypatch):
+        """Test that naming a missing decoder raises ImportError."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        with pytest.raises(ImportError):
+            load_decoder("orjson")
+
+    def test_unknown_decoder(self):
+        """Test that an unknown name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown JSON decoder"):
+            load_decoder("yaml")
@@ -0,0 +1,87 @@
+"""Tests for the concurrent per-repository fetch stage."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from giteagle.cli.fanout import RepoResult, fetch_repos, split_repo_names
+
+
+class TestSplitRepoNames:
+    """Tests for the split_repo_names function."""
+
+    def test_splits_valid_and_invalid(self) -> None:
+        valid, invalid = split_repo_names(("org/api", "bogus", "org/web"))
+        assert valid == ["org/api", "org/web"]
+        assert invalid == ["bogus"]
+
+    def test_empty(self) -> None:
+        assert split_repo_names(()) == ([], [])
+
+
+class TestFetchRepos:
+    """Tests for the fetch_repos function."""
+
+    @pytest.mark.asyncio
+    async def test_results_preserve_input_order(self) -> None:
+        async def fetch(owner: str, name: str) -> str:
+            # Later repos finish first
+            await asyncio.sleep(0.01 if name == "a" else 0)
+            return f"{owner}/{name}"
+
+        results = await fetch_repos(["org/a", "org/b", "org/c"], fetch, max_concurrency=3)
+
+        assert [r.repo_name for r in results] == ["org/a", "org/b", "org/c"]
+        assert [r.value for r in results] == ["org/a", "org/b", "org/c"]
+        assert all(r.ok for r in results)
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_within_bound(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def fetch(owner: str, name: str) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 1
+
+        repo_names = [f"org/repo-{i}" for i in range(10)]
+        await fetch_repos(repo_names, fetch, max_concurrency=3)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_cancel_others(self) -> None:
+        errors: list[tuple[str, Exception]] = []
+
+        async def fetch(owner: str, name: str) -> str:
+            if name == "broken":
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.01)
+            return name
+
+        results = await fetch_repos(
+            ["org/ok", "org/broken", "org/also-ok"],
+            fetch,
+            max_concurrency=2,
+            on_error=lambda repo_name, e: errors.append((repo_name, e)),
+        )
+
+        assert [r.value for r in results] == ["ok", None, "also-ok"]
+        assert not results[1].ok
+        assert isinstance(results[1].error, RuntimeError)
+        assert [repo_name for repo_name, _ in errors] == ["org/broken"]
+
+    @pytest.mark.asyncio
+    async def test_non_positive_concurrency_still_runs(self) -> None:
+        async def fetch(owner: str, name: str) -> str:
+            return name
+
+        results = await fetch_repos(["org/a"], fetch, max_concurrency=0)
+
+        assert results == [RepoResult("org/a", value="a")]
@@ -1,18 +1,27 @@
 """Tests for GitHub API integration."""
 
-from datetime import datetime
+import asyncio
+import time
+from datetime import datetime, timezone
 from unittest import mock
 
 import httpx
 import pytest
+from pydantic import ValidationError
 
-from giteagle.core.models import Repository
+from giteagle.core.models import ActivityType, Repository
+from giteagle.core.records import CommitRecord
+from giteagle.integrations.base import PlatformClient
+from giteagle.integrations.cache import ResponseCache
 from giteagle.integrations.github import (
     GitHubAPIError,
     GitHubClient,
+    RateLimitBudgetError,
     RateLimitError,
+    _parse_last_page,
     _validate_path_segment,
 )
+from giteagle.integrations.retry import RetryPolicy
 
 
 class TestGitHubClient:
@@ -112,6 +121,132 @@ class TestGitHubClient:
 
         await mock_client.close()
 
+    @pytest.mark.asyncio
+    async def test_requests_pass_through_limiter(self):
+        """Test that every request is admitted through the client-wide limiter."""
+        client = GitHubClient(token="test-token", max_concurrent_requests=2)
+        mock_response = httpx.Response(200, json={"login": "testuser"})
+
+        with mock.patch.object(client._client, "request", return_value=mock_response):
+            await client.get_authenticated_user()
+            await client.get_authenticated_user()
+
+        stats = client.limiter_stats
+        assert stats.max_concurrent == 2
+        assert stats.total_requests == 2
+        assert stats.in_flight == 0
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_served_from_cache(self, tmp_path):
+        """Test that a cached GET response avoids a second network call."""
+        cache = ResponseCache.in_directory(tmp_path)
+        client = GitHubClient(token="test-token", cache=cache)
+        mock_response = httpx.Response(200, json={"login": "testuser"})
+
+        with mock.patch.object(
+            client._client, "request", return_value=mock_response
+        ) as mock_request:
+            assert await client.get_authenticated_user() == "testuser"
+            assert await client.get_authenticated_user() == "testuser"
+
+        assert mock_request.call_count == 1
+        assert cache.stats().hits == 1
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_responses_use_configured_decoder(self, tmp_path):
+        """Test that fresh and cached bodies are decoded by the chosen decoder."""
+        client = GitHubClient(cache=ResponseCache.in_directory(tmp_path), json_decoder="json")
+        decoded: list[bytes] = []
+
+        def decode(body: bytes) -> dict:
+            decoded.append(body)
+            return {"login": "decoded"}
+
+        client._decode_json = decode
+        mock_response = httpx.Response(200, json={"login": "testuser"})
+
+        with mock.patch.object(client._client, "request", return_value=mock_response):
+            assert await client.get_authenticated_user() == "decoded"
+            assert await client.get_authenticated_user() == "decoded"
+
+        assert client.json_decoder == "json"
+        assert decoded == [mock_response.content] * 2
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_entry_is_revalidated(self, tmp_path):
+        """Test that a stale entry sends If-None-Match and reuses the body on 304."""
+        cache = ResponseCache.in_directory(tmp_path, ttl=0)
+        client = GitHubClient(token="test-token", cache=cache)
+        responses = [
+            httpx.Response(200, json={"login": "testuser"}, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+
+        with mock.patch.object(client._client, "request", side_effect=responses) as mock_request:
+            assert await client.get_authenticated_user() == "testuser"
+            assert await client.get_authenticated_user() == "testuser"
+
+        assert mock_request.call_args_list[0].kwargs["headers"] == {}
+        assert mock_request.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert cache.stats().revalidated == 1
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_since_param_is_floored_to_the_hour(self, mock_client):
+        """Test that since is rounded for cacheable URLs and results are still filtered."""
+        repo = Repository(
+            name="test-repo",
+            owner="testowner",
+            platform="github",
+            url="https://github.com/testowner/test-repo",
+        )
+        mock_response = httpx.Response(
+            200,
+            json=[
+                {
+                    "sha": "new",
+                    "commit": {"message": "New", "author": {"date": "2024-01-15T10:45:00Z"}},
+                },
+                {
+                    "sha": "old",
+                    "commit": {"message": "Old", "author": {"date": "2024-01-15T10:05:00Z"}},
+                },
+            ],
+        )
+        since = datetime(2024, 1, 15, 10, 30, 15, tzinfo=timezone.utc)
+
+        with mock.patch.object(
+            mock_client._client, "request", return_value=mock_response
+        ) as mock_request:
+            activities = await mock_client.get_commits(repo, since=since)
+
+        assert mock_request.call_args.kwargs["params"]["since"] == "2024-01-15T10:00:00+00:00"
+        assert [a.metadata["sha"] for a in activities] == ["new"]
+
+        await mock_client.close()
+
+    @pytest.mark.asyncio
+    async def test_error_responses_are_not_cached(self, tmp_path):
+        """Test that failed requests are not stored in the cache."""
+        cache = ResponseCache.in_directory(tmp_path)
+        client = GitHubClient(token="test-token", cache=cache)
+        mock_response = httpx.Response(404, json={"message": "Not Found"})
+
+        with mock.patch.object(client._client, "request", return_value=mock_response):
+            with pytest.raises(GitHubAPIError):
+                await client.get_repository("testowner", "missing")
+
+        assert cache.stats().entries == 0
+
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_get_repository_not_found(self, mock_client):
         """Test handling 404 response."""
@@ -145,6 +280,348 @@ class TestGitHubClient:
 
         await mock_client.close()
 
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_waits_for_reset(self, mock_client):
+        """Test that a spent budget pauses until the reset time and retries."""
+        reset = int(time.time()) + 5
+        limited = httpx.Response(
+            403,
+            headers={
+                "X-RateLimit-Limit": "60",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(reset),
+            },
+            json={"message": "Rate limit exceeded"},
+        )
+        ok = httpx.Response(
+            200,
+            json={
+                "name": "test-repo",
+                "owner": {"login": "testowner"},
+                "html_url": "https://github.com/testowner/test-repo",
+                "default_branch": "main",
+                "private": False,
+            },
+        )
+
+        with mock.patch.object(mock_client._client, "request", side_effect=[limited, ok]):
+            with mock.patch("giteagle.integrations.github.asyncio.sleep") as sleep:
+                repo = await mock_client.get_repository("testowner", "test-repo")
+
+        assert repo.name == "test-repo"
+        (delay,) = sleep.await_args.args
+        assert 0 < delay <= 7
+        assert mock_client.rate_limit_stats.pauses == 1
+
+        await mock_client.close()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_over_maximum_raises(self):
+        """Test that a reset further away than max_rate_limit_wait fails fast."""
+        client = GitHubClient(token="test-token", max_rate_limit_wait=60)
+        limited = httpx.Response(
+            403,
+            headers={
+                "X-RateLimit-Limit": "60",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            },
+            json={"message": "Rate limit exceeded"},
+        )
+
+        with mock.patch.object(client._client, "request", return_value=limited) as request:
+            with mock.patch("giteagle.integrations.github.asyncio.sleep") as sleep:
+                with pytest.raises(RateLimitError):
+                    await client.get_repository("testowner", "test-repo")
+
+        assert request.call_count == 1
+        sleep.assert_not_awaited()
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_spent_budget_pause_is_announced_once(self):
+        """Test that requests waiting for the same reset announce one pause."""
+        pauses = []
+        client = GitHubClient(
+            token="test-token", on_rate_limit_pause=lambda *args: pauses.append(args)
+        )
+        reset = time.time() + 30
+        client._tokens.tokens[0].rate_limits.update(5000, 1, reset)
+        ok = httpx.Response(200, json=[])
+
+        with mock.patch.object(client._client, "request", return_value=ok):
+            with mock.patch("giteagle.integrations.github.asyncio.sleep"):
+                for _ in range(3):
+                    await client.list_repositories("testuser")
+
+        assert len(pauses) == 1
+        resource, delay = pauses[0]
+        assert resource == "core"
+        assert 29 < delay <= 32
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_paced_requests_are_not_announced(self):
+        """Test that requests spread out before the reset do not announce a pause."""
+        pauses = []
+        client = GitHubClient(
+            token="test-token", on_rate_limit_pause=lambda *args: pauses.append(args)
+        )
+        client._tokens.tokens[0].rate_limits.update(5000, 100, time.time() + 600)
+        ok = httpx.Response(200, json=[])
+
+        with mock.patch.object(client._client, "request", return_value=ok):
+            with mock.patch("giteagle.integrations.github.asyncio.sleep") as sleep:
+                for _ in range(3):
+                    await client.list_repositories("testuser")
+
+        assert sleep.await_count == 2
+        assert pauses == []
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_responses_update_rate_limit_budget(self, mock_client):
+        """Test that X-RateLimit headers of each response are tracked."""
+        reset = int(time.time()) + 3600
+        mock_response = httpx.Response(
+            200,
+            headers={
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "4321",
+                "X-RateLimit-Reset": str(reset),
+            },
+            json=[],
+        )
+
+        with mock.patch.object(mock_client._client, "request", return_value=mock_response):
+            await mock_client.list_repositories("testuser")
+
+        budget = mock_client.rate_limit_budget()
+        assert budget.remaining == 4321
+        assert budget.reset_at == reset
+
+        await mock_client.close()
+
+    @pytest.mark.asyncio
+    async def test_check_rate_budget(self, mock_client):
+        """Test that a plan larger than the remaining budget is refused up front."""
+        reset = int(time.time()) + 3600
+        mock_response = httpx.Response(
+            200,
+            json={
+                "resources": {
+                    "core": {"limit": 5000, "remaining": 10, "reset": reset},
+                    "graphql": {"limit": 5000, "remaining": 5000, "reset": reset},
+                }
+            },
+        )
+
+        with mock.patch.object(
+            mock_client._client, "request", return_value=mock_response
+        ) as request:
+            assert await mock_client.check_rate_budget(10) is True
+            assert await mock_client.check_rate_budget(500, resource="graphql") is True
+            with pytest.raises(RateLimitBudgetError) as exc_info:
+                await mock_client.check_rate_budget(11)
+
+        request.assert_called_once_with("GET", "/rate_limit", headers={})
+        assert exc_info.value.requests == 11
+        assert exc_info.value.remaining == 10
+
+        await mock_client.close()
+
+    @pytest.mark.asyncio
+    async def test_check_rate_budget_allows_waiting_for_a_near_reset(self):
+        """Test that a plan over budget goes ahead when the reset is within the wait."""
+        client = GitHubClient(token="test-token", max_rate_limit_wait=600)
+        mock_response = httpx.Response(
+            200,
+            json={
+                "resources": {
+                    "core": {"limit": 5000, "remaining": 10, "reset": int(time.time()) + 300}
+                }
+            },
+        )
+
+        with mock.patch.object(client._client, "request", return_value=mock_response):
+            assert await client.check_rate_budget(11) is False
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_unreadable_rate_limit_leaves_budget_unknown(self, mock_client):
+        """Test that a failed /rate_limit request does not fail the budget check."""
+        with mock.patch.object(
+            mock_client._client, "request", side_effect=httpx.ConnectError("refused")
+        ):
+            await mock_client.check_rate_budget(10_000)
+
+        with mock.patch.object(
+            mock_client._client, "request", return_value=httpx.Response(200, content=b"<html>")
+        ):
+            await mock_client.check_rate_budget(10_000)
+
+        assert mock_client.rate_limit_budget() is None
+
+        await mock_client.close()
+
+    @pytest.mark.asyncio
+    async def test_token_pool_fails_over_when_token_is_spent(self):
+        """Test that a rate-limited token's request is retried with another token."""
+        client = GitHubClient(tokens=["token-one-xxxx", "token-two-yyyy"])
+        reset = str(int(time.time()) + 3600)
+        spent = httpx.Response(
+            403,
+            headers={
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": reset,
+            },
+            json={"message": "API rate limit exceeded"},
+        )
+        ok = httpx.Response(
+            200,
+            headers={
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "4999",
+                "X-RateLimit-Reset": reset,
+            },
+            json=[],
+        )
+
+        with mock.patch.object(client._client, "request", side_effect=[spent, ok]) as request:
+            with mock.patch("giteagle.integrations.github.asyncio.sleep") as sleep:
+                assert await client.list_repositories("testuser") == []
+
+        sent_with = [call.kwargs["headers"]["Authorization"] for call in request.call_args_list]
+        assert sent_with == ["Bearer token-one-xxxx", "Bearer token-two-yyyy"]
+        sleep.assert_not_awaited()
+        one, two = client.token_usage
+        assert (one.requests, one.rate_limited, one.remaining) == (1, 1, 0)
+        assert (two.requests, two.rate_limited, two.remaining) == (1, 0, 4999)
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_pool_sized_from_concurrency(self):
+        """Test that the pool keeps a connection alive per concurrent request."""
+        client = GitHubClient(max_concurrent_requests=4, keepalive_expiry=60.0)
+        pool = client._client._transport._pool
+
+        assert pool._max_connections == 4
+        assert pool._max_keepalive_connections == 4
+        assert pool._keepalive_expiry == 60.0
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_records_connection_reuse(self, mock_client):
+        """Test that responses are attributed to the connections they arrived on."""
+
+        class Stream:
+            """Stand-in for the network stream httpx reports."""
+
+        stream = Stream()
+        response = httpx.Response(
+            200, json=[], extensions={"network_stream": stream, "http_version": b"HTTP/2"}
+        )
+
+        with mock.patch.object(mock_client._client, "request", return_value=response):
+            await mock_client.list_repositories("testuser")
+            await mock_client.list_repositories("otheruser")
+
+        stats = mock_client.connection_stats
+        assert (stats.responses, stats.connections) == (2, 1)
+        assert stats.http_versions == {"HTTP/2": 2}
+
+        await mock_client.close()
+
+    @pytest.mark.asyncio
+    async def test_throttled_request_honors_retry_after(self, mock_client):
+        """Test that a 429 is retried after its Retry-After delay."""
+        throttled = httpx.Response(
+            429, headers={"Retry-After": "7"}, json={"message": "Too many requests"}
+        )
+        ok = httpx.Response(200, json=[])
+
+        with mock.patch.object(mock_client._client, "request", side_effect=[throttled, ok]):
+            with mock.patch("giteagle.integrations.github.asyncio.sleep") as sleep:
+                assert await mock_client.list_repositories("testuser") == []
+
+        assert sleep.await_args_list[0].args == (7.0,)
+        assert mock_client.retry_stats.retries == 1
+        assert mock_client.retry_stats.cooldowns == 1
+
+        await mock_client.close()
+
+    @pytest.mark.asyncio
+    async def test_gateway_errors_give_up_after_max_attempts(self):
+        """Test that persistent 502s fail after the policy's attempts."""
+        client = GitHubClient(token="test-token", retry_policy=RetryPolicy(max_attempts=2))
+        bad_gateway = httpx.Response(502, json={"message": "Bad Gateway"})
+
+        with mock.patch.object(client._client, "request", return_value=bad_gateway) as request:
+            with mock.patch("giteagle.integrations.github.asyncio.sleep"):
+                with pytest.raises(GitHubAPIError) as exc_info:
+                    await client.get_repository("testowner", "test-repo")
+
+        assert exc_info.value.status_code == 502
+        assert request.call_count == 2
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_gateway_error_page_gives_up_with_api_error(self):
+        """Test that an HTML 502 page raises GitHubAPIError once retries run out."""
+        client = GitHubClient(token="test-token", retry_policy=RetryPolicy(max_attempts=2))
+        bad_gateway = httpx.Response(
+            502, headers={"Content-Type": "text/html"}, content=b"<html>Bad Gateway</html>"
+        )
+
+        with mock.patch.object(client._client, "request", return_value=bad_gateway):
+            with mock.patch("giteagle.integrations.github.asyncio.sleep"):
+                with pytest.raises(GitHubAPIError, match="HTTP 502") as exc_info:
+                    await client.get_repository("testowner", "test-repo")
+
+        assert exc_info.value.status_code == 502
+        assert exc_info.value.response == {}
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_forbidden_is_not_retried(self, mock_client):
+        """Test that a 403 that is not a rate limit fails immediately."""
+        forbidden = httpx.Response(403, json={"message": "Resource not accessible"})
+
+        with mock.patch.object(mock_client._client, "request", return_value=forbidden) as request:
+            with pytest.raises(GitHubAPIError, match="Resource not accessible"):
+                await mock_client.get_repository("testowner", "test-repo")
+
+        assert request.call_count == 1
+
+        await mock_client.close()
+
+    @pytest.mark.asyncio
+    async def test_timeouts_are_retried(self, mock_client):
+        """Test that a timed-out request is retried with backoff."""
+        ok = httpx.Response(200, json=[])
+
+        with mock.patch.object(
+            mock_client._client,
+            "request",
+            side_effect=[httpx.ReadTimeout("timed out"), ok],
+        ):
+            with mock.patch("giteagle.integrations.github.asyncio.sleep") as sleep:
+                assert await mock_client.list_repositories("testuser") == []
+
+        sleep.assert_awaited_once()
+        assert 1.0 <= sleep.await_args.args[0] <= 3.0
+
+        await mock_client.close()
+
     @pytest.mark.asyncio
     async def test_list_repositories_user(self, mock_client):
         """Test listing repositories for a user."""
@@ -223,6 +700,69 @@ class TestGitHubClient:
 
         await mock_client.close()
 
+    @pytest.mark.asyncio
+    async def test_parsed_contributors_are_shared(self, mock_client):
+        """Test that an author appearing on many rows is parsed into one instance."""
+        repo = Repository(
+            name="test-repo",
+            owner="testowner",
+            platform="github",
+            url="https://github.com/testowner/test-repo",
+        )
+        author = {"name": "Test User", "email": "test@example.com", "date": "2024-01-15T10:30:00Z"}
+        commits = [
+            {
+                "sha": f"sha{i}",
+                "commit": {"message": "m", "author": author},
+                "author": {"login": "u"},
+            }
+            for i in range(3)
+        ]
+        other_email = {**author, "email": "other@example.com"}
+        commits.append(
+            {
+                "sha": "sha3",
+                "commit": {"message": "m", "author": other_email},
+                "author": {"login": "u"},
+            }
+        )
+
+        with mock.patch.object(
+            mock_client._client, "request", return_value=httpx.Response(200, json=commits)
+        ):
+            activities = await mock_client.get_commits(repo)
+
+        contributors = [a.contributor for a in activities]
+        assert contributors[0] is contributors[1] is contributors[2]
+        assert contributors[3].email == "other@example.com"
+
+        await mock_client.close()
+
+    @pytest.mark.asyncio
+    async def test_malformed_rows_are_rejected(self, mock_client):
+        """Test that parsed rows are validated in full."""
+        repo = Repository(
+            name="test-repo",
+            owner="testowner",
+            platform="github",
+            url="https://github.com/testowner/test-repo",
+        )
+        pulls = [
+            {
+                "number": 1,
+                "state": "open",
+                "title": "PR",
+                "created_at": "2024-01-15T10:30:00Z",
+                "updated_at": "2024-01-15T10:30:00Z",
+                "html_url": "https://github.com/testowner/test-repo/pull/1",
+            }
+        ]
+        assert mock_client._parse_pull_requests(repo, pulls)[0].title == "PR"
+        with pytest.raises(ValidationError):
+            mock_client._parse_pull_requests(repo, [{**pulls[0], "state": None, "title": 5}])
+
+        await mock_client.close()
+
     @pytest.mark.asyncio
     async def test_get_pull_requests(self, mock_client):
         """Test fetching pull requests for a repository."""
@@ -352,8 +892,10 @@ class TestGitHubClient:
             activities = await mock_client.get_pull_requests(repo)
 
         assert len(activities) == 1
-        assert activities[0].metadata["merged_at"] == "2024-01-15T12:00:00Z"
-        assert activities[0].metadata["closed_at"] == "2024-01-15T12:00:00Z"
+        merged_at = datetime(2024, 1, 15, 12, tzinfo=timezone.utc)
+        assert activities[0].metadata["merged_at"] == merged_at
+        assert activities[0].metadata["closed_at"] == merged_at
+        assert activities[0].metadata["updated_at"] == merged_at
 
         await mock_client.close()
 
@@ -389,7 +931,7 @@ class TestGitHubClient:
             activities = await mock_client.get_issues(repo)
 
         assert len(activities) == 1
-        assert activities[0].metadata["closed_at"] == "2024-01-15T14:00:00Z"
+        assert activities[0].metadata["closed_at"] == datetime(2024, 1, 15, 14, tzinfo=timezone.utc)
 
         await mock_client.close()
 
@@ -676,3 +1218,640 @@ class TestPathSegmentValidation:
         with pytest.raises(ValueError, match="unsafe characters"):
             await client.list_repositories(org="evil/org")
         await client.close()
+
+
+class TestPagination:
+    """Tests for paginated fetching."""
+
+    @staticmethod
+    def _link(last_page: int) -> str:
+        base = "https://api.github.com/repos/o/r/commits?per_page=2"
+        return f'<{base}&page=2>; rel="next", <{base}&page={last_page}>; rel="last"'
+
+    def test_parse_last_page(self):
+        """Test extracting the last page number from a Link header."""
+        assert _parse_last_page(self._link(7)) == 7
+        assert _parse_last_page('<https://x/y?page=2>; rel="next"') is None
+        assert _parse_last_page('<https://x/y?per_page=2>; rel="last"') is None
+        assert _parse_last_page(None) is None
+
+    @pytest.mark.asyncio
+    async def test_fetches_remaining_pages_concurrently_in_order(self):
+        """Test that pages after the first are fetched together and kept in order."""
+        client = GitHubClient(token="test-token")
+        in_flight = 0
+        peak = 0
+
+        async def mock_request(method, path, params=None, **kwargs):
+            nonlocal in_flight, peak
+            page = params["page"]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later pages answer first
+            await asyncio.sleep(0.01 * (5 - page))
+            in_flight -= 1
+            return httpx.Response(200, json=[page] * 100, headers={"Link": self._link(4)})
+
+        with mock.patch.object(client._client, "request", side_effect=mock_request):
+            results = await client._paginate("/repos/o/r/commits", limit=400)
+
+        assert results == [1] * 100 + [2] * 100 + [3] * 100 + [4] * 100
+        assert peak == 3
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_page_count_is_capped_by_limit(self):
+        """Test that only the pages needed for the limit are requested."""
+        client = GitHubClient(token="test-token")
+        link = self._link(50)
+
+        def mock_request(method, path, params=None, **kwargs):
+            return httpx.Response(200, json=[params["page"]] * 100, headers={"Link": link})
+
+        with mock.patch.object(
+            client._client, "request", side_effect=mock_request
+        ) as mock_request_obj:
+            results = await client._paginate("/repos/o/r/commits", limit=250)
+
+        assert len(results) == 250
+        pages = sorted(c.kwargs["params"]["page"] for c in mock_request_obj.call_args_list)
+        assert pages == [1, 2, 3]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_sequential_without_link(self):
+        """Test that pagination walks pages one by one without a Link header."""
+        client = GitHubClient(token="test-token")
+
+        def mock_request(method, path, params=None, **kwargs):
+            page = params["page"]
+            return httpx.Response(200, json=[page] * (100 if page < 3 else 50))
+
+        with mock.patch.object(client._client, "request", side_effect=mock_request):
+            results = await client._paginate("/repos/o/r/commits", limit=1000)
+
+        assert results == [1] * 100 + [2] * 100 + [3] * 50
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_does_not_mutate_caller_params(self):
+        """Test that the caller's params dict is left untouched."""
+        client = GitHubClient(token="test-token")
+        params = {"state": "open"}
+
+        with mock.patch.object(
+            client._client, "request", return_value=httpx.Response(200, json=[])
+        ):
+            await client._paginate("/repos/o/r/pulls", params=params)
+
+        assert params == {"state": "open"}
+
+        await client.close()
+
+
+class TestStreaming:
+    """Tests for the aiter_* streaming API."""
+
+    @pytest.fixture
+    def repo(self):
+        return Repository(
+            name="test-repo",
+            owner="testowner",
+            platform="github",
+            url="https://github.com/testowner/test-repo",
+        )
+
+    @staticmethod
+    def _commit(sha: str) -> dict:
+        return {
+            "sha": sha,
+            "commit": {"message": sha, "author": {"date": "2024-01-15T10:00:00Z"}},
+        }
+
+    @staticmethod
+    def _pr(number: int, updated_at: str) -> dict:
+        return {
+            "number": number,
+            "state": "open",
+            "user": {"login": "alice"},
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": updated_at,
+        }
+
+    @pytest.mark.asyncio
+    async def test_aiter_commits_yields_pages_lazily(self, repo):
+        """Test that each page is requested only when the consumer asks for it."""
+        client = GitHubClient(token="test-token")
+
+        def mock_request(method, path, params=None, **kwargs):
+            page = params["page"]
+            return httpx.Response(200, json=[self._commit(f"{page}-{i}") for i in range(100)])
+
+        with mock.patch.object(
+            client._client, "request", side_effect=mock_request
+        ) as mock_request_obj:
+            stream = client.aiter_commits(repo, limit=300)
+            first = await stream.__anext__()
+            assert mock_request_obj.call_count == 1
+            rest = [batch async for batch in stream]
+
+        assert len(first) == 100
+        assert [len(batch) for batch in rest] == [100, 100]
+        assert mock_request_obj.call_count == 3
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_aiter_commits_respects_limit(self, repo):
+        """Test that streaming stops once the limit is reached."""
+        client = GitHubClient(token="test-token")
+        page = [self._commit(str(i)) for i in range(100)]
+
+        with mock.patch.object(
+            client._client, "request", return_value=httpx.Response(200, json=page)
+        ):
+            batches = [batch async for batch in client.aiter_commits(repo, limit=150)]
+
+        assert [len(batch) for batch in batches] == [100, 50]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_aiter_commit_records_match_activity_records(self, repo):
+        """Test that records built from the API's dicts equal those built from activities."""
+        client = GitHubClient(token="test-token")
+        since = datetime(2024, 1, 12, tzinfo=timezone.utc)
+        page = [
+            {
+                "sha": "merge",
+                "commit": {
+                    "message": "Merge branch 'main'\n\nDetails",
+                    "author": {"name": "Alice", "date": "2024-01-10T00:00:00Z"},
+                    "committer": {"date": "2024-01-15T00:00:00Z"},
+                },
+                "author": {"login": "alice"},
+                "html_url": "https://github.com/testowner/test-repo/commit/merge",
+                "parents": [{"sha": "a"}, {"sha": "b"}],
+            },
+            {
+                "sha": "anonymous",
+                "commit": {
+                    "message": "x" * 150,
+                    "author": {"name": "Bob", "date": "2024-01-14T00:00:00Z"},
+                },
+                "author": None,
+            },
+            self._commit("old"),
+        ]
+        page[2]["commit"]["author"]["date"] = "2024-01-11T00:00:00Z"
+
+        with mock.patch.object(
+            client._client, "request", return_value=httpx.Response(200, json=page)
+        ):
+            (records,) = [batch async for batch in client.aiter_commit_records(repo, since)]
+
+        expected = [CommitRecord.from_activity(a) for a in client._parse_commits(repo, page, since)]
+        assert [r.sha for r in records] == ["merge", "anonymous"]
+        for record, want in zip(records, expected):
+            for slot in ("id", "type", "repository", "author", "timestamp", "title", "updated_at"):
+                assert getattr(record, slot) == getattr(want, slot)
+            assert (record.sha, record.parents) == (want.sha, want.parents)
+        assert records[0].is_merge
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_aiter_pull_requests_stops_past_since(self, repo):
+        """Test that PR streaming stops at the first page reaching back past since."""
+        client = GitHubClient(token="test-token")
+        since = datetime(2024, 1, 10, tzinfo=timezone.utc)
+        page = [self._pr(i, "2024-01-15T00:00:00Z") for i in range(99)]
+        page.append(self._pr(99, "2024-01-05T00:00:00Z"))
+
+        with mock.patch.object(
+            client._client, "request", return_value=httpx.Response(200, json=page)
+        ) as mock_request_obj:
+            batches = [
+                batch async for batch in client.aiter_pull_requests(repo, since=since, limit=500)
+            ]
+
+        assert [len(batch) for batch in batches] == [99]
+        assert mock_request_obj.call_count == 1
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_aiter_activities_chains_types(self, repo):
+        """Test that aiter_activities yields commits, PRs and issues."""
+        client = GitHubClient(token="test-token")
+
+        def mock_request(method, path, params=None, **kwargs):
+            if path.endswith("/commits"):
+                return httpx.Response(200, json=[self._commit("abc")])
+            if path.endswith("/pulls"):
+                return httpx.Response(200, json=[self._pr(1, "2024-01-15T00:00:00Z")])
+            issue = self._pr(2, "2024-01-15T00:00:00Z")
+            return httpx.Response(200, json=[issue])
+
+        with mock.patch.object(client._client, "request", side_effect=mock_request):
+            batches = [batch async for batch in client.aiter_activities(repo)]
+
+        types = [batch[0].type for batch in batches]
+        assert types == [ActivityType.COMMIT, ActivityType.PULL_REQUEST, ActivityType.ISSUE]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_platform_client_default_yields_single_batch(self, repo, sample_activities):
+        """Test the PlatformClient fallback built on get_activities."""
+
+        class StaticClient(PlatformClient):
+            platform_name = "static"
+
+            async def get_repository(self, owner, name):
+                raise NotImplementedError
+
+            async def list_repositories(self, owner=None, org=None):
+                return []
+
+            async def get_activities(self, repository, since=None, until=None, limit=100):
+                return sample_activities[:limit]
+
+            async def close(self):
+                pass
+
+        async with StaticClient() as client:
+            batches = [batch async for batch in client.aiter_activities(repo, limit=3)]
+
+        assert batches == [sample_activities[:3]]
+
+
+class TestGraphQL:
+    """Tests for the GraphQL pull request backend."""
+
+    @pytest.fixture
+    def repo(self):
+        """Create a test repository."""
+        return Repository(
+            name="test-repo",
+            owner="testowner",
+            platform="github",
+            url="https://github.com/testowner/test-repo",
+        )
+
+    @staticmethod
+    def _node(number, updated_at="2024-01-15T00:00:00Z", rollup="SUCCESS", merged=False):
+        return {
+            "number": number,
+            "title": f"PR {number}",
+            "url": f"https://github.com/testowner/test-repo/pull/{number}",
+            "state": "MERGED" if merged else "OPEN",
+            "createdAt": "2024-01-10T00:00:00Z",
+            "updatedAt": updated_at,
+            "closedAt": updated_at if merged else None,
+            "mergedAt": updated_at if merged else None,
+            "headRefOid": f"sha{number}",
+            "author": {"login": "alice"},
+            "labels": {"nodes": [{"name": "bug"}]},
+            "reviews": {
+                "nodes": [
+                    {
+                        "author": None,
+                        "state": "APPROVED",
+                        "submittedAt": "2024-01-11T00:00:00Z",
+                    }
+                ]
+            },
+            "commits": {"nodes": [{"commit": {"statusCheckRollup": {"state": rollup}}}]},
+        }
+
+    @staticmethod
+    def _page(nodes, end_cursor=None):
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "repository": {
+                        "pullRequests": {
+                            "pageInfo": {
+                                "hasNextPage": end_cursor is not None,
+                                "endCursor": end_cursor,
+                            },
+                            "nodes": nodes,
+                        }
+                    }
+                }
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_open_details_in_one_query(self, repo):
+        """Test that PRs, reviews and CI status come back in REST shape from one query."""
+        client = GitHubClient(token="test-token")
+        page = self._page([self._node(1), self._node(2, rollup="EXPECTED")])
+
+        with mock.patch.object(client._client, "request", return_value=page) as request:
+            details = await client.get_open_pull_request_details(repo)
+
+        assert request.call_count == 1
+        method, url = request.call_args.args
+        assert (method, url) == ("POST", "https://api.github.com/graphql")
+        assert request.call_args.kwargs["json"]["variables"]["states"] == ["OPEN"]
+
+        pr = details.pull_requests[0]
+        assert pr["number"] == 1
+        assert pr["state"] == "open"
+        assert pr["user"] == {"login": "alice"}
+        assert pr["labels"] == [{"name": "bug"}]
+        assert pr["head"] == {"sha": "sha1"}
+        assert details.reviews[1] == [
+            {
+                "user": {},
+                "state": "APPROVED",
+                "submitted_at": datetime(2024, 1, 11, tzinfo=timezone.utc),
+            }
+        ]
+        assert pr["created_at"] == datetime(2024, 1, 10, tzinfo=timezone.utc)
+        assert pr["merged_at"] is None
+        assert details.statuses == {"sha1": {"state": "success"}, "sha2": {"state": "pending"}}
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_latest_reviews(self, repo):
+        """Test that the newest reviews are fetched, so long-running PRs show current state."""
+        client = GitHubClient(token="test-token")
+
+        with mock.patch.object(
+            client._client, "request", return_value=self._page([self._node(1)])
+        ) as request:
+            await client.get_open_pull_request_details(repo)
+
+        query = request.call_args.kwargs["json"]["query"]
+        assert "reviews(last: 100)" in query
+        assert "reviews(first:" not in query
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_follows_cursors(self, repo):
+        """Test that later pages are requested with the previous end cursor."""
+        client = GitHubClient(token="test-token")
+        pages = [self._page([self._node(1)], end_cursor="c1"), self._page([self._node(2)])]
+
+        with mock.patch.object(client._client, "request", side_effect=pages) as request:
+            details = await client.get_open_pull_request_details(repo)
+
+        assert [pr["number"] for pr in details.pull_requests] == [1, 2]
+        cursors = [call.kwargs["json"]["variables"]["after"] for call in request.call_args_list]
+        assert cursors == [None, "c1"]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_details_stop_at_since(self, repo):
+        """Test that paging stops once results are older than the window."""
+        client = GitHubClient(token="test-token")
+        since = datetime(2024, 1, 10, tzinfo=timezone.utc)
+        pages = [
+            self._page(
+                [
+                    self._node(2, "2024-01-12T00:00:00Z", merged=True),
+                    self._node(1, "2024-01-05T00:00:00Z", merged=True),
+                ],
+                end_cursor="c1",
+            ),
+        ]
+
+        with mock.patch.object(client._client, "request", side_effect=pages) as request:
+            details = await client.get_closed_pull_request_details(repo, since=since)
+
+        assert request.call_count == 1
+        variables = request.call_args.kwargs["json"]["variables"]
+        assert variables["withStatus"] is False
+        assert [pr["number"] for pr in details.pull_requests] == [2]
+        assert details.pull_requests[0]["merged_at"] == datetime(2024, 1, 12, tzinfo=timezone.utc)
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_rest_on_graphql_error(self, repo):
+        """Test that a failed GraphQL query is retried over REST."""
+        client = GitHubClient(token="test-token")
+
+        def mock_request(method, path, params=None, **kwargs):
+            if method == "POST":
+                return httpx.Response(200, json={"errors": [{"message": "boom"}]})
+            if path.endswith("/pulls"):
+                return httpx.Response(
+                    200,
+                    json=[
+                        {"number": 7, "created_at": "2024-01-10T00:00:00Z", "head": {"sha": "s"}}
+                    ],
+                )
+            if path.endswith("/reviews"):
+                return httpx.Response(200, json=[{"state": "APPROVED"}])
+            return httpx.Response(200, json={"state": "failure"})
+
+        with mock.patch.object(client._client, "request", side_effect=mock_request):
+            details = await client.get_open_pull_request_details(repo)
+
+        assert [pr["number"] for pr in details.pull_requests] == [7]
+        assert details.reviews == {7: [{"state": "APPROVED", "submitted_at": None}]}
+        assert details.pull_requests[0]["created_at"] == datetime(2024, 1, 10, tzinfo=timezone.utc)
+        assert details.statuses == {"s": {"state": "failure"}}
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_rest_on_graphql_gateway_error_page(self, repo):
+        """Test that a GraphQL query failing with an HTML 502 page is retried over REST."""
+        client = GitHubClient(token="test-token", retry_policy=RetryPolicy(max_attempts=1))
+
+        def mock_request(method, path, params=None, **kwargs):
+            if method == "POST":
+                return httpx.Response(502, content=b"<html>Bad Gateway</html>")
+            if path.endswith("/pulls"):
+                return httpx.Response(200, json=[{"number": 7, "head": {"sha": "s"}}])
+            if path.endswith("/reviews"):
+                return httpx.Response(200, json=[])
+            return httpx.Response(200, json={"state": "success"})
+
+        with mock.patch.object(client._client, "request", side_effect=mock_request):
+            details = await client.get_open_pull_request_details(repo)
+
+        assert [pr["number"] for pr in details.pull_requests] == [7]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_rest_only_without_token_or_when_disabled(self, repo):
+        """Test that GraphQL is skipped without a token or when turned off."""
+        for client, use_graphql in (
+            (GitHubClient(), True),
+            (GitHubClient(token="test-token"), False),
+        ):
+            with mock.patch.object(
+                client._client, "request", return_value=httpx.Response(200, json=[])
+            ) as request:
+                details = await client.get_open_pull_request_details(repo, use_graphql=use_graphql)
+
+            assert details.pull_requests == []
+            assert all(call.args[0] == "GET" for call in request.call_args_list)
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_enterprise_graphql_url(self):
+        """Test that GitHub Enterprise uses /api/graphql next to /api/v3."""
+        client = GitHubClient(token="t", base_url="https://ghe.example.com/api/v3/")
+        assert client._graphql_url == "https://ghe.example.com/api/graphql"
+        await client.close()
+
+
+class TestCoalescing:
+    """Tests for sharing identical in-flight GET requests."""
+
+    REPO_JSON = {
+        "name": "test-repo",
+        "owner": {"login": "testowner"},
+        "html_url": "https://github.com/testowner/test-repo",
+        "default_branch": "main",
+        "private": False,
+    }
+
+    @staticmethod
+    def slow_request(response_json, calls):
+        """Return a request mock that stays in flight until other tasks have run."""
+
+        async def request(method, path, params=None, **kwargs):
+            calls.append((method, path, params))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=response_json)
+
+        return request
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(self):
+        """Test that concurrent identical GETs make a single network call."""
+        client = GitHubClient(token="test-token")
+        calls: list = []
+
+        with mock.patch.object(
+            client._client, "request", side_effect=self.slow_request(self.REPO_JSON, calls)
+        ):
+            repos = await asyncio.gather(
+                *(client.get_repository("testowner", "test-repo") for _ in range(3))
+            )
+
+        assert len(calls) == 1
+        assert {repo.full_name for repo in repos} == {"testowner/test-repo"}
+        assert client.coalesced_requests == 2
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_not_shared(self):
+        """Test that GETs differing in query parameters are sent separately."""
+        client = GitHubClient(token="test-token")
+        calls: list = []
+
+        with mock.patch.object(client._client, "request", side_effect=self.slow_request([], calls)):
+            await asyncio.gather(
+                client._request("GET", "/user/repos", params={"page": 1}),
+                client._request("GET", "/user/repos", params={"page": 2}),
+            )
+
+        assert len(calls) == 2
+        assert client.coalesced_requests == 0
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_finished_request_is_not_reused(self):
+        """Test that a GET after the shared one finished is sent anew."""
+        client = GitHubClient(token="test-token")
+        response = httpx.Response(200, json=self.REPO_JSON)
+
+        with mock.patch.object(client._client, "request", return_value=response) as request:
+            await client.get_repository("testowner", "test-repo")
+            await client.get_repository("testowner", "test-repo")
+
+        assert request.call_count == 2
+        assert client._in_flight == {}
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        """Test that a failed shared request raises for all callers."""
+        client = GitHubClient(token="test-token")
+
+        async def request(method, path, params=None, **kwargs):
+            await asyncio.sleep(0.01)
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        with mock.patch.object(client._client, "request", side_effect=request) as mock_request:
+            results = await asyncio.gather(
+                client.get_repository("testowner", "missing"),
+                client.get_repository("testowner", "missing"),
+                return_exceptions=True,
+            )
+
+        assert mock_request.call_count == 1
+        assert all(isinstance(result, GitHubAPIError) for result in results)
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that the shared request completes for callers still waiting."""
+        client = GitHubClient(token="test-token")
+        calls: list = []
+
+        with mock.patch.object(
+            client._client, "request", side_effect=self.slow_request(self.REPO_JSON, calls)
+        ):
+            first = asyncio.ensure_future(client.get_repository("testowner", "test-repo"))
+            second = asyncio.ensure_future(client.get_repository("testowner", "test-repo"))
+            await asyncio.sleep(0)
+            first.cancel()
+            repo = await second
+
+        assert first.cancelled()
+        assert repo.name == "test-repo"
+        assert len(calls) == 1
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_pull_request_pages_are_not_modified(self):
+        """Test that parsing PR timestamps leaves a shared response untouched."""
+        client = GitHubClient()
+        repo = Repository(
+            name="test-repo",
+            owner="testowner",
+            platform="github",
+            url="https://github.com/testowner/test-repo",
+        )
+        pulls = [{"number": 1, "created_at": "2024-01-10T00:00:00Z", "head": {"sha": "s"}}]
+        calls: list = []
+
+        async def request(method, path, params=None, **kwargs):
+            calls.append(path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=pulls if path.endswith("/pulls") else [])
+
+        with mock.patch.object(client._client, "request", side_effect=request):
+            raw, details = await asyncio.gather(
+                client.get_open_pull_requests(repo),
+                client.get_open_pull_request_details(repo, use_graphql=False),
+            )
+
+        assert calls.count("/repos/testowner/test-repo/pulls") == 1
+        assert raw[0]["created_at"] == "2024-01-10T00:00:00Z"
+        assert details.pull_requests[0]["created_at"] == datetime(2024, 1, 10, tzinfo=timezone.utc)
+
+        await client.close()
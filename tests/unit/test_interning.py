@@ -0,0 +1,79 @@
+"""Tests for the entity registry."""
+
+from datetime import datetime, timezone
+
+from giteagle.core.interning import EntityRegistry
+from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+
+REPO_FIELDS = {
+    "name": "test-repo",
+    "owner": "testowner",
+    "platform": "github",
+    "url": "https://github.com/testowner/test-repo",
+}
+
+
+class TestEntityRegistry:
+    """Tests for the EntityRegistry class."""
+
+    def test_repository_is_shared(self):
+        """Test that identical repository fields return one instance."""
+        registry = EntityRegistry()
+
+        first = registry.repository(**REPO_FIELDS)
+
+        assert registry.repository(**REPO_FIELDS) is first
+        assert len(registry) == 1
+
+    def test_changed_repository_replaces_shared_instance(self):
+        """Test that a repository with new details is returned and then shared."""
+        registry = EntityRegistry()
+        first = registry.repository(**REPO_FIELDS)
+
+        renamed = registry.repository(**REPO_FIELDS, description="Now described")
+
+        assert renamed is not first
+        assert renamed.description == "Now described"
+        assert registry.repository(**REPO_FIELDS, description="Now described") is renamed
+
+    def test_contributor_is_shared(self):
+        """Test that identical contributor fields return one instance."""
+        registry = EntityRegistry()
+
+        first = registry.contributor("alice", "Alice", "alice@example.com")
+
+        assert registry.contributor("alice", "Alice", "alice@example.com") is first
+        other = registry.contributor("alice", "Alice", "alice@work.example.com")
+        assert other is not first
+        assert other.email == "alice@work.example.com"
+
+    def test_intern_activity(self):
+        """Test that activities are pointed at equal shared instances."""
+        registry = EntityRegistry()
+        activities = [
+            Activity(
+                id=f"c{i}",
+                type=ActivityType.COMMIT,
+                repository=Repository(**REPO_FIELDS),
+                contributor=Contributor(username="alice", name="Alice"),
+                timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                title="Commit",
+            )
+            for i in range(3)
+        ]
+
+        for activity in activities:
+            registry.intern_activity(activity)
+
+        assert activities[0].repository is activities[1].repository is activities[2].repository
+        assert activities[0].contributor is activities[2].contributor
+        assert activities[0].contributor.name == "Alice"
+
+    def test_clear(self):
+        """Test that clear forgets shared instances."""
+        registry = EntityRegistry()
+        first = registry.contributor("alice")
+        registry.clear()
+
+        assert len(registry) == 0
+        assert registry.contributor("alice") is not first
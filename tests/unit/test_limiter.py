@@ -0,0 +1,72 @@
+"""Tests for the request admission limiter."""
+
+import asyncio
+
+import pytest
+
+from giteagle.integrations.limiter import LimiterStats, RequestLimiter
+
+
+class TestRequestLimiter:
+    """Tests for the RequestLimiter class."""
+
+    def test_rejects_non_positive_limit(self):
+        """Test that a limit below 1 is rejected."""
+        with pytest.raises(ValueError, match="at least 1"):
+            RequestLimiter(0)
+
+    @pytest.mark.asyncio
+    async def test_bounds_in_flight_requests(self):
+        """Test that no more than max_concurrent requests run at once."""
+        limiter = RequestLimiter(2)
+        in_flight = 0
+        peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with limiter:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_records_queueing_stats(self):
+        """Test that queue depth and wait time counters are tracked."""
+        limiter = RequestLimiter(1)
+
+        async def request():
+            async with limiter:
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(request() for _ in range(3)))
+
+        stats = limiter.stats
+        assert stats.max_concurrent == 1
+        assert stats.total_requests == 3
+        assert stats.queued_requests == 2
+        assert stats.max_queue_depth == 2
+        assert stats.queue_depth == 0
+        assert stats.in_flight == 0
+        assert stats.max_wait_time > 0
+        assert stats.average_wait_time > 0
+
+    @pytest.mark.asyncio
+    async def test_stats_snapshot_is_a_copy(self):
+        """Test that returned stats do not change after later requests."""
+        limiter = RequestLimiter(1)
+        snapshot = limiter.stats
+
+        async with limiter:
+            pass
+
+        assert snapshot.total_requests == 0
+        assert limiter.stats.total_requests == 1
+
+    def test_average_wait_time_without_requests(self):
+        """Test that the average wait is zero before any request."""
+        assert LimiterStats(max_concurrent=1).average_wait_time == 0.0
@@ -14,6 +14,7 @@ from giteagle.cli.log_renderer import (
     render_log,
 )
 from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+from giteagle.core.records import CommitRecord
 
 
 def _make_console() -> tuple[Console, StringIO]:
@@ -29,10 +30,10 @@ def _make_activity(
     title: str = "Test commit",
     parents: list[str] | None = None,
     hours_ago: int = 0,
-) -> Activity:
-    """Helper to create a commit Activity."""
+) -> CommitRecord:
+    """Helper to create the record of a commit Activity."""
     owner, name = repo_name.split("/", 1)
-    return Activity(
+    activity = Activity(
         id=f"github:commit:{sha}",
         type=ActivityType.COMMIT,
         repository=Repository(
@@ -49,6 +50,7 @@ def _make_activity(
             "parents": parents if parents is not None else ["parent1"],
         },
     )
+    return CommitRecord.from_activity(activity)
 
 
 class TestAssignRepoColors:
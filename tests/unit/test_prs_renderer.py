@@ -72,7 +72,7 @@ class TestBuildPrInfos:
                 "number": 42,
                 "title": "Add feature",
                 "user": {"login": "alice"},
-                "created_at": "2026-02-08T10:00:00Z",
+                "created_at": datetime(2026, 2, 8, 10, tzinfo=timezone.utc),
                 "head": {"sha": "abc123"},
                 "labels": [{"name": "enhancement"}],
                 "html_url": "https://github.com/org/repo/pull/42",
@@ -96,7 +96,7 @@ class TestBuildPrInfos:
                 "number": 1,
                 "title": "PR",
                 "user": {"login": "bob"},
-                "created_at": "2026-02-08T10:00:00Z",
+                "created_at": datetime(2026, 2, 8, 10, tzinfo=timezone.utc),
                 "head": {"sha": "def456"},
                 "labels": [],
                 "html_url": "",
@@ -107,7 +107,7 @@ class TestBuildPrInfos:
                 {
                     "user": {"login": "reviewer1"},
                     "state": "APPROVED",
-                    "submitted_at": "2026-02-08T12:00:00Z",
+                    "submitted_at": datetime(2026, 2, 8, 12, tzinfo=timezone.utc),
                 },
             ],
         }
@@ -123,7 +123,7 @@ class TestBuildPrInfos:
                 "number": 1,
                 "title": "PR",
                 "user": {"login": "bob"},
-                "created_at": "2026-02-08T10:00:00Z",
+                "created_at": datetime(2026, 2, 8, 10, tzinfo=timezone.utc),
                 "head": {"sha": "def456"},
                 "labels": [],
                 "html_url": "",
@@ -134,12 +134,12 @@ class TestBuildPrInfos:
                 {
                     "user": {"login": "reviewer1"},
                     "state": "APPROVED",
-                    "submitted_at": "2026-02-08T12:00:00Z",
+                    "submitted_at": datetime(2026, 2, 8, 12, tzinfo=timezone.utc),
                 },
                 {
                     "user": {"login": "reviewer2"},
                     "state": "CHANGES_REQUESTED",
-                    "submitted_at": "2026-02-08T13:00:00Z",
+                    "submitted_at": datetime(2026, 2, 8, 13, tzinfo=timezone.utc),
                 },
             ],
         }
@@ -154,7 +154,7 @@ class TestBuildPrInfos:
                 "number": 1,
                 "title": "PR",
                 "user": {"login": "bob"},
-                "created_at": "2026-02-08T10:00:00Z",
+                "created_at": datetime(2026, 2, 8, 10, tzinfo=timezone.utc),
                 "head": {"sha": "abc"},
                 "labels": [],
                 "html_url": "",
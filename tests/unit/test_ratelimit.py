@@ -0,0 +1,87 @@
+"""Tests for the rate-limit scheduler."""
+
+import pytest
+
+from giteagle.integrations.ratelimit import RateLimitScheduler
+
+NOW = 1_700_000_000.0
+
+
+class TestRateLimitScheduler:
+    """Tests for the RateLimitScheduler class."""
+
+    def test_rejects_pace_threshold_outside_unit_range(self):
+        """Test that pace_below must be a fraction."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            RateLimitScheduler(pace_below=1.5)
+
+    def test_unknown_budget_does_not_delay(self):
+        """Test that requests go out immediately before any budget is known."""
+        scheduler = RateLimitScheduler()
+
+        assert scheduler.reserve(now=NOW) == 0
+        assert scheduler.budget(now=NOW) is None
+
+    def test_plenty_left_does_not_delay(self):
+        """Test that requests are not paced while most of the budget is left."""
+        scheduler = RateLimitScheduler()
+        scheduler.update(5000, 4000, NOW + 3600)
+
+        assert [scheduler.reserve(now=NOW) for _ in range(3)] == [0, 0, 0]
+        assert scheduler.budget(now=NOW).remaining == 3997
+        assert scheduler.stats.paced_requests == 0
+
+    def test_low_budget_spreads_requests_until_reset(self):
+        """Test that requests are spaced out once the budget runs low."""
+        scheduler = RateLimitScheduler(pace_below=0.1)
+        scheduler.update(100, 5, NOW + 50)
+
+        delays = [scheduler.reserve(now=NOW) for _ in range(5)]
+
+        assert delays == pytest.approx([0, 10, 20, 30, 40])
+        assert scheduler.stats.paced_requests == 4
+
+    def test_spent_budget_pauses_until_reset(self):
+        """Test that a spent budget waits for the reset time."""
+        scheduler = RateLimitScheduler()
+        scheduler.update(5000, 0, NOW + 30)
+
+        assert scheduler.reserve(now=NOW) == pytest.approx(31)
+        assert scheduler.stats.pauses == 1
+        assert scheduler.stats.total_delay == pytest.approx(31)
+
+    def test_expired_window_is_forgotten(self):
+        """Test that a budget is dropped once its reset time passes."""
+        scheduler = RateLimitScheduler()
+        scheduler.update(5000, 0, NOW + 30)
+
+        assert scheduler.reserve(now=NOW + 31) == 0
+        assert scheduler.budget(now=NOW + 31) is None
+
+    def test_out_of_order_updates_keep_lowest_remaining(self):
+        """Test that a stale response in the same window cannot raise the budget."""
+        scheduler = RateLimitScheduler()
+        scheduler.update(5000, 100, NOW + 60)
+        scheduler.update(5000, 120, NOW + 60)
+
+        assert scheduler.budget(now=NOW).remaining == 100
+
+        scheduler.update(5000, 4999, NOW + 3660)
+
+        assert scheduler.budget(now=NOW).remaining == 4999
+
+    def test_update_from_headers(self):
+        """Test reading budgets from X-RateLimit headers."""
+        scheduler = RateLimitScheduler()
+        scheduler.update_from_headers(
+            {
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "42",
+                "X-RateLimit-Reset": str(int(NOW + 60)),
+                "X-RateLimit-Resource": "search",
+            }
+        )
+        scheduler.update_from_headers({"X-RateLimit-Remaining": "7"})
+
+        assert scheduler.budget("search", now=NOW).remaining == 42
+        assert scheduler.budget("core", now=NOW) is None
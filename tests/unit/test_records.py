@@ -0,0 +1,107 @@
+"""Tests for compact activity records."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+from giteagle.core.records import (
+    ActivityRecord,
+    CommitRecord,
+    IssueRecord,
+    PullRequestRecord,
+    to_record,
+)
+
+
+def make_activity(activity_type: ActivityType, metadata: dict, id: str = "a1") -> Activity:
+    """Create an activity of a type with the given metadata."""
+    return Activity(
+        id=id,
+        type=activity_type,
+        repository=Repository(
+            name="repo", owner="org", platform="github", url="https://github.com/org/repo"
+        ),
+        contributor=Contributor(username="alice", email="alice@example.com"),
+        timestamp=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
+        title="Title",
+        metadata=metadata,
+    )
+
+
+class TestToRecord:
+    """Tests for to_record."""
+
+    def test_commit(self):
+        """Test that a commit keeps its sha and parents and knows merges."""
+        record = to_record(
+            make_activity(ActivityType.COMMIT, {"sha": "abc123", "parents": ["p1", "p2"]})
+        )
+
+        assert isinstance(record, CommitRecord)
+        assert record.sha == "abc123"
+        assert record.parents == ("p1", "p2")
+        assert record.is_merge
+        assert record.repository == "org/repo"
+        assert record.author == "alice"
+        assert record.title == "Title"
+
+    def test_pull_request_parses_times(self):
+        """Test that pull request timestamps are parsed once, into datetimes."""
+        record = to_record(
+            make_activity(
+                ActivityType.PULL_REQUEST,
+                {
+                    "number": 7,
+                    "state": "closed",
+                    "merged": True,
+                    "merged_at": "2024-01-16T09:30:00Z",
+                    "closed_at": "2024-01-16T09:30:00Z",
+                    "updated_at": "2024-01-17T00:00:00Z",
+                },
+            )
+        )
+
+        assert isinstance(record, PullRequestRecord)
+        assert record.number == 7
+        assert record.merged
+        assert record.merged_at == datetime(2024, 1, 16, 9, 30, tzinfo=timezone.utc)
+        assert record.closed_at == record.merged_at
+        assert record.updated_at == datetime(2024, 1, 17, tzinfo=timezone.utc)
+
+    def test_issue_tolerates_missing_and_malformed_metadata(self):
+        """Test that absent or unparsable fields become None or empty."""
+        record = to_record(make_activity(ActivityType.ISSUE, {"closed_at": "not a date"}))
+
+        assert isinstance(record, IssueRecord)
+        assert record.number is None
+        assert record.closed_at is None
+        assert record.labels == ()
+        assert record.updated_at == record.timestamp
+
+    def test_other_types_get_base_record(self):
+        """Test that types without their own record class get an ActivityRecord."""
+        record = to_record(make_activity(ActivityType.RELEASE, {"tag": "v1"}))
+
+        assert type(record) is ActivityRecord
+        assert record.type == ActivityType.RELEASE
+
+
+class TestActivityRecord:
+    """Tests for ActivityRecord behavior."""
+
+    def test_equal_by_id(self):
+        """Test that records compare and hash by id, like activities."""
+        first = to_record(make_activity(ActivityType.COMMIT, {"sha": "a"}))
+        second = to_record(make_activity(ActivityType.COMMIT, {"sha": "b"}))
+
+        assert first == second
+        assert len({first, second}) == 1
+
+    def test_has_no_instance_dict(self):
+        """Test that records are slotted and reject unknown attributes."""
+        record = to_record(make_activity(ActivityType.COMMIT, {"sha": "a"}))
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.extra = 1  # type: ignore[attr-defined]
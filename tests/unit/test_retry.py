@@ -0,0 +1,121 @@
+"""Tests for the retry backoff policy."""
+
+import random
+
+import pytest
+
+from giteagle.integrations.retry import (
+    RetryPolicy,
+    RetryState,
+    is_secondary_rate_limit,
+    parse_retry_after,
+)
+
+
+@pytest.fixture
+def policy():
+    """Create a policy with seeded jitter."""
+    return RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=10.0, rng=random.Random(7))
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_seconds(self):
+        """Test a delay given in seconds."""
+        assert parse_retry_after("30") == 30.0
+
+    def test_http_date(self):
+        """Test a delay given as an HTTP date."""
+        now = 1_700_000_000.0  # Tue, 14 Nov 2023 22:13:20 GMT
+
+        assert parse_retry_after("Tue, 14 Nov 2023 22:14:00 GMT", now=now) == 40.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        """Test that unusable values are ignored."""
+        assert parse_retry_after(value) is None
+
+
+class TestIsSecondaryRateLimit:
+    """Tests for is_secondary_rate_limit."""
+
+    def test_detects_secondary_limit(self):
+        """Test 403s with Retry-After or GitHub's message."""
+        assert is_secondary_rate_limit(403, {"Retry-After": "60"}, b"")
+        assert is_secondary_rate_limit(
+            403, {}, b'{"message": "You have exceeded a secondary rate limit."}'
+        )
+
+    def test_ignores_permission_errors(self):
+        """Test that other 403s are not retried."""
+        assert not is_secondary_rate_limit(403, {}, b'{"message": "Resource not accessible"}')
+        assert not is_secondary_rate_limit(404, {"Retry-After": "60"}, b"")
+
+
+class TestRetryPolicy:
+    """Tests for the RetryPolicy class."""
+
+    def test_rejects_invalid_settings(self):
+        """Test that nonsensical settings are rejected."""
+        with pytest.raises(ValueError, match="max_attempts"):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError, match="base_delay"):
+            RetryPolicy(base_delay=5.0, max_delay=1.0)
+
+    def test_decorrelated_jitter_stays_within_bounds(self, policy):
+        """Test that each delay lies between the base and three times the last one."""
+        state = RetryState()
+        previous = policy.base_delay
+        for _ in range(policy.max_attempts - 1):
+            delay = policy.backoff(state)
+            assert policy.base_delay <= delay <= min(policy.max_delay, max(previous * 3, 1.0))
+            previous = delay
+
+    def test_gives_up_after_max_attempts(self, policy):
+        """Test that the last attempt is not followed by a retry."""
+        state = RetryState()
+        delays = [policy.backoff(state) for _ in range(policy.max_attempts)]
+
+        assert all(delay is not None for delay in delays[:-1])
+        assert delays[-1] is None
+        assert policy.stats.retries == policy.max_attempts - 1
+
+    def test_retry_after_is_a_minimum(self, policy):
+        """Test that Retry-After is honored even above the jitter cap."""
+        assert policy.backoff(RetryState(), retry_after=30.0) == 30.0
+
+    def test_total_delay_is_capped(self):
+        """Test that a request gives up once its waits would exceed the cap."""
+        policy = RetryPolicy(max_attempts=10, max_total_delay=45.0)
+        state = RetryState()
+
+        assert policy.backoff(state, retry_after=30.0) == 30.0
+        assert policy.backoff(state, retry_after=30.0) is None
+
+    def test_throttled_response_starts_shared_cooldown(self, policy):
+        """Test that a 429 holds off other requests for its delay."""
+        delay = policy.response_backoff(RetryState(), 429, {"Retry-After": "5"})
+
+        assert delay == 5.0
+        assert 4.0 < policy.cooldown_remaining() <= 5.0
+        assert policy.stats.cooldowns == 1
+
+    def test_gateway_error_backs_off_alone(self, policy):
+        """Test that a 502 without Retry-After does not hold off other requests."""
+        assert policy.response_backoff(RetryState(), 502, {}) is not None
+        assert policy.cooldown_remaining() == 0
+
+    def test_secondary_limit_waits_a_minute(self):
+        """Test that a secondary rate limit without Retry-After waits at least 60s."""
+        policy = RetryPolicy()
+
+        assert policy.response_backoff(RetryState(), 403, {}) == 60.0
+
+    def test_cooldown_only_extends(self, policy):
+        """Test that a shorter cooldown does not cut a longer one short."""
+        policy.cool_down(10.0, now=100.0)
+        policy.cool_down(2.0, now=101.0)
+
+        assert policy.cooldown_remaining(now=105.0) == 5.0
+        assert policy.stats.cooldowns == 1
@@ -14,6 +14,7 @@ from giteagle.cli.standup_renderer import (
     render_standup,
 )
 from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+from giteagle.core.records import ActivityRecord, to_record
 
 
 def _make_console() -> tuple[Console, StringIO]:
@@ -30,8 +31,8 @@ def _make_activity(
     username: str = "testuser",
     hours_ago: int = 0,
     metadata: dict | None = None,
-) -> Activity:
-    """Helper to create an Activity for testing."""
+) -> ActivityRecord:
+    """Helper to create the record of an Activity for testing."""
     owner, name = repo_name.split("/", 1)
     default_metadata: dict = {}
     if activity_type == ActivityType.COMMIT:
@@ -54,7 +55,7 @@ def _make_activity(
     if metadata:
         default_metadata.update(metadata)
 
-    return Activity(
+    activity = Activity(
         id=f"github:{activity_type.value}:{repo_name}:{title}",
         type=activity_type,
         repository=Repository(
@@ -68,6 +69,7 @@ def _make_activity(
         title=title,
         metadata=default_metadata,
     )
+    return to_record(activity)
 
 
 class TestComputeStandupSince:
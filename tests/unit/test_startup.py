@@ -0,0 +1,59 @@
+"""Tests that CLI startup only imports what the invoked command needs."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["asyncio", "httpx", "pydantic", "rich", "yaml", "giteagle.core", "numpy"]
+
+_DRIVER = """
+import json, sys
+sys.argv = ["giteagle", *sys.argv[1:]]
+from giteagle.cli.main import cli
+try:
+    cli()
+except SystemExit:
+    pass
+print(json.dumps(sorted(name for name in {heavy!r} if name in sys.modules)))
+"""
+
+
+def loaded_heavy_modules(*args: str, tmp_path) -> list[str]:
+    """Run the CLI in a fresh interpreter and return the heavy modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-c", _DRIVER.format(heavy=HEAVY_MODULES), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={
+            **os.environ,
+            "GITEAGLE_CONFIG": str(tmp_path / "config.yaml"),
+            # Requests fail at once instead of reaching GitHub
+            "HTTPS_PROXY": "http://127.0.0.1:9",
+        },
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+class TestLazyImports:
+    """Tests for deferred imports in the CLI."""
+
+    @pytest.mark.parametrize("args", [["--version"], ["--help"]])
+    def test_version_and_help_load_nothing_heavy(self, args, tmp_path):
+        """Test that version and help output import none of the heavy modules."""
+        assert loaded_heavy_modules(*args, tmp_path=tmp_path) == []
+
+    def test_config_skips_network_and_models(self, tmp_path):
+        """Test that showing the configuration loads neither httpx nor the models."""
+        assert loaded_heavy_modules("config", tmp_path=tmp_path) == ["pydantic", "rich"]
+
+    def test_fetch_command_skips_numpy(self, tmp_path):
+        """Test that a fetch command leaves numpy to the first histogram or table."""
+        # An invalid repository name runs the command without fetching anything
+        loaded = loaded_heavy_modules("log", "not-a-repo", tmp_path=tmp_path)
+
+        assert "giteagle.core" in loaded
+        assert "numpy" not in loaded
@@ -85,8 +85,8 @@ class TestBuildPrMetrics:
             {
                 "number": 42,
                 "title": "Add feature",
-                "created_at": "2026-02-01T10:00:00Z",
-                "merged_at": "2026-02-03T10:00:00Z",
+                "created_at": datetime(2026, 2, 1, 10, tzinfo=timezone.utc),
+                "merged_at": datetime(2026, 2, 3, 10, tzinfo=timezone.utc),
             },
         ]
         reviews_map: dict[int, list[dict]] = {42: []}
@@ -101,8 +101,8 @@ class TestBuildPrMetrics:
             {
                 "number": 1,
                 "title": "PR",
-                "created_at": "2026-02-01T10:00:00Z",
-                "merged_at": "2026-02-03T10:00:00Z",
+                "created_at": datetime(2026, 2, 1, 10, tzinfo=timezone.utc),
+                "merged_at": datetime(2026, 2, 3, 10, tzinfo=timezone.utc),
             },
         ]
         reviews_map: dict[int, list[dict]] = {
@@ -110,12 +110,12 @@ class TestBuildPrMetrics:
                 {
                     "user": {"login": "r1"},
                     "state": "COMMENTED",
-                    "submitted_at": "2026-02-01T11:00:00Z",
+                    "submitted_at": datetime(2026, 2, 1, 11, tzinfo=timezone.utc),
                 },
                 {
                     "user": {"login": "r2"},
                     "state": "APPROVED",
-                    "submitted_at": "2026-02-01T14:00:00Z",
+                    "submitted_at": datetime(2026, 2, 1, 14, tzinfo=timezone.utc),
                 },
             ],
         }
@@ -128,7 +128,7 @@ class TestBuildPrMetrics:
             {
                 "number": 1,
                 "title": "Closed unmerged",
-                "created_at": "2026-02-01T10:00:00Z",
+                "created_at": datetime(2026, 2, 1, 10, tzinfo=timezone.utc),
                 "merged_at": None,
             },
         ]
@@ -0,0 +1,205 @@
+"""Tests for the local activity store."""
+
+import sqlite3
+import stat
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from giteagle.core.models import Activity, ActivityType, Contributor, Repository
+from giteagle.core.store import ActivityStore, activity_updated_at
+
+NOW = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store in a temporary directory."""
+    activity_store = ActivityStore.in_directory(tmp_path)
+    yield activity_store
+    activity_store.close()
+
+
+@pytest.fixture
+def repo():
+    """Create a test repository."""
+    return Repository(
+        name="test-repo",
+        owner="testowner",
+        platform="github",
+        url="https://github.com/testowner/test-repo",
+    )
+
+
+def make_activity(repo, activity_id, hours_ago, activity_type=ActivityType.COMMIT, **metadata):
+    """Create an activity some hours before NOW."""
+    return Activity(
+        id=activity_id,
+        type=activity_type,
+        repository=repo,
+        contributor=Contributor(username="alice"),
+        timestamp=NOW - timedelta(hours=hours_ago),
+        title=activity_id,
+        metadata=metadata,
+    )
+
+
+class TestActivityUpdatedAt:
+    """Tests for the activity_updated_at helper."""
+
+    def test_uses_metadata_updated_at(self, repo):
+        """Test that pull requests and issues use their update time."""
+        activity = make_activity(
+            repo, "pr", 48, ActivityType.PULL_REQUEST, updated_at="2024-01-15T11:00:00Z"
+        )
+        assert activity_updated_at(activity) == NOW - timedelta(hours=1)
+
+    def test_uses_parsed_metadata_updated_at(self, repo):
+        """Test that an update time already parsed into a datetime is used as is."""
+        activity = make_activity(
+            repo, "pr", 48, ActivityType.PULL_REQUEST, updated_at=NOW - timedelta(hours=1)
+        )
+        assert activity_updated_at(activity) == NOW - timedelta(hours=1)
+
+    def test_falls_back_to_timestamp(self, repo):
+        """Test that commits use their timestamp."""
+        activity = make_activity(repo, "c", 3)
+        assert activity_updated_at(activity) == activity.timestamp
+
+
+class TestActivityStore:
+    """Tests for the ActivityStore class."""
+
+    def test_round_trip(self, store, repo):
+        """Test that stored activities come back intact, newest first."""
+        older = make_activity(repo, "c1", 5)
+        newer = make_activity(repo, "c2", 1)
+        assert store.add_activities([older, newer]) == 2
+
+        activities = store.get_activities(repo)
+
+        assert [a.id for a in activities] == ["c2", "c1"]
+        assert activities[0].model_dump() == newer.model_dump()
+
+    def test_round_trip_keeps_metadata_timestamps(self, store, repo):
+        """Test that metadata timestamps come back as datetimes, missing ones as None."""
+        activity = make_activity(
+            repo,
+            "pr",
+            5,
+            ActivityType.PULL_REQUEST,
+            updated_at=NOW - timedelta(hours=1),
+            merged_at=None,
+        )
+        store.add_activities([activity])
+
+        (loaded,) = store.get_activities(repo)
+
+        assert loaded.metadata["updated_at"] == NOW - timedelta(hours=1)
+        assert loaded.metadata["merged_at"] is None
+        assert "closed_at" not in loaded.metadata
+        assert store.get_activities(repo, since=NOW - timedelta(hours=2)) == [loaded]
+
+    def test_replaces_by_id(self, store, repo):
+        """Test that storing an activity again replaces the earlier copy."""
+        store.add_activities(
+            [make_activity(repo, "pr", 5, ActivityType.PULL_REQUEST, state="open")]
+        )
+        store.add_activities(
+            [make_activity(repo, "pr", 5, ActivityType.PULL_REQUEST, state="closed")]
+        )
+
+        activities = store.get_activities(repo)
+
+        assert len(activities) == 1
+        assert activities[0].metadata["state"] == "closed"
+
+    def test_since_filters_on_update_time(self, store, repo):
+        """Test that old pull requests updated in the window are returned."""
+        store.add_activities(
+            [
+                make_activity(repo, "old-commit", 72),
+                make_activity(repo, "new-commit", 2),
+                make_activity(
+                    repo,
+                    "old-pr",
+                    72,
+                    ActivityType.PULL_REQUEST,
+                    updated_at="2024-01-15T11:00:00Z",
+                ),
+            ]
+        )
+
+        activities = store.get_activities(repo, since=NOW - timedelta(days=1))
+
+        assert [a.id for a in activities] == ["new-commit", "old-pr"]
+
+    def test_limit_keeps_newest(self, store, repo):
+        """Test that limit keeps the most recent activities."""
+        store.add_activities([make_activity(repo, f"c{i}", i) for i in range(5)])
+
+        assert [a.id for a in store.get_activities(repo, limit=2)] == ["c0", "c1"]
+
+    def test_scoped_to_repository(self, store, repo):
+        """Test that activities of other repositories are not returned."""
+        other = Repository(
+            name="other", owner="testowner", platform="github", url="https://github.com/x/y"
+        )
+        store.add_activities([make_activity(repo, "c1", 1), make_activity(other, "c2", 1)])
+
+        assert [a.id for a in store.get_activities(other)] == ["c2"]
+
+    def test_sync_state(self, store, repo):
+        """Test recording and reading back sync state per activity type."""
+        assert store.get_sync_state(repo, ActivityType.COMMIT) is None
+
+        store.set_sync_state(
+            repo,
+            ActivityType.COMMIT,
+            watermark=NOW,
+            covered_since=NOW - timedelta(days=7),
+        )
+
+        state = store.get_sync_state(repo, ActivityType.COMMIT)
+        assert state is not None
+        assert state.watermark == NOW
+        assert state.covered_since == NOW - timedelta(days=7)
+        assert store.get_sync_state(repo, ActivityType.ISSUE) is None
+
+    def test_persists_across_instances(self, tmp_path, repo):
+        """Test that history survives closing the store."""
+        first = ActivityStore.in_directory(tmp_path)
+        first.add_activities([make_activity(repo, "c1", 1)])
+        first.close()
+
+        second = ActivityStore.in_directory(tmp_path)
+        assert [a.id for a in second.get_activities(repo)] == ["c1"]
+        second.close()
+
+    def test_rebuilds_outdated_schema(self, tmp_path, repo):
+        """Test that a store file from another schema version is rebuilt."""
+        path = tmp_path / ActivityStore.FILENAME
+        conn = sqlite3.connect(str(path))
+        conn.execute("CREATE TABLE activities (id TEXT PRIMARY KEY)")
+        conn.commit()
+        conn.close()
+
+        store = ActivityStore(path)
+        store.add_activities([make_activity(repo, "c1", 1)])
+        assert len(store.get_activities(repo)) == 1
+        store.close()
+
+    def test_clear(self, store, repo):
+        """Test that clear removes activities and sync state."""
+        store.add_activities([make_activity(repo, "c1", 1), make_activity(repo, "c2", 2)])
+        store.set_sync_state(repo, ActivityType.COMMIT, watermark=NOW, covered_since=NOW)
+
+        assert store.clear() == 2
+        assert store.get_activities(repo) == []
+        assert store.get_sync_state(repo, ActivityType.COMMIT) is None
+
+    def test_file_is_owner_only(self, store):
+        """Test that the store file is readable only by its owner."""
+        mode = store.path.stat().st_mode
+        assert mode & stat.S_IRWXG == 0
+        assert mode & stat.S_IRWXO == 0
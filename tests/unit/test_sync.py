@@ -0,0 +1,246 @@
+"""Tests for incremental activity sync."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from unittest import mock
+
+import httpx
+import pytest
+
+from giteagle.core.models import ActivityType, Repository
+from giteagle.core.store import ActivityStore
+from giteagle.integrations.github import GitHubClient
+from giteagle.integrations.sync import sync_repository
+
+NOW = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def iso(when: datetime) -> str:
+    """Format a datetime the way the GitHub API does."""
+    return when.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FakeGitHub:
+    """Serve commits, pull requests and issues from in-memory lists."""
+
+    def __init__(self) -> None:
+        self.commits: list[dict] = []
+        self.pulls: list[dict] = []
+        self.issues: list[dict] = []
+        self.requests: list[tuple[str, dict]] = []
+
+    def add_commit(self, sha: str, when: datetime, committed: Optional[datetime] = None) -> None:
+        """Add a commit authored at when and landed at committed (default: when)."""
+        self.commits.insert(
+            0,
+            {
+                "sha": sha,
+                "commit": {
+                    "message": sha,
+                    "author": {"date": iso(when)},
+                    "committer": {"date": iso(committed or when)},
+                },
+            },
+        )
+
+    def add_pull(self, number: int, created: datetime, updated: datetime) -> None:
+        self.pulls = [pr for pr in self.pulls if pr["number"] != number]
+        self.pulls.insert(
+            0,
+            {
+                "number": number,
+                "state": "open",
+                "created_at": iso(created),
+                "updated_at": iso(updated),
+            },
+        )
+
+    def add_issue(self, number: int, updated: datetime, pull_request: bool = False) -> None:
+        """Add an issue, or a pull request as the issues listing shows it, updated at updated."""
+        issue = {
+            "number": number,
+            "state": "open",
+            "created_at": iso(updated),
+            "updated_at": iso(updated),
+        }
+        if pull_request:
+            issue["pull_request"] = {}
+        self.issues.insert(0, issue)
+
+    def __call__(self, method, path, params=None, **kwargs):
+        params = params or {}
+        self.requests.append((path, params))
+        if path.endswith("/commits"):
+            # Like GitHub, since filters on the committer date
+            since = params.get("since")
+            items = [
+                c
+                for c in self.commits
+                if since is None
+                or datetime.fromisoformat(c["commit"]["committer"]["date"].replace("Z", "+00:00"))
+                >= datetime.fromisoformat(since)
+            ]
+        elif path.endswith("/pulls"):
+            items = self.pulls
+        else:
+            items = self.issues
+        page = params.get("page", 1)
+        per_page = params.get("per_page", 100)
+        return httpx.Response(200, json=items[(page - 1) * per_page : page * per_page])
+
+
+@pytest.fixture
+def repo():
+    """Create a test repository."""
+    return Repository(
+        name="test-repo",
+        owner="testowner",
+        platform="github",
+        url="https://github.com/testowner/test-repo",
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store in a temporary directory."""
+    activity_store = ActivityStore.in_directory(tmp_path)
+    yield activity_store
+    activity_store.close()
+
+
+class TestSyncRepository:
+    """Tests for sync_repository."""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_fetches_window(self, store, repo):
+        """Test that the first sync fetches the full window and records state."""
+        github = FakeGitHub()
+        github.add_commit("a", NOW - timedelta(days=2))
+        github.add_pull(1, NOW - timedelta(days=3), NOW - timedelta(hours=5))
+        since = NOW - timedelta(days=7)
+
+        client = GitHubClient(token="test-token")
+        with mock.patch.object(client._client, "request", side_effect=github):
+            result = await sync_repository(client, store, repo, since=since)
+        await client.close()
+
+        assert result.total_fetched == 2
+        assert not any(result.incremental.values())
+        state = store.get_sync_state(repo, ActivityType.PULL_REQUEST)
+        assert state is not None
+        assert state.watermark == NOW - timedelta(hours=5)
+        assert state.covered_since == since
+        assert {a.id for a in store.get_activities(repo, since=since)} == {
+            "github:commit:a",
+            "github:pr:testowner/test-repo:1",
+        }
+
+    @pytest.mark.asyncio
+    async def test_second_sync_fetches_only_delta(self, store, repo):
+        """Test that a covered window is refreshed from the watermark and merged."""
+        github = FakeGitHub()
+        github.add_commit("a", NOW - timedelta(days=2))
+        github.add_pull(1, NOW - timedelta(days=3), NOW - timedelta(days=2))
+        since = NOW - timedelta(days=7)
+
+        client = GitHubClient(token="test-token")
+        with mock.patch.object(client._client, "request", side_effect=github):
+            await sync_repository(client, store, repo, since=since)
+
+            github.add_commit("b", NOW - timedelta(hours=1))
+            github.add_pull(1, NOW - timedelta(days=3), NOW - timedelta(hours=1))
+            github.requests.clear()
+            result = await sync_repository(client, store, repo, since=since + timedelta(hours=1))
+        await client.close()
+
+        assert all(result.incremental.values())
+        commit_params = next(p for path, p in github.requests if path.endswith("/commits"))
+        assert commit_params["since"] == (NOW - timedelta(days=2)).isoformat()
+        assert result.fetched[ActivityType.COMMIT] == 2
+        assert result.fetched[ActivityType.PULL_REQUEST] == 1
+
+        activities = store.get_activities(repo, since=since)
+        assert {a.id for a in activities} == {
+            "github:commit:a",
+            "github:commit:b",
+            "github:pr:testowner/test-repo:1",
+        }
+        pr = next(a for a in activities if a.type == ActivityType.PULL_REQUEST)
+        assert pr.metadata["updated_at"] == NOW - timedelta(hours=1)
+
+    @pytest.mark.asyncio
+    async def test_backdated_commit_landing_after_sync_is_stored(self, store, repo):
+        """Test that a commit authored before the last sync but merged after it is kept."""
+        github = FakeGitHub()
+        github.add_commit("a", NOW - timedelta(days=1))
+        since = NOW - timedelta(days=7)
+
+        client = GitHubClient(token="test-token")
+        with mock.patch.object(client._client, "request", side_effect=github):
+            await sync_repository(client, store, repo, since=since)
+
+            # Written on a branch three days ago, merged an hour ago
+            github.add_commit("b", NOW - timedelta(days=3), committed=NOW - timedelta(hours=1))
+            await sync_repository(client, store, repo, since=since)
+        await client.close()
+
+        assert {a.id for a in store.get_activities(repo, since=since)} == {
+            "github:commit:a",
+            "github:commit:b",
+        }
+        state = store.get_sync_state(repo, ActivityType.COMMIT)
+        assert state.watermark == NOW - timedelta(hours=1)
+
+    @pytest.mark.asyncio
+    async def test_wider_window_triggers_full_fetch(self, store, repo):
+        """Test that asking for older history than stored refetches the window."""
+        github = FakeGitHub()
+        github.add_commit("a", NOW - timedelta(days=10))
+
+        client = GitHubClient(token="test-token")
+        with mock.patch.object(client._client, "request", side_effect=github):
+            await sync_repository(client, store, repo, since=NOW - timedelta(days=7))
+            result = await sync_repository(client, store, repo, since=NOW - timedelta(days=30))
+        await client.close()
+
+        assert result.incremental[ActivityType.COMMIT] is False
+        assert result.fetched[ActivityType.COMMIT] == 1
+        state = store.get_sync_state(repo, ActivityType.COMMIT)
+        assert state is not None
+        assert state.covered_since == NOW - timedelta(days=30)
+
+    @pytest.mark.asyncio
+    async def test_truncated_fetch_narrows_coverage(self, store, repo):
+        """Test that hitting the limit only marks the fetched range as covered."""
+        github = FakeGitHub()
+        for hours in (30, 20, 10):
+            github.add_commit(f"c{hours}", NOW - timedelta(hours=hours))
+        since = NOW - timedelta(days=7)
+
+        client = GitHubClient(token="test-token")
+        with mock.patch.object(client._client, "request", side_effect=github):
+            await sync_repository(client, store, repo, since=since, limit=2)
+        await client.close()
+
+        state = store.get_sync_state(repo, ActivityType.COMMIT)
+        assert state is not None
+        assert state.covered_since == NOW - timedelta(hours=20)
+
+    @pytest.mark.asyncio
+    async def test_limit_counts_pull_requests_in_issue_listing(self, store, repo):
+        """Test that pull requests skipped from the issues listing still count toward the limit."""
+        github = FakeGitHub()
+        github.add_issue(1, NOW - timedelta(hours=30))
+        github.add_issue(2, NOW - timedelta(hours=10))
+        github.add_issue(3, NOW - timedelta(hours=5), pull_request=True)
+        since = NOW - timedelta(days=7)
+
+        client = GitHubClient(token="test-token")
+        with mock.patch.object(client._client, "request", side_effect=github):
+            result = await sync_repository(client, store, repo, since=since, limit=2)
+        await client.close()
+
+        assert result.fetched[ActivityType.ISSUE] == 1
+        state = store.get_sync_state(repo, ActivityType.ISSUE)
+        assert state is not None
+        assert state.covered_since == NOW - timedelta(hours=10)
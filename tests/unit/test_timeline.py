@@ -0,0 +1,117 @@
+"""Tests for timeline bucketing."""
+
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from giteagle.core import timeline
+from giteagle.core.timeline import count_buckets, count_buckets_by, wall_clock_us
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test with the pure-Python kernels and, if installed, with numpy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(timeline, "_np", None)
+    return request.param
+
+
+def strftime_key(when: datetime, granularity: str) -> str:
+    """Bucket a datetime the way get_activity_timeline used to."""
+    if granularity == "hour":
+        return when.strftime("%Y-%m-%d %H:00")
+    if granularity == "week":
+        return (when - timedelta(days=when.weekday())).strftime("%Y-%m-%d")
+    if granularity == "month":
+        return when.strftime("%Y-%m")
+    return when.strftime("%Y-%m-%d")
+
+
+def random_datetimes(count: int = 2000, seed: int = 3) -> list[datetime]:
+    """Create datetimes from 1900 to 2100 in assorted fixed-offset timezones."""
+    rng = random.Random(seed)
+    zones = [
+        timezone.utc,
+        timezone(timedelta(hours=-11)),
+        timezone(timedelta(hours=13, minutes=45)),
+    ]
+    start = datetime(1900, 1, 1, tzinfo=timezone.utc)
+    span = int((datetime(2100, 1, 1, tzinfo=timezone.utc) - start).total_seconds())
+    return [
+        (start + timedelta(seconds=rng.randrange(span))).astimezone(rng.choice(zones))
+        for _ in range(count)
+    ]
+
+
+class TestWallClock:
+    """Tests for wall_clock_us."""
+
+    def test_uses_own_timezone(self):
+        """Test that the local reading is kept, not the UTC instant."""
+        local = datetime(2024, 3, 1, 23, 30, tzinfo=timezone(timedelta(hours=-5)))
+        assert wall_clock_us(local) == wall_clock_us(datetime(2024, 3, 1, 23, 30))
+
+
+class TestCountBuckets:
+    """Tests for count_buckets."""
+
+    @pytest.mark.parametrize("granularity", ["hour", "day", "week", "month"])
+    def test_matches_strftime(self, backend, granularity):
+        """Test every granularity against strftime, across leap years and before 1970."""
+        moments = random_datetimes()
+        expected = Counter(strftime_key(when, granularity) for when in moments)
+
+        result = count_buckets([wall_clock_us(when) for when in moments], granularity)
+
+        assert result == expected
+        assert list(result) == sorted(result)
+
+    def test_month_boundaries(self, backend):
+        """Test the last and first instants of months, including February 29."""
+        moments = [
+            datetime(2024, 2, 29, 23, 59, 59, 999999),
+            datetime(2024, 3, 1),
+            datetime(1969, 12, 31, 23, 59),
+            datetime(2000, 2, 29, 12),
+        ]
+        assert count_buckets([wall_clock_us(m) for m in moments], "month") == {
+            "1969-12": 1,
+            "2000-02": 1,
+            "2024-02": 1,
+            "2024-03": 1,
+        }
+
+    def test_unknown_granularity_counts_days(self, backend):
+        """Test that an unknown granularity falls back to days."""
+        assert count_buckets([wall_clock_us(datetime(2024, 1, 1, 5))], "fortnight") == {
+            "2024-01-01": 1
+        }
+
+    def test_empty(self, backend):
+        """Test that no times give an empty timeline."""
+        assert count_buckets([], "week") == {}
+        assert count_buckets_by([], [], "week") == {}
+
+
+class TestCountBucketsBy:
+    """Tests for count_buckets_by."""
+
+    @pytest.mark.parametrize("granularity", ["hour", "week", "month"])
+    def test_matches_per_group_timelines(self, backend, granularity):
+        """Test that the split timeline equals a timeline per group."""
+        rng = random.Random(5)
+        moments = random_datetimes(500)
+        groups = [rng.randrange(4) for _ in moments]
+        wall_times = [wall_clock_us(when) for when in moments]
+
+        result = count_buckets_by(wall_times, groups, granularity)
+
+        assert list(result) == sorted(set(groups))
+        for code, counts in result.items():
+            assert counts == count_buckets(
+                [t for t, g in zip(wall_times, groups) if g == code], granularity
+            )
@@ -0,0 +1,45 @@
+"""Tests for timestamp parsing."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from giteagle.core.timestamps import parse_optional_timestamp, parse_timestamp
+
+
+class TestParseTimestamp:
+    """Tests for parse_timestamp."""
+
+    def test_z_suffix_is_utc(self):
+        """Test that GitHub's Z suffix gives a UTC-aware datetime."""
+        assert parse_timestamp("2024-01-15T12:30:00Z") == datetime(
+            2024, 1, 15, 12, 30, tzinfo=timezone.utc
+        )
+
+    def test_keeps_offsets(self):
+        """Test that an explicit offset is kept."""
+        parsed = parse_timestamp("2024-01-15T12:30:00+02:00")
+        assert parsed.utcoffset() == timedelta(hours=2)
+
+    def test_repeated_values_are_memoized(self):
+        """Test that the same string returns the same datetime instance."""
+        assert parse_timestamp("2024-02-01T00:00:00Z") is parse_timestamp("2024-02-01T00:00:00Z")
+
+    def test_rejects_malformed(self):
+        """Test that a malformed value raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_timestamp("yesterday")
+
+
+class TestParseOptionalTimestamp:
+    """Tests for parse_optional_timestamp."""
+
+    @pytest.mark.parametrize("value", [None, "", "not a date", 1700000000])
+    def test_missing_or_malformed_is_none(self, value):
+        """Test that absent, malformed and non-string values give None."""
+        assert parse_optional_timestamp(value) is None
+
+    def test_passes_datetimes_through(self):
+        """Test that an already parsed datetime is returned unchanged."""
+        when = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        assert parse_optional_timestamp(when) is when
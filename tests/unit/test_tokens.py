@@ -0,0 +1,68 @@
+"""Tests for the token pool."""
+
+from giteagle.integrations.tokens import TokenPool, mask_token
+
+NOW = 1_700_000_000.0
+
+
+class TestMaskToken:
+    """Tests for mask_token."""
+
+    def test_keeps_only_last_characters(self):
+        """Test that labels reveal no more than the last four characters."""
+        assert mask_token("ghp_abcdefghijklmnop") == "...mnop"
+        assert mask_token("short") == "..."
+        assert mask_token(None) == "anonymous"
+
+
+class TestTokenPool:
+    """Tests for the TokenPool class."""
+
+    def test_deduplicates_and_skips_empty_tokens(self):
+        """Test that repeated and missing tokens are pooled once."""
+        pool = TokenPool(["a" * 12, None, "a" * 12, "b" * 12])
+
+        assert [token.token for token in pool.tokens] == ["a" * 12, "b" * 12]
+        assert [token.usage.label for token in pool.tokens] == ["#1 (...aaaa)", "#2 (...bbbb)"]
+
+    def test_without_tokens_is_anonymous(self):
+        """Test that an empty pool sends unauthenticated requests."""
+        pool = TokenPool([])
+
+        assert len(pool) == 1
+        assert pool.select().headers == {}
+
+    def test_tries_unknown_tokens_first(self):
+        """Test that tokens with no known budget are used before known ones."""
+        pool = TokenPool(["t1", "t2"])
+        pool.tokens[0].rate_limits.update(5000, 4999, NOW + 3600)
+
+        assert pool.select(now=NOW).token == "t2"
+
+    def test_routes_to_most_remaining_budget(self):
+        """Test that the token with the most budget left is chosen."""
+        pool = TokenPool(["t1", "t2", "t3"])
+        for token, remaining in zip(pool.tokens, [100, 4000, 2500]):
+            token.rate_limits.update(5000, remaining, NOW + 3600)
+
+        assert pool.select(now=NOW).token == "t2"
+
+    def test_spent_pool_waits_for_earliest_reset(self):
+        """Test that with every token spent, the first to reset is chosen."""
+        pool = TokenPool(["t1", "t2"])
+        pool.tokens[0].rate_limits.update(5000, 0, NOW + 600)
+        pool.tokens[1].rate_limits.update(5000, 0, NOW + 60)
+
+        assert pool.select(now=NOW).token == "t2"
+
+    def test_budget_combines_tokens(self):
+        """Test that the pool budget sums tokens and resets with the first."""
+        pool = TokenPool(["t1", "t2"])
+        pool.tokens[0].rate_limits.update(5000, 10, NOW + 600)
+
+        assert pool.budget(now=NOW) is None
+
+        pool.tokens[1].rate_limits.update(5000, 20, NOW + 60)
+        budget = pool.budget(now=NOW)
+
+        assert (budget.limit, budget.remaining, budget.reset_at) == (10000, 30, NOW + 60)